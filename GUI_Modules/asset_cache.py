@@ -0,0 +1,74 @@
+import os
+import struct
+import tkinter as tk
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def cache_dir():
+    """Per-user directory of the pre-scaled images; TIMESLICE_CACHE overrides it."""
+    override = os.environ.get("TIMESLICE_CACHE")
+    if override:
+        return override
+    base = os.environ.get("LOCALAPPDATA") or os.environ.get("XDG_CACHE_HOME") or \
+        os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "timeslice")
+
+
+def image_size(path):
+    """(width, height) of an image, read from the PNG header without decoding the pixels."""
+    with open(path, "rb") as f:
+        header = f.read(24)
+    if header[:8] == PNG_SIGNATURE and header[12:16] == b"IHDR":
+        return struct.unpack(">II", header[16:24])
+    from PIL import Image
+    with Image.open(path) as img:
+        return img.size
+
+
+def fit_width(path, max_width):
+    """Size of the image scaled down to at most max_width wide, keeping its aspect ratio."""
+    width, height = image_size(path)
+    ratio = min(max_width, width) / width
+    return int(width * ratio), int(height * ratio)
+
+
+def load_scaled_image(path, size, master=None):
+    """
+    Load an image scaled to size as a PhotoImage, from the disk cache when possible.
+
+    The first call for a size decodes the image and resizes it with PIL
+    (LANCZOS), then saves the result as a PNG in cache_dir(). Later starts
+    let Tk read that file directly, so PIL is not even imported. The key
+    holds the size and the source's modification time, so an updated image
+    is scaled again.
+
+    Args:
+        path: Source image file
+        size: (width, height) to scale to
+        master: Widget owning the image, default the Tk root
+
+    Returns:
+        tk.PhotoImage or ImageTk.PhotoImage
+    """
+    width, height = size
+    stem = os.path.splitext(os.path.basename(path))[0]
+    cached = os.path.join(cache_dir(), f"{stem}-{os.stat(path).st_mtime_ns:x}-{width}x{height}.png")
+    try:
+        return tk.PhotoImage(master=master, file=cached)
+    except tk.TclError:
+        pass  # Not cached yet: scale it below
+
+    # Imported here so that starts with a warm cache never load PIL
+    from PIL import Image, ImageTk
+    with Image.open(path) as img:
+        scaled = img.resize((width, height), Image.LANCZOS)
+    try:
+        os.makedirs(os.path.dirname(cached), exist_ok=True)
+        # Written under a temporary name so a concurrent start never reads half a file
+        partial = f"{cached}.{os.getpid()}.tmp"
+        scaled.save(partial, "PNG")
+        os.replace(partial, cached)
+    except (OSError, ValueError) as e:
+        print(f"Could not cache {path}: {e}")
+    return ImageTk.PhotoImage(scaled, master=master)
@@ -0,0 +1,569 @@
+import math
+from bisect import bisect_left
+from operator import itemgetter
+
+import numpy as np
+
+
+class GanttChart:
+    """
+    Windowed Gantt chart renderer shared by the live and output pages.
+
+    Segments are kept in NumPy columns and only the rows and time range inside
+    the visible part of the scroll region are drawn. When zoomed out,
+    segments of one row and color that are less than a pixel apart are merged
+    into a single bar, so the number of canvas items depends on the window
+    size and not on the length of the history.
+
+    Rows are processes by default. For multi-core histories, whose entries
+    carry the core as a sixth field, load() with cores shows one lane per
+    core with the bars colored by process.
+
+    Labels and axis lines are tagged "ink" and the axis band "paper", so
+    set_colors() recolors a drawn chart with one itemconfigure per tag.
+    """
+    MARGIN = 70
+    TOP = 30
+    BAR_HEIGHT = 25
+    BAR_SPACING = 10
+    ROW_PITCH = BAR_HEIGHT + BAR_SPACING
+    AXIS_HEIGHT = 30       # Space below the axis line for ticks and its title
+    MERGE_GAP = 1          # Segments closer than this many pixels are drawn as one bar
+    LABEL_MIN_WIDTH = 30   # Duration labels are only drawn on bars wider than this
+    TICK_SPACING = 80      # Minimum pixels between two time axis ticks
+    ZOOM_STEP = 1.25
+    MAX_SCALE = 200        # Pixels per time unit at full zoom
+    BULK_SYNC = 256        # Larger history deltas are added column-wise and redrawn once
+    PROCESS_COLORS = [
+        "#4CAF50", "#2196F3", "#FFC107", "#9C27B0", "#F44336",
+        "#009688", "#795548", "#607D8B", "#E91E63", "#673AB7",
+        "#3F51B5", "#FF9800", "#CDDC39", "#8BC34A", "#00BCD4"
+    ]
+
+    def __init__(self, canvas, width, height, running_only=False):
+        """
+        Args:
+            canvas: Canvas to draw on; its scrollbars should call xview / yview
+            width, height: Canvas size to use until the canvas is mapped
+            running_only: Skip segments whose status is not "running"
+        """
+        self.canvas = canvas
+        self.default_size = (width, height)
+        self.running_only = running_only
+        self.ink = "black"        # Labels and axis lines
+        self.paper = "white"      # Canvas and axis band background
+
+        self.history = None       # History list the chart was loaded from
+        self.synced = 0           # Number of history entries already consumed
+        self.last_entry = None    # Last consumed entry, the only one that can still change
+        self.last_kept = False    # Whether last_entry is stored in the columns
+        self.cores = None         # Number of core lanes, None for one row per process
+        self.names = []           # Row index -> row label (process name or core)
+        self.process_names = []   # Color index -> process name
+        self.colors = {}          # Process name -> color index
+
+        # Segment columns, grown by doubling for live runs
+        self.count = 0
+        self.seg_row = np.empty(0, dtype=np.int64)
+        self.seg_start = np.empty(0, dtype=np.int64)
+        self.seg_end = np.empty(0, dtype=np.int64)
+        self.seg_running = np.empty(0, dtype=bool)
+        self.seg_color = np.empty(0, dtype=np.int64)
+        self.skipped = []         # History indices dropped by running_only
+
+        self.size = (width, height)
+        self.total_time = 1
+        self.scale = 1            # Pixels per time unit
+        self.zoomed = False       # False while the timeline is fitted to the canvas width
+        self.marker_time = None
+        self.axis_y = 0
+
+        # Last bar drawn per row in the current window:
+        # row -> [rect, text, x1, x2, segment count, first segment, last segment]
+        self.bars = {}
+        self.view = (0, 0, 0, 0)
+        self.render_pending = False
+
+        canvas.bind("<Configure>", self._on_resize)
+        canvas.bind("<MouseWheel>", lambda e: self._on_wheel(e, "y"))
+        canvas.bind("<Shift-MouseWheel>", lambda e: self._on_wheel(e, "x"))
+        canvas.bind("<Control-MouseWheel>", lambda e: self._on_wheel(e, "zoom"))
+        for button in (4, 5):  # X11 reports the wheel as buttons 4 and 5
+            canvas.bind(f"<Button-{button}>", lambda e: self._on_wheel(e, "y"))
+            canvas.bind(f"<Shift-Button-{button}>", lambda e: self._on_wheel(e, "x"))
+            canvas.bind(f"<Control-Button-{button}>", lambda e: self._on_wheel(e, "zoom"))
+
+    # --- Data ---
+
+    def load(self, history, names=(), total_time=1, cores=None):
+        """
+        Show a new history, fitting total_time into the canvas width.
+
+        Args:
+            history: List of (process_name, start_time, end_time, status, pid[, core]);
+                the chart keeps a reference and picks up appended entries in sync()
+            names: Process names in row (color) order; names only found in the history are added
+            total_time: Expected end of the timeline, the axis grows past it if needed
+            cores: Show one lane per core instead of one row per process
+        """
+        self.history = history
+        self.cores = cores
+        self.names = [f"CPU {core}" for core in range(cores)] if cores else []
+        self.process_names = []
+        self.colors = {}
+        for name in names:
+            if name not in self.colors:
+                self._add_row(name)
+        for name in dict.fromkeys(map(itemgetter(0), history)):
+            if name not in self.colors:
+                self._add_row(name)
+
+        rows, starts, ends, running, colors = self._columns(history)
+        if self.running_only:
+            rows, starts, ends, colors = rows[running], starts[running], ends[running], colors[running]
+            running = running[running]
+        self.count = len(rows)
+        self.seg_row, self.seg_start, self.seg_end, self.seg_running = rows, starts, ends, running
+        self.seg_color = colors
+        # History index -> segment index only differs when running_only drops entries
+        self.skipped = [] if not self.running_only else \
+            [i for i, entry in enumerate(history) if entry[3] != "running"]
+
+        self.synced = len(history)
+        self.last_entry = history[-1] if history else None
+        self.last_kept = bool(history) and not (self.running_only and history[-1][3] != "running")
+
+        self.total_time = max(1, total_time, int(ends.max()) if self.count else 0)
+        self.size = self._canvas_size()
+        self.scale = self._fit_scale()
+        self.zoomed = False
+
+        canvas = self.canvas
+        canvas.delete("all")
+        canvas.xview_moveto(0)
+        canvas.yview_moveto(0)
+        canvas.create_text(self.MARGIN // 2, 10, text="Core" if cores else "Process", font=("Arial", 10, "bold"),
+                           fill=self.ink, tags="ink")
+        canvas.create_line(0, 0, 0, 0, width=2, fill="red", dash=(4, 2),
+                           state="hidden", tags=("time_marker", "time_marker_line"))
+        canvas.create_text(0, 5, fill="red", font=("Arial", 8, "bold"),
+                           state="hidden", tags=("time_marker", "time_marker_text"))
+        self._update_scroll_region()
+        self.render()
+
+    def is_showing(self, history):
+        """Whether sync() can bring the chart up to date with history."""
+        return history is self.history and len(history) >= self.synced
+
+    def sync(self, changed=()):
+        """
+        Pick up changes to the loaded history in time proportional to the change.
+
+        Apart from appends, only open segments can be modified: the last
+        consumed entry, or with several cores the entries listed in changed.
+
+        Args:
+            changed: History indices of consumed entries whose end time changed
+        """
+        history = self.history
+        for i in changed:
+            if i < self.synced - 1:
+                self._update_segment(i, history[i])
+        if self.synced and history[self.synced - 1] != self.last_entry:
+            entry = history[self.synced - 1]
+            self.last_entry = entry
+            if self.last_kept:
+                self.seg_end[self.count - 1] = entry[2]
+                self._extend_time_axis(entry[2])
+                self._redraw_segment(self.count - 1)
+        if len(history) - self.synced > self.BULK_SYNC:
+            self._append_many(history[self.synced:])
+        else:
+            for i in range(self.synced, len(history)):
+                self._append(history[i], i)
+        self.synced = len(history)
+
+    def set_time_marker(self, time):
+        """Show the current-time marker at time, or hide it for None."""
+        self.marker_time = time
+        if time is not None:
+            self._extend_time_axis(time)
+        self._place_marker()
+
+    def add_row(self, name):
+        """Give a process a row (or a color in core lanes) before its first segment."""
+        if name in self.colors or self.history is None:
+            return self.colors.get(name)
+        color = self._add_row(name)
+        if self.cores is None:
+            self._update_scroll_region()
+            if self.view[2] <= self.TOP + color * self.ROW_PITCH < self.view[3]:
+                self.schedule_render()
+        return color
+
+    def _add_row(self, name):
+        color = len(self.process_names)
+        self.process_names.append(name)
+        self.colors[name] = color
+        if self.cores is None:
+            self.names.append(name)  # Process rows: row index == color index
+        return color
+
+    def _columns(self, entries):
+        """Row, start, end, running and color columns of history entries."""
+        count = len(entries)
+        colors = np.fromiter(map(self.colors.__getitem__, map(itemgetter(0), entries)), dtype=np.int64, count=count)
+        starts = np.fromiter(map(itemgetter(1), entries), dtype=np.int64, count=count)
+        ends = np.fromiter(map(itemgetter(2), entries), dtype=np.int64, count=count)
+        running = np.fromiter(map("running".__eq__, map(itemgetter(3), entries)), dtype=bool, count=count)
+        rows = colors if self.cores is None else \
+            np.fromiter(map(itemgetter(5), entries), dtype=np.int64, count=count)
+        return rows, starts, ends, running, colors
+
+    def _segment_index(self, history_index):
+        """Segment column index of a history entry (entries dropped by running_only are skipped)."""
+        return history_index - bisect_left(self.skipped, history_index) if self.skipped else history_index
+
+    def _update_segment(self, history_index, entry):
+        """Apply a new end time to an open segment that is not the last entry."""
+        if self.running_only and entry[3] != "running":
+            return
+        index = self._segment_index(history_index)
+        self.seg_end[index] = entry[2]
+        self._extend_time_axis(entry[2])
+        self._redraw_segment(index)
+
+    def _append(self, entry, history_index):
+        name, start, end, status = entry[:4]
+        self.last_entry = entry
+        self.last_kept = not (self.running_only and status != "running")
+        if not self.last_kept:
+            self.skipped.append(history_index)
+            return
+
+        color = self.colors.get(name)
+        if color is None:
+            color = self.add_row(name)
+        row = color if self.cores is None else entry[5]
+
+        if self.count == len(self.seg_row):
+            capacity = max(64, 2 * self.count)
+            self.seg_row = np.resize(self.seg_row, capacity)
+            self.seg_start = np.resize(self.seg_start, capacity)
+            self.seg_end = np.resize(self.seg_end, capacity)
+            self.seg_running = np.resize(self.seg_running, capacity)
+            self.seg_color = np.resize(self.seg_color, capacity)
+        i = self.count
+        self.seg_row[i], self.seg_start[i], self.seg_end[i] = row, start, end
+        self.seg_running[i] = status == "running"
+        self.seg_color[i] = color
+        self.count += 1
+
+        self._extend_time_axis(end)
+        self._draw_new_segment(i)
+
+    def _append_many(self, entries):
+        """Add a batch of entries column-wise and redraw the window once."""
+        self.last_entry = entries[-1]
+        self.last_kept = not (self.running_only and entries[-1][3] != "running")
+        for name in dict.fromkeys(map(itemgetter(0), entries)):
+            if name not in self.colors:
+                self._add_row(name)
+
+        rows, starts, ends, running, colors = self._columns(entries)
+        if self.running_only:
+            self.skipped.extend((self.synced + np.flatnonzero(~running)).tolist())
+            rows, starts, ends, colors = rows[running], starts[running], ends[running], colors[running]
+            running = running[running]
+
+        n = self.count
+        self.seg_row = np.concatenate((self.seg_row[:n], rows))
+        self.seg_start = np.concatenate((self.seg_start[:n], starts))
+        self.seg_end = np.concatenate((self.seg_end[:n], ends))
+        self.seg_running = np.concatenate((self.seg_running[:n], running))
+        self.seg_color = np.concatenate((self.seg_color[:n], colors))
+        self.count = len(self.seg_row)
+
+        if len(ends):
+            self._extend_time_axis(int(ends.max()))
+        self._update_scroll_region()
+        self.schedule_render()
+
+    # --- Geometry ---
+
+    def _canvas_size(self):
+        width, height = self.canvas.winfo_width(), self.canvas.winfo_height()
+        # An unmapped canvas reports a size of 1x1
+        if width <= 1 or height <= 1:
+            return self.default_size
+        return width, height
+
+    def _fit_scale(self):
+        return (self.size[0] - self.MARGIN - 20) / self.total_time
+
+    def _content_size(self):
+        width = max(self.size[0], self.MARGIN + self.total_time * self.scale + 50)
+        height = max(self.size[1], self.TOP + len(self.names) * self.ROW_PITCH + 50)
+        return width, height
+
+    def _update_scroll_region(self):
+        width, height = self._content_size()
+        self.canvas.configure(scrollregion=(0, 0, width, height))
+
+    def _extend_time_axis(self, time_needed):
+        """Grow the timeline so it covers time_needed, keeping the current scale."""
+        if time_needed <= self.total_time:
+            return
+        # Grow in steps so a slowly extending run does not resize every tick
+        self.total_time = max(time_needed, self.total_time + self.total_time // 4)
+        self._update_scroll_region()
+        self.schedule_render()
+
+    def _tick_interval(self):
+        """Smallest 1-2-5 step that keeps ticks TICK_SPACING pixels apart."""
+        raw = self.TICK_SPACING / self.scale
+        if raw <= 1:
+            return 1
+        magnitude = 10 ** math.floor(math.log10(raw))
+        for step in (1, 2, 5, 10):
+            if step * magnitude >= raw:
+                return int(step * magnitude)
+
+    # --- Rendering ---
+
+    def schedule_render(self):
+        """Redraw the window once the event queue is idle, coalescing repeated requests."""
+        if not self.render_pending:
+            self.render_pending = True
+            self.canvas.after_idle(self.render)
+
+    def render(self):
+        """Redraw everything inside the visible window of the scroll region."""
+        self.render_pending = False
+        if self.history is None:
+            return
+        canvas = self.canvas
+        canvas.delete("view")
+        self.bars = {}
+
+        x0, y0 = canvas.canvasx(0), canvas.canvasy(0)
+        x1, y1 = x0 + self.size[0], y0 + self.size[1]
+        self.view = (x0, x1, y0, y1)
+        # The axis sticks to the bottom of the window when the rows do not fit
+        self.axis_y = min(self._content_size()[1], y1) - self.AXIS_HEIGHT
+
+        row_lo = max(0, int((y0 - self.TOP) // self.ROW_PITCH))
+        row_hi = min(len(self.names), int((y1 - self.TOP) // self.ROW_PITCH) + 1)
+        for row in range(row_lo, row_hi):
+            canvas.create_text(
+                self.MARGIN - 5, self.TOP + row * self.ROW_PITCH + self.BAR_HEIGHT / 2,
+                text=self.names[row], anchor="e", font=("Arial", 10), fill=self.ink, tags=("view", "ink")
+            )
+
+        n = self.count
+        if n:
+            self._draw_bars(x0, x1, row_lo, row_hi)
+        self._draw_axis(x0, x1)
+        self._place_marker()
+
+    def _draw_bars(self, x0, x1, row_lo, row_hi):
+        """Draw the visible segments, merging neighbours that are less than MERGE_GAP apart."""
+        n = self.count
+        rows, starts, ends = self.seg_row[:n], self.seg_start[:n], self.seg_end[:n]
+        t0 = (x0 - self.MARGIN) / self.scale
+        t1 = (x1 - self.MARGIN) / self.scale
+        visible = np.flatnonzero((ends >= t0) & (starts <= t1) & (rows >= row_lo) & (rows < row_hi))
+        if not len(visible):
+            return
+
+        visible = visible[np.lexsort((starts[visible], rows[visible]))]
+        rows = rows[visible]
+        running = self.seg_running[:n][visible]
+        colors = self.seg_color[:n][visible]
+        left = self.MARGIN + starts[visible] * self.scale
+        right = self.MARGIN + ends[visible] * self.scale
+
+        # A bar starts at every row, color or status change and every visible gap
+        new_bar = np.ones(len(visible), dtype=bool)
+        new_bar[1:] = (rows[1:] != rows[:-1]) | (colors[1:] != colors[:-1]) | \
+                      (running[1:] != running[:-1]) | (left[1:] - right[:-1] >= self.MERGE_GAP)
+        first = np.flatnonzero(new_bar)
+        last = np.append(first[1:], len(visible)) - 1
+        bar_right = np.maximum.reduceat(right, first)
+
+        for row, x_left, x_right, count, first_index, last_index, is_running in zip(
+                rows[first].tolist(), left[first].tolist(), bar_right.tolist(), (last - first + 1).tolist(),
+                visible[first].tolist(), visible[last].tolist(), running[first].tolist()):
+            self.bars[row] = self._create_bar(row, x_left, x_right, count, first_index, last_index, is_running)
+
+    def _create_bar(self, row, x1, x2, count, first_index, last_index, is_running):
+        y = self.TOP + row * self.ROW_PITCH
+        color = int(self.seg_color[first_index])
+        # "running" gets color, "ready" is a lighter fill
+        fill_color = self.PROCESS_COLORS[color % len(self.PROCESS_COLORS)] if is_running else "#EEEEEE"
+        rect = self.canvas.create_rectangle(
+            x1, y, x2, y + self.BAR_HEIGHT, fill=fill_color, outline="black", tags="view"
+        )
+        bar = [rect, None, x1, x2, count, first_index, last_index]
+        self._label_bar(bar, y)
+        return bar
+
+    def _label_bar(self, bar, y):
+        """Show the duration on a single-segment bar when it is wide enough."""
+        rect, text, x1, x2, count, index, _ = bar
+        if count == 1 and (x2 - x1) > self.LABEL_MIN_WIDTH:
+            duration = int(self.seg_end[index] - self.seg_start[index])
+            label = f"{duration}s"
+            if self.cores:
+                # Core lanes mix processes, so the label names the process when it fits
+                name = f"{self.process_names[int(self.seg_color[index])]} {label}"
+                label = name if (x2 - x1) > 7 * len(name) else label
+            if text is None:
+                text = self.canvas.create_text(0, 0, font=("Arial", 9), fill="black", tags="view")
+            self.canvas.coords(text, (x1 + x2) / 2, y + self.BAR_HEIGHT / 2)
+            self.canvas.itemconfig(text, text=label)
+        elif text is not None:
+            self.canvas.delete(text)
+            text = None
+        bar[1] = text
+
+    def _draw_new_segment(self, index):
+        """Add a segment appended after the last render if it falls inside the window."""
+        x0, x1, y0, y1 = self.view
+        row = int(self.seg_row[index])
+        y = self.TOP + row * self.ROW_PITCH
+        left = self.MARGIN + int(self.seg_start[index]) * self.scale
+        right = self.MARGIN + int(self.seg_end[index]) * self.scale
+        if right < x0 or left > x1 or y + self.BAR_HEIGHT < y0 or y > y1:
+            return
+
+        is_running = bool(self.seg_running[index])
+        bar = self.bars.get(row)
+        if bar and left - bar[3] < self.MERGE_GAP and bool(self.seg_running[bar[6]]) == is_running \
+                and self.seg_color[bar[6]] == self.seg_color[index]:
+            bar[3] = max(bar[3], right)
+            bar[4] += 1
+            bar[6] = index
+            self.canvas.coords(bar[0], bar[2], y, bar[3], y + self.BAR_HEIGHT)
+            self._label_bar(bar, y)
+        else:
+            self.bars[row] = self._create_bar(row, left, right, 1, index, index, is_running)
+        # Keep the axis band and marker above bars drawn after them
+        self.canvas.tag_raise("axis")
+        self.canvas.tag_raise("time_marker")
+
+    def _redraw_segment(self, index):
+        """Reshape the bar of an open segment (the last one of its row) after its end time changed."""
+        row = int(self.seg_row[index])
+        bar = self.bars.get(row)
+        if bar is None:
+            # It may have moved into the window
+            self._draw_new_segment(index)
+            return
+        if bar[6] != index:
+            return  # Outside the window
+        y = self.TOP + row * self.ROW_PITCH
+        bar[3] = self.MARGIN + int(self.seg_end[index]) * self.scale
+        self.canvas.coords(bar[0], bar[2], y, bar[3], y + self.BAR_HEIGHT)
+        self._label_bar(bar, y)
+
+    def _draw_axis(self, x0, x1):
+        """Draw the time axis and the ticks that fall inside the window."""
+        canvas = self.canvas
+        y = self.axis_y
+        content_width = self._content_size()[0]
+        left = max(x0, self.MARGIN)
+        right = min(x1, content_width - 10)
+
+        # White band so bars scrolled under a pinned axis do not show through
+        canvas.create_rectangle(x0, y, x1, y + self.AXIS_HEIGHT, fill=self.paper, outline="",
+                                tags=("view", "axis", "paper"))
+        canvas.create_line(left, y, right, y, width=2, fill=self.ink, tags=("view", "axis", "ink"))
+        canvas.create_text((left + right) // 2, y + 20, text="Time (seconds)",
+                           font=("Arial", 10, "bold"), fill=self.ink, tags=("view", "axis", "ink"))
+
+        interval = self._tick_interval()
+        t0 = max(0, math.ceil((left - self.MARGIN) / self.scale / interval) * interval)
+        t1 = min(self.total_time, (right - self.MARGIN) / self.scale)
+        for t in range(t0, int(t1) + 1, interval):
+            x = self.MARGIN + t * self.scale
+            canvas.create_line(x, y, x, y + 5, width=2, fill=self.ink, tags=("view", "axis", "ink"))
+            canvas.create_text(x, y + 15, text=str(t), font=("Arial", 8), fill=self.ink,
+                               tags=("view", "axis", "ink"))
+
+    def _place_marker(self):
+        canvas = self.canvas
+        if self.marker_time is None:
+            canvas.itemconfig("time_marker", state="hidden")
+            return
+        x = self.MARGIN + self.marker_time * self.scale
+        canvas.coords("time_marker_line", x, self.view[2] + 10, x, self.axis_y - 10)
+        canvas.coords("time_marker_text", x, self.view[2] + 5)
+        canvas.itemconfig("time_marker_text", text=f"Current: {self.marker_time}s")
+        canvas.itemconfig("time_marker", state="normal")
+        canvas.tag_raise("time_marker")
+
+    def set_colors(self, ink, paper):
+        """Recolor the labels, axis and background in place, without redrawing."""
+        self.ink, self.paper = ink, paper
+        canvas = self.canvas
+        canvas.configure(bg=paper)
+        canvas.itemconfig("ink", fill=ink)
+        canvas.itemconfig("paper", fill=paper)
+
+    # --- Scrolling and zoom ---
+
+    def xview(self, *args):
+        """Horizontal scrollbar command."""
+        self.canvas.xview(*args)
+        self.schedule_render()
+
+    def yview(self, *args):
+        """Vertical scrollbar command."""
+        self.canvas.yview(*args)
+        self.schedule_render()
+
+    def zoom(self, factor, x=None):
+        """
+        Zoom the timeline by factor, keeping the time under window position x in place.
+
+        The chart never zooms out further than fitting the whole timeline.
+        """
+        fit = self._fit_scale()
+        scale = min(max(self.scale * factor, fit), max(self.MAX_SCALE, fit))
+        if scale == self.scale:
+            return
+        if x is None:
+            x = self.size[0] / 2
+        time_at_x = (self.canvas.canvasx(x) - self.MARGIN) / self.scale
+
+        self.scale = scale
+        self.zoomed = scale != fit
+        self._update_scroll_region()
+        content_width = self._content_size()[0]
+        self.canvas.xview_moveto(max(0, self.MARGIN + time_at_x * scale - x) / content_width)
+        self.schedule_render()
+
+    def _on_wheel(self, event, action):
+        if getattr(event, "num", None) == 4 or getattr(event, "delta", 0) > 0:
+            direction = -1
+        else:
+            direction = 1
+        if action == "zoom":
+            self.zoom(self.ZOOM_STEP if direction < 0 else 1 / self.ZOOM_STEP, event.x)
+            return
+        if action == "x":
+            self.canvas.xview_scroll(direction, "units")
+        else:
+            self.canvas.yview_scroll(direction, "units")
+        self.schedule_render()
+
+    def _on_resize(self, event):
+        size = (event.width, event.height)
+        if size == self.size or self.history is None:
+            return
+        self.size = size
+        if not self.zoomed:
+            self.scale = self._fit_scale()
+        self._update_scroll_region()
+        self.schedule_render()
@@ -1,10 +1,14 @@
 import tkinter as tk
 import customtkinter
 
+from GUI_Modules.theme import ThemeRegistry
+
 class HomeScreen(tk.Frame):
-    def __init__(self, parent, colors, show_scheduler_page, toggle_theme):
+    def __init__(self, parent, colors, show_scheduler_page, toggle_theme, theme=None):
         super().__init__(parent, bg=colors['background'])
         self.colors = colors
+        self.theme = theme or ThemeRegistry(colors)  # Recolors the widgets on theme changes
+        self.theme.register(self, bg='background')
         self.show_scheduler_page = show_scheduler_page  # Function to switch to the scheduler page
         self.toggle_theme = toggle_theme  # Function to toggle theme
         self.create_home_screen()
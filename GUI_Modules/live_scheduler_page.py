@@ -1,30 +1,51 @@
+import heapq
+import os
+from itertools import islice
+import queue
 import time
 import tkinter as tk
 from tkinter import ttk
 from tkinter import messagebox
 import threading
 
-from Schedulers.fcfs_scheduler import FCFSScheduler
-from Schedulers.priority_scheduler import PriorityScheduler
-from Schedulers.round_robin_scheduler import RoundRobinScheduler
-from Schedulers.sjf_scheduler import SJFScheduler
+from GUI_Modules.gantt_chart import GanttChart
+from GUI_Modules.theme import ThemeRegistry
+from Schedulers.instrumentation import Instrumentation
+from Schedulers.multicore import MultiCoreSimulation
+from Schedulers.process import Process
+from Schedulers.simulation import SchedulerSimulation
 
 
 class LiveSchedulerPage(tk.Frame):
+    FRAME_MS = 33       # UI refresh interval (~30 frames per second)
+    TICK_SECONDS = 0.5  # Wall time per simulated time unit at 1x
+    QUEUE_HEAD = 20     # Queued process names shown per queue, the rest are only counted
+    TURBO_CHUNK = 2048  # Scheduling events computed by Turbo between two checks for pause and reset
+    # Playback multipliers; Turbo (None) computes the rest of the run at once
+    PLAYBACK_SPEEDS = {
+        "0.5x": 0.5, "1x": 1, "2x": 2, "5x": 5, "10x": 10, "50x": 50, "200x": 200, "Turbo": None
+    }
+
     def __init__(self, parent, colors, width, height, navigate_home,
                  process_list=None, scheduler_type="FCFS", flag_live_scheduler=0,
-                 navigate_to_output=None, navigate_to_scheduler=None):
+                 navigate_to_output=None, navigate_to_scheduler=None, cores=1, scheduler_options=None,
+                 switch_cost=0, theme=None):
         super().__init__(parent, bg=colors['background'])
 
         # Store parameters
         self.flag_live_scheduler=flag_live_scheduler 
         self.colors = colors
+        self.theme = theme or ThemeRegistry(colors)  # Recolors the widgets on theme changes
+        self.theme.register(self, bg='background')
         self.navigate_home = navigate_home
         self.navigate_to_output = navigate_to_output
         self.navigate_to_scheduler = navigate_to_scheduler
         self.width = width
         self.height = height
         self.scheduler_type = scheduler_type
+        self.cores = cores  # CPU cores sharing the ready queue
+        self.scheduler_options = scheduler_options  # Extra scheduler settings (MLFQ quanta and boost)
+        self.switch_cost = switch_cost  # CPU time of every context switch
 
         # Safely copy the list to restore when reset and save as original_process_list
         self.original_process_list = process_list.copy() if isinstance(process_list, list) else []
@@ -34,14 +55,34 @@ class LiveSchedulerPage(tk.Frame):
         self.scheduling_active = False
         self.current_time = 0
         self.scheduler_thread = None
+        self.simulation = None
+        # Producer/consumer pipeline: the scheduler thread never touches Tk widgets,
+        # it queues state snapshots that a main-thread after() pump applies per frame
+        self.stop_event = threading.Event()
+        self.ui_queue = queue.Queue()
+        self.pump_id = None
+        self.history_sent = 0  # History entries already published by the scheduler thread
+        self.open_sent = []    # Open segments at the last publish; their end times may still change
+        self.run_finished = False  # Whether the latest snapshot shown was of a finished run
+        self.injected_processes = queue.Queue()  # Processes added mid-run, drained by the scheduler thread
+        # Playback settings, mirrored from the controls so the scheduler thread never reads Tk variables
+        self.playback_speed = 1
+        self.skip_idle_gaps = False
+        # Opt-in profiling: TIMESLICE_PROFILE names a JSON file that receives the
+        # scheduler counters and render time of each finished run
+        self.profile_path = os.environ.get("TIMESLICE_PROFILE")
+        self.instrumentation = None
         self.current_process = None
-        self.ready_queue = []
+        self.ready_queue = []     # First QUEUE_HEAD names of the ready queue
         self.waiting_queue = []
+        self.ready_count = 0      # Full queue lengths
+        self.waiting_count = 0
         self.completed_processes = []
         self.process_execution_history = []
 
         # Create a header
         header = tk.Frame(self, bg=colors['button_bg'], height=60)
+        self.theme.register(header, bg='button_bg')
         header.pack(fill=tk.X, side=tk.TOP)
 
         back_button = tk.Button(
@@ -49,20 +90,24 @@ class LiveSchedulerPage(tk.Frame):
             bg=colors['button_bg'], fg=colors['button_fg'],
             bd=0, font=("Arial", 12, "bold")
         )
+        self.theme.register(back_button, bg='button_bg', fg='button_fg')
         back_button.pack(side=tk.LEFT, padx=15, pady=10)
 
         title_label = tk.Label(
             header, text=f"Live {self.scheduler_type} Scheduler", font=("Arial", 16, "bold"),
             bg=colors['button_bg'], fg=colors['button_fg']
         )
+        self.theme.register(title_label, bg='button_bg', fg='button_fg')
         title_label.pack(side=tk.LEFT, padx=20, pady=10)
 
         # Main content - split into two panels
         main_frame = tk.Frame(self, bg=colors['background'])
+        self.theme.register(main_frame, bg='background')
         main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
 
         # Left Panel - Process Control
         left_frame = tk.Frame(main_frame, bg=colors['background'], width=width // 2 - 30)
+        self.theme.register(left_frame, bg='background')
         left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 10))
         left_frame.pack_propagate(False) # Prevent resizing to fit content
 
@@ -71,30 +116,35 @@ class LiveSchedulerPage(tk.Frame):
             left_frame, text="Add Process", font=("Arial", 12),
             bg=colors['background'], fg=colors['text']
         )
+        self.theme.register(process_frame, bg='background', fg='text')
         process_frame.pack(fill=tk.X, pady=10, padx=5)
 
         # Common fields for all scheduler types
-        tk.Label(process_frame, text="Process Name:",
-                 bg=colors['background'], fg=colors['text']
-                 ).grid(row=0, column=0, sticky='w', padx=5, pady=5)
+        label = tk.Label(process_frame, text="Process Name:",
+                         bg=colors['background'], fg=colors['text'])
+        self.theme.register(label, bg='background', fg='text')
+        label.grid(row=0, column=0, sticky='w', padx=5, pady=5)
 
         self.process_name = tk.Entry(process_frame, width=20, font=("Arial", 12))
         self.process_name.grid(row=0, column=1, padx=5, pady=5)
 
         row = 1
-        tk.Label(process_frame, text="Burst Time (sec):",
-                 bg=colors['background'], fg=colors['text']
-                 ).grid(row=row, column=0, sticky='w', padx=5, pady=5)
+        label = tk.Label(process_frame, text="Burst Time (sec):",
+                         bg=colors['background'], fg=colors['text'])
+        self.theme.register(label, bg='background', fg='text')
+        label.grid(row=row, column=0, sticky='w', padx=5, pady=5)
 
         self.process_duration = tk.Entry(process_frame, width=10, font=("Arial", 12))
         self.process_duration.grid(row=row, column=1, padx=5, pady=5, sticky='w')
         row += 1
 
         self.arrival_frame = tk.Frame(process_frame, bg=colors['background'])
+        self.theme.register(self.arrival_frame, bg='background')
         self.arrival_frame.grid(row=row, column=0, columnspan=2, sticky='w', padx=5, pady=5)
-        tk.Label(self.arrival_frame, text="Arrival Time (sec):",
-                 bg=colors['background'], fg=colors['text']
-                 ).pack(side=tk.LEFT)
+        label = tk.Label(self.arrival_frame, text="Arrival Time (sec):",
+                         bg=colors['background'], fg=colors['text'])
+        self.theme.register(label, bg='background', fg='text')
+        label.pack(side=tk.LEFT)
 
         self.arrival_time = tk.Entry(self.arrival_frame, width=10, font=("Arial", 12))
         self.arrival_time.pack(side=tk.LEFT, padx=5)
@@ -104,10 +154,12 @@ class LiveSchedulerPage(tk.Frame):
         # Additional fields based on scheduler type
         if self.scheduler_type == "Priority":
             self.priority_frame = tk.Frame(process_frame, bg=colors['background'])
+            self.theme.register(self.priority_frame, bg='background')
             self.priority_frame.grid(row=row, column=0, columnspan=2, sticky='w', padx=5, pady=5)
-            tk.Label(self.priority_frame, text="Priority:",
-                     bg=colors['background'], fg=colors['text']
-                     ).pack(side=tk.LEFT)
+            label = tk.Label(self.priority_frame, text="Priority:",
+                             bg=colors['background'], fg=colors['text'])
+            self.theme.register(label, bg='background', fg='text')
+            label.pack(side=tk.LEFT)
 
             self.priority_value = tk.Entry(self.priority_frame, width=10, font=("Arial", 12))
             self.priority_value.pack(side=tk.LEFT, padx=5)
@@ -118,30 +170,34 @@ class LiveSchedulerPage(tk.Frame):
             pass
 
         if self.scheduler_type in ["SJF", "Priority"]:
-            self.preemptive_var = tk.BooleanVar(value=self.process_list[0][3] if self.process_list else False)
+            self.preemptive_var = tk.BooleanVar(value=self.process_list[0].preemptive if self.process_list else False)
 
         self.add_button = tk.Button(
             process_frame, text="Add Process",
             bg=colors['button_bg'], fg=colors['button_fg'],
             command=self.add_process
         )
+        self.theme.register(self.add_button, bg='button_bg', fg='button_fg')
         self.add_button.grid(row=row, column=0, columnspan=2, pady=10)
         
         # Disable the add process button if live scheduling is not enabled
         if not self.flag_live_scheduler:
             self.add_button.config(state=tk.DISABLED)
             # Add a label to explain why the button is disabled
-            tk.Label(
+            label = tk.Label(
                 process_frame, 
                 text="Live scheduling disabled. Cannot add new processes.",
                 bg=colors['background'], fg="red", font=("Arial", 8)
-            ).grid(row=row+1, column=0, columnspan=2, pady=(0, 5))
+            )
+            self.theme.register(label, bg='background')
+            label.grid(row=row+1, column=0, columnspan=2, pady=(0, 5))
 
         # Process List
         list_frame = tk.LabelFrame(
             left_frame, text="Process Queue", font=("Arial", 12),
             bg=colors['background'], fg=colors['text']
         )
+        self.theme.register(list_frame, bg='background', fg='text')
         list_frame.pack(fill=tk.BOTH, expand=True, pady=10, padx=5)
 
         list_scroll = tk.Scrollbar(list_frame)
@@ -152,6 +208,8 @@ class LiveSchedulerPage(tk.Frame):
             bg=colors['background'], fg=colors['text'], font=("Arial", 12),
             selectbackground=colors['button_bg'], selectforeground=colors['button_fg']
         )
+        self.theme.register(self.process_listbox, bg='background', fg='text', selectbackground='button_bg',
+                            selectforeground='button_fg')
         self.process_listbox.pack(fill=tk.BOTH, expand=True)
         list_scroll.config(command=self.process_listbox.yview)
 
@@ -160,6 +218,7 @@ class LiveSchedulerPage(tk.Frame):
             bg=colors['sign_out_bg'], fg=colors['sign_out_fg'],
             command=self.delete_selected_process
         )
+        self.theme.register(delete_button, bg='sign_out_bg', fg='sign_out_fg')
         delete_button.pack(pady=5)
         
         # Also disable delete button if live scheduling is not enabled
@@ -168,6 +227,7 @@ class LiveSchedulerPage(tk.Frame):
 
         # Right Panel - Visualization
         right_frame = tk.Frame(main_frame, bg=colors['background'], width=width // 2 - 30)
+        self.theme.register(right_frame, bg='background')
         right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=(10, 0))
         right_frame.pack_propagate(False)
 
@@ -175,30 +235,37 @@ class LiveSchedulerPage(tk.Frame):
             right_frame, text="Scheduler Status", font=("Arial", 12),
             bg=colors['background'], fg=colors['text']
         )
+        self.theme.register(status_frame, bg='background', fg='text')
         status_frame.pack(fill=tk.X, pady=10, padx=5)
 
         time_frame = tk.Frame(status_frame, bg=colors['background'])
+        self.theme.register(time_frame, bg='background')
         time_frame.pack(fill=tk.X, pady=5)
-        tk.Label(time_frame, text="Time Elapsed:",
-                 bg=colors['background'], fg=colors['text'], font=("Arial", 12)
-                 ).pack(side=tk.LEFT, padx=5)
+        label = tk.Label(time_frame, text="Time Elapsed:",
+                         bg=colors['background'], fg=colors['text'], font=("Arial", 12))
+        self.theme.register(label, bg='background', fg='text')
+        label.pack(side=tk.LEFT, padx=5)
 
         self.time_label = tk.Label(
             time_frame, text="0s", bg=colors['background'], fg=colors['text'],
             font=("Arial", 12, "bold")
         )
+        self.theme.register(self.time_label, bg='background', fg='text')
         self.time_label.pack(side=tk.LEFT)
 
         current_frame = tk.Frame(status_frame, bg=colors['background'])
+        self.theme.register(current_frame, bg='background')
         current_frame.pack(fill=tk.X, pady=5)
-        tk.Label(current_frame, text="Current Process:",
-                 bg=colors['background'], fg=colors['text'], font=("Arial", 12)
-                 ).pack(side=tk.LEFT, padx=5)
+        label = tk.Label(current_frame, text="Current Process:",
+                         bg=colors['background'], fg=colors['text'], font=("Arial", 12))
+        self.theme.register(label, bg='background', fg='text')
+        label.pack(side=tk.LEFT, padx=5)
 
         self.current_process_label = tk.Label(
             current_frame, text="None", bg=colors['background'], fg=colors['text'],
             font=("Arial", 12, "bold")
         )
+        self.theme.register(self.current_process_label, bg='background', fg='text')
         self.current_process_label.pack(side=tk.LEFT)
 
         self.progress_var = tk.DoubleVar()
@@ -210,38 +277,47 @@ class LiveSchedulerPage(tk.Frame):
 
         # Ready/Waiting queue display
         queue_frame = tk.Frame(status_frame, bg=colors['background'])
+        self.theme.register(queue_frame, bg='background')
         queue_frame.pack(fill=tk.X, pady=5)
 
         ready_frame = tk.Frame(queue_frame, bg=colors['background'])
+        self.theme.register(ready_frame, bg='background')
         ready_frame.pack(fill=tk.X, pady=5)
-        tk.Label(ready_frame, text="Ready Queue:",
-                 bg=colors['background'], fg=colors['text'], font=("Arial", 12)
-                 ).pack(side=tk.LEFT, padx=5)
+        label = tk.Label(ready_frame, text="Ready Queue:",
+                         bg=colors['background'], fg=colors['text'], font=("Arial", 12))
+        self.theme.register(label, bg='background', fg='text')
+        label.pack(side=tk.LEFT, padx=5)
         self.ready_queue_label = tk.Label(
             ready_frame, text="Empty", bg=colors['background'],
             fg=colors['text'], font=("Arial", 12)
         )
+        self.theme.register(self.ready_queue_label, bg='background', fg='text')
         self.ready_queue_label.pack(side=tk.LEFT)
 
         waiting_frame = tk.Frame(queue_frame, bg=colors['background'])
+        self.theme.register(waiting_frame, bg='background')
         waiting_frame.pack(fill=tk.X, pady=5)
-        tk.Label(waiting_frame, text="Waiting Queue:",
-                 bg=colors['background'], fg=colors['text'], font=("Arial", 12)
-                 ).pack(side=tk.LEFT, padx=5)
+        label = tk.Label(waiting_frame, text="Waiting Queue:",
+                         bg=colors['background'], fg=colors['text'], font=("Arial", 12))
+        self.theme.register(label, bg='background', fg='text')
+        label.pack(side=tk.LEFT, padx=5)
         self.waiting_queue_label = tk.Label(
             waiting_frame, text="Empty", bg=colors['background'],
             fg=colors['text'], font=("Arial", 12)
         )
+        self.theme.register(self.waiting_queue_label, bg='background', fg='text')
         self.waiting_queue_label.pack(side=tk.LEFT)
 
         gantt_frame = tk.LabelFrame(
             right_frame, text="Gantt Chart", font=("Arial", 12),
             bg=colors['background'], fg=colors['text']
         )
+        self.theme.register(gantt_frame, bg='background', fg='text')
         gantt_frame.pack(fill=tk.BOTH, expand=True, pady=10, padx=5)
 
         # Create a container for the Gantt chart with scrollbars
         gantt_container = tk.Frame(gantt_frame, bg=colors['background'])
+        self.theme.register(gantt_container, bg='background')
         gantt_container.pack(fill=tk.BOTH, expand=True)
         
         # Add horizontal and vertical scrollbars for the Gantt chart
@@ -260,12 +336,17 @@ class LiveSchedulerPage(tk.Frame):
             yscrollcommand=gantt_v_scroll.set
         )
         self.canvas.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+
+        # Windowed renderer: only the visible part of the chart is drawn
+        self.gantt = GanttChart(self.canvas, width // 2 - 60, 200)
+        self.theme.subscribe(self.canvas, self.update_chart_colors)
         
-        # Configure the scrollbars to work with the canvas
-        gantt_h_scroll.config(command=self.canvas.xview)
-        gantt_v_scroll.config(command=self.canvas.yview)
+        # Configure the scrollbars to work with the chart
+        gantt_h_scroll.config(command=self.gantt.xview)
+        gantt_v_scroll.config(command=self.gantt.yview)
 
         control_frame = tk.Frame(self, bg=colors['background'])
+        self.theme.register(control_frame, bg='background')
         control_frame.pack(fill=tk.X, pady=10, padx=20)
 
         self.play_button = tk.Button(
@@ -274,6 +355,7 @@ class LiveSchedulerPage(tk.Frame):
             font=("Arial", 12, "bold"), width=15,
             command=self.toggle_scheduling
         )
+        self.theme.register(self.play_button, bg='button_bg', fg='button_fg')
         self.play_button.pack(side=tk.LEFT, padx=10)
 
         reset_button = tk.Button(
@@ -281,13 +363,39 @@ class LiveSchedulerPage(tk.Frame):
             fg=colors['sign_out_fg'], font=("Arial", 12),
             width=10, command=self.reset_scheduler
         )
+        self.theme.register(reset_button, bg='sign_out_bg', fg='sign_out_fg')
         reset_button.pack(side=tk.LEFT, padx=10)
 
+        label = tk.Label(control_frame, text="Speed:",
+                         bg=colors['background'], fg=colors['text'], font=("Arial", 12))
+        self.theme.register(label, bg='background', fg='text')
+        label.pack(side=tk.LEFT, padx=(20, 5))
+
+        self.speed_var = tk.StringVar(value="1x")
+        speed_menu = ttk.Combobox(
+            control_frame, textvariable=self.speed_var, values=list(self.PLAYBACK_SPEEDS),
+            state="readonly", width=7, font=("Arial", 12)
+        )
+        speed_menu.pack(side=tk.LEFT)
+        speed_menu.bind("<<ComboboxSelected>>", self.change_playback_speed)
+
+        self.skip_idle_var = tk.BooleanVar(value=False)
+        checkbox = tk.Checkbutton(
+            control_frame, text="Skip idle gaps", variable=self.skip_idle_var,
+            command=self.change_playback_speed, font=("Arial", 12),
+            bg=colors['background'], fg=colors['text'],
+            activebackground=colors['background'], selectcolor=colors['background']
+        )
+        self.theme.register(checkbox, bg='background', fg='text', activebackground='background',
+                            selectcolor='background')
+        checkbox.pack(side=tk.LEFT, padx=10)
+
         self.output_button = tk.Button(
             control_frame, text="Go to Output", bg=colors['button_bg'],
             fg=colors['button_fg'], font=("Arial", 12, "bold"),
             width=15, state=tk.DISABLED, command=self.go_to_output
         )
+        self.theme.register(self.output_button, bg='button_bg', fg='button_fg')
         self.output_button.pack(side=tk.RIGHT, padx=10)
 
         self.populate_from_passed_processes(self.process_list)
@@ -295,41 +403,43 @@ class LiveSchedulerPage(tk.Frame):
     def populate_from_passed_processes(self, process_list):
         self.process_list = process_list.copy() if isinstance(process_list, list) else []
         for process in self.process_list:
-            if self.scheduler_type == "FCFS":
-                name, burst, arrival = process
+            name, burst, arrival = process.name, process.burst_time, process.arrival_time
+            if self.scheduler_type in ["FCFS", "MLFQ"]:
                 display_text = f"{name} (Burst: {burst}s, Arrival: {arrival}s)"
             elif self.scheduler_type == "SJF":
-                name, burst, arrival, preemptive = process
-                display_text = f"{name} (Burst: {burst}s, Arrival: {arrival}s, {'Preemptive' if preemptive else 'Non-Preemptive'})"
+                display_text = f"{name} (Burst: {burst}s, Arrival: {arrival}s, {'Preemptive' if process.preemptive else 'Non-Preemptive'})"
             elif self.scheduler_type == "Priority":
-                name, burst, arrival, priority, preemptive = process
-                display_text = f"{name} (Burst: {burst}s, Arrival: {arrival}s, Priority: {priority}, {'Preemptive' if preemptive else 'Non-Preemptive'})"
+                display_text = f"{name} (Burst: {burst}s, Arrival: {arrival}s, Priority: {process.priority}, {'Preemptive' if process.preemptive else 'Non-Preemptive'})"
             elif self.scheduler_type == "Round Robin":
-                name, burst, arrival, quantum = process
-                display_text = f"{name} (Burst: {burst}s, Arrival: {arrival}s, Quantum: {quantum}s)"
+                display_text = f"{name} (Burst: {burst}s, Arrival: {arrival}s, Quantum: {process.time_quantum}s)"
             else:
                 display_text = str(process)
 
             self.process_listbox.insert(tk.END, display_text)
 
-        self.update_gantt_chart()
+        self.update_gantt_chart(relayout=True)
 
         # Progressbar style
         self.style = ttk.Style()
 
     def update_queue_labels(self):
         """Refresh the Ready Queue and Waiting Queue label text."""
-        if self.ready_queue:
-            ready_text = ", ".join(proc[0] for proc in self.ready_queue)
-        else:
-            ready_text = "Empty"
-        if self.waiting_queue:
-            waiting_text = ", ".join(proc[0] for proc in self.waiting_queue)
-        else:
-            waiting_text = "Empty"
-
-        self.ready_queue_label.config(text=ready_text)
-        self.waiting_queue_label.config(text=waiting_text)
+        self.ready_queue_label.config(text=self.format_queue(self.ready_queue, self.ready_count))
+        self.waiting_queue_label.config(text=self.format_queue(self.waiting_queue, self.waiting_count))
+
+    @staticmethod
+    def format_queue(names, count):
+        """Label text for the first names of a queue holding count processes."""
+        if not count:
+            return "Empty"
+        text = ", ".join(names)
+        if count > len(names):
+            text += f" … (+{count - len(names)} more)"
+        return text
+
+    def queue_head(self, queue):
+        """(length, first QUEUE_HEAD names) of a queue, without copying the whole queue."""
+        return len(queue), [proc.name for proc in islice(queue, self.QUEUE_HEAD)]
 
     def delete_selected_process(self):
         selected_index = self.process_listbox.curselection()
@@ -339,13 +449,20 @@ class LiveSchedulerPage(tk.Frame):
         if 0 <= index < len(self.process_list):
             self.process_list.pop(index)
             self.process_listbox.delete(index)
-            self.update_gantt_chart()
+            self.update_gantt_chart(relayout=True)
 
     def add_process(self):
         # Validate process name
         name = self.process_name.get().strip()
+        taken = {process.name for process in self.process_list}
         if not name:
-            name = f"Process {len(self.process_list) + 1}"
+            number = len(self.process_list) + 1
+            while f"Process {number}" in taken:
+                number += 1
+            name = f"Process {number}"
+        elif name in taken:
+            messagebox.showerror("Error", f"A process named '{name}' already exists.")
+            return
         
         # Validate burst time - must be positive integer
         duration_text = self.process_duration.get().strip()
@@ -361,8 +478,11 @@ class LiveSchedulerPage(tk.Frame):
             messagebox.showerror("Invalid Input", str(e))
             return
 
+        # A started run (even if paused) takes new processes as arrivals at the current time
+        run_in_progress = self.simulation is not None and not self.simulation.finished
+
         # Set arrival time based on current state
-        if self.scheduling_active:
+        if run_in_progress:
             arrival_time = self.current_time
         else:
             try:
@@ -378,15 +498,15 @@ class LiveSchedulerPage(tk.Frame):
                 messagebox.showerror("Invalid Input", str(e))
                 return
 
-        # Create process tuple based on scheduler type
+        # Create process record based on scheduler type
         if self.scheduler_type == "FCFS":
-            process = (name, duration, arrival_time)
+            process = Process(name, duration, arrival_time)
         elif self.scheduler_type == "SJF":
             # Use the preemptive value from existing processes for consistency
             preemptive = False
-            if self.process_list and len(self.process_list[0]) > 3:
-                preemptive = self.process_list[0][3]
-            process = (name, duration, arrival_time, preemptive)
+            if self.process_list:
+                preemptive = self.process_list[0].preemptive
+            process = Process(name, duration, arrival_time, preemptive=preemptive)
         elif self.scheduler_type == "Priority":
             try:
                 priority_text = self.priority_value.get().strip()
@@ -400,53 +520,48 @@ class LiveSchedulerPage(tk.Frame):
                 return
             
             preemptive = False
-            if self.process_list and len(self.process_list[0]) > 4:
-                preemptive = self.process_list[0][4]
-            process = (name, duration, arrival_time, priority, preemptive)
+            if self.process_list:
+                preemptive = self.process_list[0].preemptive
+            process = Process(name, duration, arrival_time, priority=priority, preemptive=preemptive)
         elif self.scheduler_type == "Round Robin":
             default_quantum = 2  # Default value
             quantum_to_use = default_quantum
             if self.original_process_list:
                 try:
-                    # Index 3 is the quantum for RR
-                    if len(self.original_process_list[0]) > 3:
-                        original_quantum = int(self.original_process_list[0][3])
+                    if self.original_process_list[0].time_quantum is not None:
+                        original_quantum = int(self.original_process_list[0].time_quantum)
                         # Validate fetched quantum is positive
                         if original_quantum > 0:
                             quantum_to_use = original_quantum
                         else:
                             print(f"Warning: Original quantum ({original_quantum}) is not positive. Using default {default_quantum}.")
                     else:
-                        print(f"Warning: Original process tuple for RR doesn't have quantum info. Using default {default_quantum}.")
-                except (IndexError, ValueError, TypeError) as e:
+                        print(f"Warning: Original RR process doesn't have quantum info. Using default {default_quantum}.")
+                except (ValueError, TypeError) as e:
                     print(f"Error retrieving original quantum: {e}. Using default {default_quantum}.")
 
-            # Create the process tuple with the determined quantum
-            process = (name, duration, arrival_time, quantum_to_use)
+            # Create the process record with the determined quantum
+            process = Process(name, duration, arrival_time, time_quantum=quantum_to_use)
         else:
-            process = (name, duration, arrival_time)
+            process = Process(name, duration, arrival_time)
 
         # Add to process_list
         self.process_list.append(process)
-        
-        # Update process_details dictionary so progress bar works for the new process
-        if hasattr(self, 'process_details'):
-            self.process_details[name] = {"burst": duration, "arrival": arrival_time}
 
         # Format the display in the listbox differently based on scheduler type
-        if self.scheduler_type == "FCFS":
+        if self.scheduler_type in ["FCFS", "MLFQ"]:
             display_text = f"{name} (Burst: {duration}s, Arrival: {arrival_time}s)"
         elif self.scheduler_type == "SJF":
-            preemptive = process[3]  # Use the value from the process tuple
+            preemptive = process.preemptive
             preemptive_text = "Preemptive" if preemptive else "Non-Preemptive"
             display_text = f"{name} (Burst: {duration}s, Arrival: {arrival_time}s, {preemptive_text})"
         elif self.scheduler_type == "Priority":
-            priority = process[3]  # Use the value from the process tuple
-            preemptive = process[4]  # Use the value from the process tuple
+            priority = process.priority
+            preemptive = process.preemptive
             preemptive_text = "Preemptive" if preemptive else "Non-Preemptive"
             display_text = f"{name} (Burst: {duration}s, Arrival: {arrival_time}s, Priority: {priority}, {preemptive_text})"
         elif self.scheduler_type == "Round Robin":
-            quantum = process[3]  # Use the value from the process tuple
+            quantum = process.time_quantum
             display_text = f"{name} (Burst: {duration}s, Arrival: {arrival_time}s, Quantum: {quantum}s)"
         else:
             display_text = f"{name} (Burst: {duration}s, Arrival: {arrival_time}s)"
@@ -457,168 +572,111 @@ class LiveSchedulerPage(tk.Frame):
         self.process_name.delete(0, tk.END)
         self.process_duration.delete(0, tk.END)
         self.arrival_time.delete(0, tk.END)
-        self.arrival_time.insert(0, str(self.current_time if self.scheduling_active else 0))
+        self.arrival_time.insert(0, str(self.current_time if run_in_progress else 0))
 
         # Clear additional fields based on scheduler type
         if self.scheduler_type == "Priority" and hasattr(self, 'priority_value'):
             self.priority_value.delete(0, tk.END)
             self.priority_value.insert(0, "0")
 
-        self.update_gantt_chart()
-
-        if self.scheduling_active:
-            self.restart_scheduler()
+        if run_in_progress:
+            # The scheduler thread injects it into the live queues before its next tick,
+            # the run continues without a restart
+            self.injected_processes.put(process)
+            self.gantt.add_row(name)
+        else:
+            self.update_gantt_chart(relayout=True)
 
-    def restart_scheduler(self):
-        """Safely restart the scheduler after adding a new process during runtime."""
-        self.restarting = True
-        
-        # Set flag to stop the current scheduler thread
-        self.scheduling_active = False
-        
-        # Wait for scheduler thread to terminate safely
+    def start_scheduler_thread(self):
+        """Start (or resume) the simulation on a worker thread and the UI pump on the main thread."""
+        # A paused thread may still be publishing its last snapshot
         if self.scheduler_thread and self.scheduler_thread.is_alive():
-            try:
-                self.scheduler_thread.join(0.5)  # Timeout for safe termination
-            except Exception as e:
-                print(f"Thread join error: {e}")
-                # Continue anyway - we'll create a new thread as the current one is not responding
-                
-        # Keep current time (for simulation continuity and correct arrival time handling)
-        # Keep execution history (for visualization and metrics calculation)
-        # Reset other states that might be inconsistent (to rebuild queues properly with new processes)
-        if hasattr(self, 'ready_queue'):
-            self.ready_queue = []
-        if hasattr(self, 'waiting_queue'):
-            self.waiting_queue = []
-            
-        # Set flags to start a new scheduler
-        self.restarting = False
-        self.scheduling_active = True
-        
-        # Start a new scheduler thread
-        self.scheduler_thread = threading.Thread(target=self.run_scheduler)
+            self.scheduler_thread.join(0.5)
+
+        if self.simulation is None or self.simulation.finished:
+            self.current_time = 0
+            if self.cores > 1:
+                self.simulation = MultiCoreSimulation(self.process_list, self.scheduler_type, self.cores,
+                                                      switch_cost=self.switch_cost)
+            else:
+                self.simulation = SchedulerSimulation(self.process_list, self.scheduler_type, self.scheduler_options,
+                                                      self.switch_cost)
+            self.instrumentation = Instrumentation() if self.profile_path else None
+            if self.instrumentation is not None:
+                self.instrumentation.attach(self.simulation)
+            # The page keeps its own copy of the history, fed by the UI pump
+            self.process_execution_history = []
+            self.completed_processes = self.simulation.completed_processes
+            self.history_sent = 0
+            self.open_sent = []
+            self.run_finished = False
+            # New queues drop snapshots and additions of the previous run
+            self.ui_queue = queue.Queue()
+            self.injected_processes = queue.Queue()
+
+        # Each thread gets its own stop flag, so a thread that is still winding
+        # down can not be revived by the next start
+        self.stop_event = threading.Event()
+        self.scheduler_thread = threading.Thread(
+            target=self.run_scheduler, args=(self.simulation, self.stop_event, self.ui_queue)
+        )
         # Set the thread as a daemon so it exits when the main program exits
         self.scheduler_thread.daemon = True
         self.scheduler_thread.start()
+        if self.pump_id is None:
+            self.pump_id = self.after(self.FRAME_MS, self.pump_ui_updates)
 
-    def update_gantt_chart(self):
-        self.canvas.delete("all")
-        canvas_width = self.canvas.winfo_width() or self.width // 2 - 60
-        canvas_height = self.canvas.winfo_height() or 200
-        margin = 70
-
-        # Count unique processes to calculate required height
-        # Includes processes that have run in the past but might be completed
-        # Includes processes that are waiting to run but haven't started yet
-        # Uses a set to automatically eliminate duplicates
-        unique_processes = set()
-        for entry in self.process_execution_history:
-            unique_processes.add(entry[0])
-        for proc in self.process_list:
-            unique_processes.add(proc[0])
-        
-        # Calculate the required height based on process count
-        bar_height = 25
-        bar_spacing = 10
-        y_pos = 30
-        required_height = y_pos + len(unique_processes) * (bar_height + bar_spacing) + 50  # +50 for time axis
-
-        # Calculate the total time for the timeline
-        # If there are processes that have run, use the maximum end time from the history
-        if self.process_execution_history: # List of tuples of 4 elements: (process_name, start_time, end_time, status)
-            total_time = max(self.current_time, max(end for _, _, end, _ in self.process_execution_history))
+    def stop_scheduler_thread(self):
+        """Stop the scheduler thread and drop any snapshots it has not delivered."""
+        self.scheduling_active = False
+        self.stop_event.set()
+        if self.scheduler_thread and self.scheduler_thread.is_alive():
+            self.scheduler_thread.join(0.5)  # Returns as soon as the thread sees the stop flag
+        if self.pump_id is not None:
+            self.after_cancel(self.pump_id)
+            self.pump_id = None
+
+    def update_gantt_chart(self, relayout=False, changed=()):
+        """
+        Bring the Gantt chart up to date with the execution history.
+
+        The chart is retained: a tick only draws what changed in the history
+        and moves the time marker. A full reload happens only when relayout is
+        set or the history was replaced or cleared.
+
+        Args:
+            relayout: Reload the chart from the whole history
+            changed: Indices of earlier entries whose end time changed (open segments on other cores)
+        """
+        history = self.process_execution_history
+        if relayout or not self.gantt.is_showing(history):
+            # Rows for processes that have run in the past or are waiting to run,
+            # sorted by name so color assignment is stable
+            unique_processes = {entry[0] for entry in history}
+            unique_processes.update(proc.name for proc in self.process_list)
+
+            # Fix the time scale for the whole run so drawn items never have to move.
+            # Every algorithm keeps the CPUs busy while work is ready, so the FCFS
+            # makespan is the expected end (exact on one core); live additions
+            # extend the axis later.
+            free_at = [0] * self.cores  # Heap of the times the cores become free
+            for proc in sorted(self.process_list, key=lambda x: x.arrival_time):
+                start = max(heapq.heappop(free_at), proc.arrival_time)
+                heapq.heappush(free_at, start + max(1, proc.burst_time))
+            finish = max(free_at)
+            self.gantt.load(history, sorted(unique_processes), max(self.current_time, finish),
+                            cores=self.cores if self.cores > 1 else None)
         else:
-            total_time = max(1, sum(duration for _, duration, *_ in self.process_list))
+            self.gantt.sync(changed)
 
-        time_scale = (canvas_width - margin - 20) / max(1, total_time)
-        
-        # Calculate needed width for the timeline
-        required_width = margin + (total_time * time_scale) + 50
-        
-        # Set scroll region to accommodate all processes and timeline
-        self.canvas.configure(scrollregion=(0, 0, max(canvas_width, required_width), max(canvas_height, required_height)))
-
-        # Time axis
-        self.canvas.create_line(margin, max(canvas_height, required_height) - 30, max(canvas_width, required_width) - 10, max(canvas_height, required_height) - 30, width=2)
-        self.canvas.create_text(
-            (margin + max(canvas_width, required_width) - 10) // 2, max(canvas_height, required_height) - 10,
-            text="Time (seconds)", font=("Arial", 10, "bold")
-        )
-        tick_interval = max(1, total_time // min(10, total_time))
-        for t in range(0, total_time + 1, tick_interval):
-            x = margin + t * time_scale
-            self.canvas.create_line(x, max(canvas_height, required_height) - 30, x, max(canvas_height, required_height) - 25, width=2)
-            self.canvas.create_text(x, max(canvas_height, required_height) - 15, text=str(t), font=("Arial", 8))
-
-        self.canvas.create_text(margin // 2, 10, text="Process", font=("Arial", 10, "bold"))
-
-        # Assign colors
-        process_colors = [
-            "#4CAF50", "#2196F3", "#FFC107", "#9C27B0", "#F44336",
-            "#009688", "#795548", "#607D8B", "#E91E63", "#673AB7",
-            "#3F51B5", "#FF9800", "#CDDC39", "#8BC34A", "#00BCD4" 
-        ]
-        # Sort so color assignment is stable
-        sorted_processes = sorted(unique_processes)
-        process_color_map = {
-            proc: process_colors[i % len(process_colors)]
-            for i, proc in enumerate(sorted_processes)
-        }
-
-        # If nothing has run yet, just draw process names without bars
-        if not self.process_execution_history:
-            for i, process_name in enumerate(sorted_processes):
-                y = y_pos + i * (bar_height + bar_spacing)
-                self.canvas.create_text(
-                    margin - 5, y + bar_height / 2,
-                    text=process_name, anchor="e", font=("Arial", 10)
-                )
-        else:
-            # Group segments by process
-            process_timelines = {}
-            for name, start, end, status in self.process_execution_history:
-                process_timelines.setdefault(name, []).append((start, end, status))
-
-            # Sort by name for consistent vertical ordering
-            for i, name in enumerate(sorted_processes):
-                if name not in process_timelines:
-                    continue
-                    
-                color = process_color_map.get(name, "#CCCCCC")
-                y = y_pos + i * (bar_height + bar_spacing)
-                self.canvas.create_text(
-                    margin - 5, y + bar_height / 2,
-                    text=name, anchor="e", font=("Arial", 10)
-                )
-                
-                timeline = process_timelines[name]
-                for start, end, status in timeline:
-                    x1 = margin + start * time_scale
-                    x2 = margin + end * time_scale
-                    # "running" gets color, "ready" is a lighter fill
-                    fill_color = color if status == "running" else "#EEEEEE"
-                    self.canvas.create_rectangle(
-                        x1, y, x2, y + bar_height, fill=fill_color, outline="black"
-                    )
-                    if (x2 - x1) > 30:
-                        duration = end - start
-                        self.canvas.create_text(
-                            (x1 + x2) / 2, y + bar_height / 2,
-                            text=f"{duration}s", font=("Arial", 9), fill="black"
-                        )
-
-        # Current-time marker
         if self.scheduling_active and self.current_time > 0:
-            current_x = margin + self.current_time * time_scale
-            self.canvas.create_line(
-                current_x, 10, current_x, max(canvas_height, required_height) - 40,
-                width=2, fill="red", dash=(4, 2), tags="time_marker"
-            )
-            self.canvas.create_text(
-                current_x, 5, text=f"Current: {self.current_time}s",
-                fill="red", font=("Arial", 8, "bold"), tags="time_marker"
-            )
+            self.gantt.set_time_marker(self.current_time)
+        else:
+            self.gantt.set_time_marker(None)
+
+    def update_chart_colors(self, colors):
+        """Recolor the Gantt chart by canvas tag when the theme changes."""
+        self.gantt.set_colors(colors['chart_fg'], colors['chart_bg'])
 
     def toggle_scheduling(self):
         if not self.scheduling_active:
@@ -629,207 +687,153 @@ class LiveSchedulerPage(tk.Frame):
             self.play_button.config(text="Pause Scheduling")
             # Hide arrival time input
             self.arrival_frame.grid_forget()
-            self.scheduler_thread = threading.Thread(target=self.run_scheduler)
-            self.scheduler_thread.daemon = True
-            self.scheduler_thread.start()
+            self.start_scheduler_thread()
         else:
             self.scheduling_active = False
+            # The pump keeps running until the thread has stopped and its last snapshot is shown
+            self.stop_event.set()
             self.play_button.config(text="Resume Scheduling")
 
-    def run_scheduler(self):
-        """Run the scheduler with second-by-second partial updates."""
-        if not hasattr(self, 'restarting') or not self.restarting:
-            self.current_time = 0
-            self.process_execution_history = []
-            self.completed_processes = []
-            # Ensure original process list is used for lookups if needed
-            self.process_details = {p[0]: {"burst": p[1], "arrival": p[2]} for p in self.original_process_list}
-        # Pass a copy of the original list of tuples
-        scheduler_process_list = self.process_list.copy()
-        if self.scheduler_type == "FCFS":
-            scheduler = FCFSScheduler(scheduler_process_list)
-        elif self.scheduler_type == "SJF":
-            scheduler = SJFScheduler(scheduler_process_list)
-        elif self.scheduler_type == "Priority":
-            scheduler = PriorityScheduler(scheduler_process_list)
-        elif self.scheduler_type == "Round Robin":
-            default_quantum = 2
-            quantum_to_use = default_quantum
-            if self.original_process_list:
-                try:
-                    if len(self.original_process_list[0]) > 3:
-                        original_quantum = int(self.original_process_list[0][3])
-                        if original_quantum > 0:
-                            quantum_to_use = original_quantum
-                except (IndexError, ValueError, TypeError):
-                    pass  # Use default if error
-            scheduler = RoundRobinScheduler(scheduler_process_list, quantum_to_use)
-        else:
-            scheduler = FCFSScheduler(scheduler_process_list)
-
-        self.ready_queue = []  # For UI display only
-        self.waiting_queue = [] # For UI display only
-        self.current_process = None # Tuple of the currently running process
-        remaining_time = 0      # Remaining time for self.current_process
-        time_quantum_left = 0 # For Round Robin
-        last_process_name = None # Track changes for history update
-
-        while self.scheduling_active:
-            # 1. Update queues based on current_time (move arrived to ready)
-            newly_arrived = scheduler.update_queues(self.current_time)
-            self.waiting_queue = scheduler.waiting_queue # Update UI state
-            self.ready_queue = scheduler.ready_queue   # Update UI state
-            self.update_queue_labels()
-
-            # 2. Determine scheduling mode (preemptive or non-preemptive)
-            preemptive_mode = False
-            if self.scheduler_type == "SJF" and self.process_list:
-                if len(self.process_list[0]) > 3:
-                    preemptive_mode = self.process_list[0][3]
-            elif self.scheduler_type == "Priority" and self.process_list:
-                 if len(self.process_list[0]) > 4:
-                     preemptive_mode = self.process_list[0][4]
-
-            # 3. Decide which process should run NOW based on mode
-            process_to_run = None
-            time_for_process = 0 # This is the REMAINING time for the selected process
-            preempted_flag = False # Tracks if preemption occurred *this tick*
-
-            if preemptive_mode:
-                if hasattr(scheduler, 'run_preemptive'):
-                    process_to_run, time_for_process, preempted_flag = scheduler.run_preemptive(
-                        self.current_time, self.current_process, remaining_time
-                    )
-                else:
-                    # Fallback or error if preemptive mode selected but method missing
-                    print(f"Warning: Preemptive mode selected for {self.scheduler_type}, but run_preemptive not found.")
-                    # Defaulting to non-preemptive behavior for this tick
-                    if not self.current_process:
-                         if hasattr(scheduler, 'run_non_preemptive'):
-                              process_to_run, time_for_process = scheduler.run_non_preemptive(self.current_time)
-                         elif self.scheduler_type == "FCFS": # FCFS only has run()
-                              process_to_run, time_for_process = scheduler.run(self.current_time)
-                    else:
-                         process_to_run = self.current_process
-                         time_for_process = remaining_time
+    def change_playback_speed(self, event=None):
+        """Apply the speed and idle-skip controls; takes effect from the next tick."""
+        self.playback_speed = self.PLAYBACK_SPEEDS[self.speed_var.get()]
+        self.skip_idle_gaps = self.skip_idle_var.get()
+
+    def run_scheduler(self, simulation, stop_event, updates):
+        """
+        Scheduler thread: advance the simulation one time unit per tick.
+
+        A tick lasts TICK_SECONDS divided by the playback speed. With idle
+        skipping on, gaps where no process has arrived are crossed in one tick.
+        Turbo jumps between scheduling events TURBO_CHUNK at a time, checking
+        stop_event between chunks.
+
+        Never touches Tk widgets; state is published to the updates queue at
+        most once per frame and applied by pump_ui_updates on the main thread.
+        """
+        frame_seconds = self.FRAME_MS / 1000
+        last_publish = 0
+        published = True
+        while True:
+            self.inject_processes(simulation)
+            if simulation.finished:
+                break
 
-            elif self.scheduler_type == "Round Robin":
-                 process_to_run, time_for_process, time_quantum_left, preempted_flag = scheduler.run(
-                     self.current_time, self.current_process, remaining_time, time_quantum_left
-                 )
-
-            else: # Non-preemptive modes (FCFS, non-preemptive SJF/Priority)
-                if not self.current_process: # Only select new if CPU is idle
-                    if self.scheduler_type == "FCFS":
-                         process_to_run, time_for_process = scheduler.run(self.current_time)
-                    elif self.scheduler_type in ["SJF", "Priority"]:
-                         if hasattr(scheduler, 'run_non_preemptive'):
-                              process_to_run, time_for_process = scheduler.run_non_preemptive(self.current_time)
-                         else:
-                              print(f"Warning: Non-preemptive method missing for {self.scheduler_type}")
-                              process_to_run = None
-                              time_for_process = 0
-                else:
-                    # Non-preemptive: current process continues until done
-                    process_to_run = self.current_process
-                    time_for_process = remaining_time # Continue with the current remaining time
-
-            current_process_name = process_to_run[0] if process_to_run else None
-
-            # If the running process changed (or started/stopped)
-            if current_process_name != last_process_name:
-                # If a process was running previously, update its history end time
-                if last_process_name and self.process_execution_history:
-                    self.update_execution_history_end_time(last_process_name, self.current_time)
-
-                # If a new process is starting/resuming
-                if process_to_run:
-                    self.current_process = process_to_run
-                    # CRITICAL: Use the remaining time returned by the scheduler
-                    remaining_time = time_for_process
-                    self.current_process_label.config(text=current_process_name)
-                    # Add new segment to history
-                    # Estimate end time for now, will be updated if preempted or finished
-                    estimated_end = self.current_time + remaining_time
-                    self.process_execution_history.append(
-                        (current_process_name, self.current_time, estimated_end, "running")
-                    )
-                else:
-                    # No process is running now (idle or finished)
-                    self.current_process = None
-                    remaining_time = 0
-                    self.current_process_label.config(text="None")
-                    self.progress_var.set(0)
-
-                last_process_name = current_process_name
-
-            # --- Execute for one time unit --- 
-            if self.current_process:
-                # Check if still active before sleeping/advancing time
-                if not self.scheduling_active: break
-                time.sleep(0.5) # Reduced sleep for faster simulation
-
-                # Advance time and decrement remaining time *for the current process*
-                self.current_time += 1
-                remaining_time -= 1
-                if self.scheduler_type == "Round Robin":
-                    time_quantum_left -= 1
-
-                self.time_label.config(text=f"{self.current_time}s")
-
-                # Update progress bar
-                original_burst = self.process_details.get(self.current_process[0], {}).get("burst", 0)
-                if original_burst > 0:
-                    # Calculate progress based on how much time is left
-                    progress_done = original_burst - remaining_time
-                    self.progress_var.set((progress_done / original_burst) * 100)
-                else:
-                    self.progress_var.set(0)
-
-                # Check for completion AFTER executing and decrementing
-                if remaining_time <= 0:
-                    self.update_execution_history_end_time(self.current_process[0], self.current_time)
-                    # Find the completed process tuple to add (using original details)
-                    completed_tuple = next((p for p in self.original_process_list if p[0] == self.current_process[0]), None)
-                    # If the process is not in the original list, it must be a newly added process, so use the current process
-                    if not completed_tuple:
-                        completed_tuple = self.current_process
-                    
-                    # Add to completed processes
-                    if completed_tuple:
-                        self.completed_processes.append(completed_tuple)
-
-                    # Mark as finished for the next loop iteration's decision phase
-                    self.current_process = None
-                    remaining_time = 0
-                    last_process_name = None # Reset last process tracker
-                    self.current_process_label.config(text="None")
-                    self.progress_var.set(100) # Show 100% briefly
+            speed = self.playback_speed
+            if speed is None:
+                # Turbo: compute the rest of the run as fast as possible, in chunks
+                # so that pause, reset and leaving the page still stop it
+                if stop_event.is_set():
+                    break
+                for _ in range(self.TURBO_CHUNK):
+                    if not simulation.step_to_next_event():
+                        break
+                published = False
+                continue
+
+            # Sleep between ticks, waking up immediately when stopped
+            if stop_event.wait(self.TICK_SECONDS / speed):
+                break
+            if self.skip_idle_gaps:
+                simulation.skip_idle()
+            simulation.step()
+            published = False
+
+            now = time.monotonic()
+            if now - last_publish >= frame_seconds:
+                self.publish_state(simulation, updates)
+                last_publish = now
+                published = True
+
+        # Paused, stopped or finished: make sure the final state is shown
+        if not published:
+            self.publish_state(simulation, updates)
+
+    def inject_processes(self, simulation):
+        """Add processes queued by add_process to the simulation (called on the scheduler thread)."""
+        added = []
+        while True:
+            try:
+                added.append(self.injected_processes.get_nowait())
+            except queue.Empty:
+                break
+        if added:
+            simulation.add_processes(added)
+
+    def publish_state(self, simulation, updates):
+        """Queue a snapshot of the simulation (called on the scheduler thread)."""
+        history = simulation.process_execution_history
+        # Entries that were open at the last publish may have been closed since
+        start = self.history_sent
+        changed = [(i, history[i]) for i in self.open_sent if i < start]
+        self.history_sent = len(history)
+        self.open_sent = simulation.open_segments()
+        running = simulation.running()
+        updates.put({
+            'time': simulation.current_time,
+            'process': " | ".join(proc.name if proc else "idle" for proc in running) if any(running) else None,
+            'progress': simulation.progress(),
+            'ready': self.queue_head(simulation.scheduler.ready_queue),
+            'waiting': self.queue_head(simulation.scheduler.waiting_queue),
+            'history_start': start,
+            'history': history[start:],
+            'changed': changed,
+            'finished': simulation.finished,
+        })
+
+    def pump_ui_updates(self):
+        """Main thread: drain the snapshots queued since the last frame and show the latest."""
+        self.pump_id = None
+        history = self.process_execution_history
+        state = None
+        changed = set()
+        while True:
+            try:
+                update = self.ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            # History deltas are applied in order, everything else only needs the newest value
+            for i, entry in update['changed']:
+                history[i] = entry
+                changed.add(i)
+            del history[update['history_start']:]
+            history.extend(update['history'])
+            state = update
+
+        if state is not None:
+            self.current_time = state['time']
+            self.current_process = state['process']
+            self.ready_count, self.ready_queue = state['ready']
+            self.waiting_count, self.waiting_queue = state['waiting']
+            self.update_queue_labels()
 
-            else:
-                # No process running => idle tick
-                # Only advance time if there are still processes waiting or ready
-                if not scheduler.is_done():
-                     # Check if still active before sleeping/advancing time
-                    if not self.scheduling_active: break
-                    time.sleep(0.5) # Reduced sleep
-                    self.current_time += 1
-                    self.time_label.config(text=f"{self.current_time}s")
-                else:
-                    # If scheduler is done and no process running, break immediately
-                    if not self.current_process:
-                         break
+            self.time_label.config(text=f"{self.current_time}s")
+            self.current_process_label.config(text=self.current_process or "None")
+            self.progress_var.set(state['progress'])
 
             # Update Gantt chart (always update to show time marker)
-            self.update_gantt_chart()
-
-            # Check for overall completion
-            # Need to check is_done() AND if a process is still running its last tick
-            if scheduler.is_done() and not self.current_process:
-                break # Exit the loop
-
-        # --- End of Loop --- 
+            if self.instrumentation is not None:
+                with self.instrumentation.timed("render"):
+                    self.update_gantt_chart(changed=sorted(changed))
+            else:
+                self.update_gantt_chart(changed=sorted(changed))
+            self.run_finished = state['finished']
+
+        # A finished snapshot is not the end yet: a process added right after it
+        # makes the thread carry on, so only stop once the thread is gone and drained
+        if self.scheduler_thread.is_alive() or not self.ui_queue.empty():
+            self.pump_id = self.after(self.FRAME_MS, self.pump_ui_updates)
+        elif self.scheduling_active and not self.injected_processes.empty():
+            # Added after the thread's last look at the queue: continue the run with it
+            self.inject_processes(self.simulation)
+            self.start_scheduler_thread()
+        elif self.run_finished:
+            self.finish_run()
+
+    def finish_run(self):
+        """Reset the controls once the last snapshot of a finished run is shown."""
         self.scheduling_active = False
+        self.run_finished = False
         self.play_button.config(text="Start Scheduling")
         self.output_button.config(state=tk.NORMAL)
         
@@ -841,21 +845,21 @@ class LiveSchedulerPage(tk.Frame):
         # Final Gantt chart update to ensure completion is shown
         self.update_gantt_chart()
 
-    def update_execution_history_end_time(self, process_name, end_time):
-        """Update the end time of the most recent execution segment for a process"""
-        for i in range(len(self.process_execution_history) - 1, -1, -1):
-            entry = self.process_execution_history[i]
-            if entry[0] == process_name and entry[3] == "running":
-                self.process_execution_history[i] = (entry[0], entry[1], end_time, "running")
-                break
+        if self.instrumentation is not None:
+            try:
+                self.instrumentation.export(self.profile_path)
+            except OSError as e:
+                print(f"Warning: could not write profile to {self.profile_path}: {e}")
 
     def reset_scheduler(self):
-        self.scheduling_active = False
+        self.stop_scheduler_thread()
+        self.simulation = None
         self.current_time = 0
         self.process_list = self.original_process_list.copy()  # Restore from original
         self.process_listbox.delete(0, tk.END)
         self.ready_queue.clear()
         self.waiting_queue.clear()
+        self.ready_count = self.waiting_count = 0
         self.process_execution_history.clear()
         self.completed_processes.clear()
         self.time_label.config(text="0s")
@@ -875,12 +879,15 @@ class LiveSchedulerPage(tk.Frame):
                 completed_processes=self.completed_processes,
                 process_execution_history=self.process_execution_history,
                 process_list=self.process_list.copy(),
-                scheduler_type=self.scheduler_type
+                scheduler_type=self.scheduler_type,
+                cores=self.cores,
+                scheduler_options=self.scheduler_options,
+                switch_cost=self.switch_cost
             )
 
     def confirm_exit(self):
         if messagebox.askyesno("Exit", "Are you sure you want to exit?"):
-            self.scheduling_active = False
+            self.stop_scheduler_thread()
             if hasattr(self, 'navigate_to_scheduler') and self.navigate_to_scheduler:
                 # Pass process_list and scheduler_type to navigate back to the scheduler page
                 self.navigate_to_scheduler(self.process_list, self.scheduler_type, back_direction="right")
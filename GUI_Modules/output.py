@@ -1,15 +1,21 @@
 import tkinter as tk
 from tkinter import ttk
-import math
+
+from GUI_Modules.gantt_chart import GanttChart
+from GUI_Modules.theme import ThemeRegistry
+from Schedulers.metrics import ScheduleMetrics
 
 
 class OutputPage(tk.Frame):
     def __init__(self, parent, colors, width, height, navigate_home, navigate_to_scheduler,
-                 completed_processes=None, process_execution_history=None, scheduler_type="FCFS"):
+                 completed_processes=None, process_execution_history=None, scheduler_type="FCFS", cores=1,
+                 theme=None):
         super().__init__(parent, bg=colors['background'])
 
         # Store parameters
         self.colors = colors
+        self.theme = theme or ThemeRegistry(colors)  # Recolors the widgets on theme changes
+        self.theme.register(self, bg='background')
         self.navigate_home = navigate_home
         self.navigate_to_scheduler = navigate_to_scheduler
         self.width = width
@@ -17,9 +23,11 @@ class OutputPage(tk.Frame):
         self.completed_processes = completed_processes or []
         self.process_execution_history = process_execution_history or []
         self.scheduler_type = scheduler_type
+        self.cores = cores
 
         # Create a header
         header = tk.Frame(self, bg=colors['button_bg'], height=60)
+        self.theme.register(header, bg='button_bg')
         header.pack(fill=tk.X, side=tk.TOP)
 
         back_button = tk.Button(
@@ -27,6 +35,7 @@ class OutputPage(tk.Frame):
             bg=colors['button_bg'], fg=colors['button_fg'],
             bd=0, font=("Arial", 12, "bold")
         )
+        self.theme.register(back_button, bg='button_bg', fg='button_fg')
         back_button.pack(side=tk.LEFT, padx=15, pady=10)
 
         home_button = tk.Button(
@@ -34,16 +43,19 @@ class OutputPage(tk.Frame):
             bg=colors['button_bg'], fg=colors['button_fg'],
             bd=0, font=("Arial", 12, "bold")
         )
+        self.theme.register(home_button, bg='button_bg', fg='button_fg')
         home_button.pack(side=tk.RIGHT, padx=15, pady=10)
 
         title_label = tk.Label(
             header, text=f"{scheduler_type} Scheduler Results", font=("Arial", 16, "bold"),
             bg=colors['button_bg'], fg=colors['button_fg']
         )
+        self.theme.register(title_label, bg='button_bg', fg='button_fg')
         title_label.pack(side=tk.LEFT, padx=20, pady=10)
 
         # Main container
         main_frame = tk.Frame(self, bg=colors['background'])
+        self.theme.register(main_frame, bg='background')
         main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
 
         # Gantt Chart Section
@@ -52,10 +64,12 @@ class OutputPage(tk.Frame):
             bg=colors['background'], fg=colors['text'],
             padx=10, pady=10
         )
+        self.theme.register(gantt_frame, bg='background', fg='text')
         gantt_frame.pack(fill=tk.X, pady=(0, 20))
 
         # Create a container for the Gantt chart with scrollbars
         gantt_container = tk.Frame(gantt_frame, bg=colors['background'])
+        self.theme.register(gantt_container, bg='background')
         gantt_container.pack(fill=tk.X, expand=False)
         
         # Add horizontal scrollbar for gantt chart
@@ -75,11 +89,16 @@ class OutputPage(tk.Frame):
             xscrollcommand=gantt_h_scroll.set,
             yscrollcommand=gantt_v_scroll.set
         )
+        self.theme.register(self.gantt_canvas, highlightbackground='button_bg')
         self.gantt_canvas.pack(fill=tk.X, expand=False)
+
+        # Windowed renderer that only shows running segments
+        self.gantt = GanttChart(self.gantt_canvas, width - 100, 250, running_only=True)
+        self.theme.subscribe(self.gantt_canvas, self.update_chart_colors)
         
-        # Configure the scrollbars to work with the canvas
-        gantt_h_scroll.config(command=self.gantt_canvas.xview)
-        gantt_v_scroll.config(command=self.gantt_canvas.yview)
+        # Configure the scrollbars to work with the chart
+        gantt_h_scroll.config(command=self.gantt.xview)
+        gantt_v_scroll.config(command=self.gantt.yview)
 
         # Statistics Section
         stats_frame = tk.LabelFrame(
@@ -87,14 +106,17 @@ class OutputPage(tk.Frame):
             bg=colors['background'], fg=colors['text'],
             padx=10, pady=10
         )
+        self.theme.register(stats_frame, bg='background', fg='text')
         stats_frame.pack(fill=tk.X)
 
         # Create a flexible layout to place table on left and stats on right
         metrics_container = tk.Frame(stats_frame, bg=colors['background'])
+        self.theme.register(metrics_container, bg='background')
         metrics_container.pack(fill=tk.X, padx=10, pady=10)
 
         # Left side - Create a scrollable container for the table
         table_container = tk.Frame(metrics_container, bg=colors['background'])
+        self.theme.register(table_container, bg='background')
         table_container.pack(side=tk.LEFT, fill=tk.Y, padx=(0, 20))
         
         # Add scrollbar for the table
@@ -110,11 +132,13 @@ class OutputPage(tk.Frame):
             yscrollcommand=table_scroll.set,
             highlightthickness=0
         )
+        self.theme.register(table_canvas, bg='background')
         table_canvas.pack(side=tk.LEFT)
         table_scroll.config(command=table_canvas.yview)
         
         # Create a frame inside the canvas for the actual table
         table_frame = tk.Frame(table_canvas, bg=colors['background'])
+        self.theme.register(table_frame, bg='background')
         table_window = table_canvas.create_window((0, 0), window=table_frame, anchor="nw")
         
         # Ensure the scroll region updates when the table size changes
@@ -128,21 +152,26 @@ class OutputPage(tk.Frame):
                    "Turnaround Time", "Waiting Time"]
 
         for col, header in enumerate(headers):
-            tk.Label(
+            label = tk.Label(
                 table_frame, text=header, font=("Arial", 12, "bold"),
                 bg=colors['button_bg'], fg=colors['button_fg'],
                 padx=10, pady=5, relief=tk.RIDGE, width=12
-            ).grid(row=0, column=col, sticky="nsew")
+            )
+            self.theme.register(label, bg='button_bg', fg='button_fg')
+            label.grid(row=0, column=col, sticky="nsew")
 
-        # Calculate and populate process statistics
+        # Calculate and populate process statistics (vectorized over the whole run)
+        self.metrics = ScheduleMetrics(self.completed_processes, self.process_execution_history)
         self.process_stats = self.calculate_process_stats()
 
-        for row, (process_name, stats) in enumerate(self.process_stats.items(), start=1):
-            tk.Label(
-                table_frame, text=process_name, font=("Arial", 11),
+        for row, stats in enumerate(self.process_stats.values(), start=1):
+            label = tk.Label(
+                table_frame, text=stats['name'], font=("Arial", 11),
                 bg=colors['background'], fg=colors['text'],
                 padx=10, pady=5, relief=tk.RIDGE
-            ).grid(row=row, column=0, sticky="nsew")
+            )
+            self.theme.register(label, bg='background', fg='text')
+            label.grid(row=row, column=0, sticky="nsew")
 
             for col, metric in enumerate([
                 stats['arrival_time'],
@@ -151,14 +180,17 @@ class OutputPage(tk.Frame):
                 stats['turnaround_time'],
                 stats['waiting_time']
             ], start=1):
-                tk.Label(
+                label = tk.Label(
                     table_frame, text=str(metric), font=("Arial", 11),
                     bg=colors['background'], fg=colors['text'],
                     padx=10, pady=5, relief=tk.RIDGE
-                ).grid(row=row, column=col, sticky="nsew")
+                )
+                self.theme.register(label, bg='background', fg='text')
+                label.grid(row=row, column=col, sticky="nsew")
 
         # Right side - Summary statistics
         avg_stats_frame = tk.Frame(metrics_container, bg=colors['background'])
+        self.theme.register(avg_stats_frame, bg='background')
         avg_stats_frame.pack(side=tk.LEFT, fill=tk.Y, padx=10)
 
         # Calculate averages
@@ -167,184 +199,143 @@ class OutputPage(tk.Frame):
         # Average Turnaround Time Card
         avg_tat_frame = tk.Frame(avg_stats_frame, bg=colors['button_bg'],
                                  padx=30, pady=15, relief=tk.RAISED, bd=1)
+        self.theme.register(avg_tat_frame, bg='button_bg')
         avg_tat_frame.pack(side=tk.TOP, pady=(0, 15), fill=tk.X)
 
-        tk.Label(
+        label = tk.Label(
             avg_tat_frame, text="Average Turnaround Time", font=("Arial", 12, "bold"),
             bg=colors['button_bg'], fg="white"
-        ).pack()
+        )
+        self.theme.register(label, bg='button_bg')
+        label.pack()
 
         # Make sure the value appears with explicit contrasting color
         avg_tat_value = tk.Label(
             avg_tat_frame, text=f"{avg_turnaround:.2f} seconds", font=("Arial", 16, "bold"),
             bg=colors['button_bg'], fg="white"
         )
+        self.theme.register(avg_tat_value, bg='button_bg')
         avg_tat_value.pack(pady=5)
 
         # Average Waiting Time Card
         avg_wt_frame = tk.Frame(avg_stats_frame, bg=colors['button_bg'],
                                 padx=20, pady=15, relief=tk.RAISED, bd=1)
+        self.theme.register(avg_wt_frame, bg='button_bg')
         avg_wt_frame.pack(side=tk.TOP, fill=tk.X)
 
-        tk.Label(
+        label = tk.Label(
             avg_wt_frame, text="Average Waiting Time", font=("Arial", 12, "bold"),
             bg=colors['button_bg'], fg="white"
-        ).pack()
+        )
+        self.theme.register(label, bg='button_bg')
+        label.pack()
 
         # Make sure the value appears with explicit contrasting color
         avg_wt_value = tk.Label(
             avg_wt_frame, text=f"{avg_waiting:.2f} seconds", font=("Arial", 16, "bold"),
             bg=colors['button_bg'], fg="white"
         )
+        self.theme.register(avg_wt_value, bg='button_bg')
         avg_wt_value.pack(pady=5)
 
+        # CPU efficiency card, runs with context-switch or migration overhead only
+        overhead = self.calculate_overhead_stats()
+        if overhead['switch_time'] or overhead['warmup_time']:
+            efficiency_frame = tk.Frame(avg_stats_frame, bg=colors['button_bg'],
+                                        padx=20, pady=15, relief=tk.RAISED, bd=1)
+            self.theme.register(efficiency_frame, bg='button_bg')
+            efficiency_frame.pack(side=tk.TOP, pady=(15, 0), fill=tk.X)
+
+            label = tk.Label(
+                efficiency_frame, text="CPU Efficiency", font=("Arial", 12, "bold"),
+                bg=colors['button_bg'], fg="white"
+            )
+            self.theme.register(label, bg='button_bg')
+            label.pack()
+            label = tk.Label(
+                efficiency_frame, text=f"{overhead['cpu_efficiency']:.1%}", font=("Arial", 16, "bold"),
+                bg=colors['button_bg'], fg="white"
+            )
+            self.theme.register(label, bg='button_bg')
+            label.pack(pady=5)
+
+            lines = [f"Context switches: {overhead['switches']}",
+                     f"Switch overhead: {overhead['switch_overhead']:.1%}"]
+            if overhead['warmup_time']:
+                lines.append(f"Cache warmup: {overhead['warmup_time']} seconds")
+            label = tk.Label(
+                efficiency_frame, text="\n".join(lines), font=("Arial", 11), justify=tk.LEFT,
+                bg=colors['button_bg'], fg="white"
+            )
+            self.theme.register(label, bg='button_bg')
+            label.pack()
+
+        # Core load card, multi-core runs only
+        if self.cores > 1:
+            core_stats = self.calculate_core_stats()
+            cores_frame = tk.Frame(avg_stats_frame, bg=colors['button_bg'],
+                                   padx=20, pady=15, relief=tk.RAISED, bd=1)
+            self.theme.register(cores_frame, bg='button_bg')
+            cores_frame.pack(side=tk.TOP, pady=(15, 0), fill=tk.X)
+
+            label = tk.Label(
+                cores_frame, text="CPU Cores", font=("Arial", 12, "bold"),
+                bg=colors['button_bg'], fg="white"
+            )
+            self.theme.register(label, bg='button_bg')
+            label.pack()
+
+            lines = [f"Migrations: {core_stats['migrations']}",
+                     f"Imbalance: {core_stats['imbalance']:.1%}"]
+            lines += [f"CPU {core}: {utilization:.1%} busy"
+                      for core, utilization in enumerate(core_stats['utilization'])]
+            label = tk.Label(
+                cores_frame, text="\n".join(lines), font=("Arial", 11), justify=tk.LEFT,
+                bg=colors['button_bg'], fg="white"
+            )
+            self.theme.register(label, bg='button_bg')
+            label.pack(pady=5)
+
         # Draw the Gantt chart
         self.draw_gantt_chart()
 
     def calculate_process_stats(self):
         """Calculate statistics for each process."""
-        stats = {}
-
-        # First, get the process details (name, arrival, burst)
-        for process in self.completed_processes:
-            name = process[0]
-            burst_time = process[1]
-            arrival_time = process[2]
-
-            stats[name] = {
-                'name': name,
-                'arrival_time': arrival_time,
-                'burst_time': burst_time,
-                'completion_time': 0,  # Will be calculated from execution history
-                'turnaround_time': 0,  # Will be calculated: completion - arrival
-                'waiting_time': 0  # Will be calculated: turnaround - burst
-            }
-
-        # Calculate completion times from execution history
-        if self.process_execution_history:
-            # Group by process name
-            process_executions = {}
-            for name, start, end, status in self.process_execution_history:
-                if status == "running":
-                    process_executions.setdefault(name, []).append((start, end))
-
-            # Find last execution for each process (completion time)
-            for name, executions in process_executions.items():
-                if name in stats:
-                    # Use the end time of the last execution segment
-                    stats[name]['completion_time'] = max(end for _, end in executions)
-                    # Calculate turnaround and waiting times
-                    stats[name]['turnaround_time'] = stats[name]['completion_time'] - stats[name]['arrival_time']
-                    stats[name]['waiting_time'] = stats[name]['turnaround_time'] - stats[name]['burst_time']
-
-        return stats
+        # Completion = end of the last running segment, turnaround = completion - arrival,
+        # waiting = turnaround - burst; computed column-wise by ScheduleMetrics
+        return self.metrics.process_stats()
 
     def calculate_averages(self):
         """Calculate average turnaround and waiting times."""
-        if not self.process_stats:
-            return 0, 0
+        return self.metrics.averages()
+
+    def calculate_overhead_stats(self):
+        """Calculate CPU efficiency and the time lost to context switches and cache warmups."""
+        return self.metrics.overhead_stats()
 
-        total_turnaround = sum(stats['turnaround_time'] for stats in self.process_stats.values())
-        total_waiting = sum(stats['waiting_time'] for stats in self.process_stats.values())
-        count = len(self.process_stats)
+    def calculate_core_stats(self):
+        """Calculate per-core utilization, load imbalance and migrations."""
+        return self.metrics.core_stats(self.cores)
 
-        return total_turnaround / count, total_waiting / count
+    def update_chart_colors(self, colors):
+        """Recolor the Gantt chart by canvas tag when the theme changes."""
+        self.gantt.set_colors(colors['chart_fg'], colors['chart_bg'])
 
     def draw_gantt_chart(self):
         """Draw the Gantt chart on the canvas."""
-        self.gantt_canvas.delete("all")
-        canvas_width = self.width - 100
-        canvas_height = 250
-        margin = 70
-
-        # Determine the maximum time from execution history
         if not self.process_execution_history:
+            self.gantt_canvas.delete("all")
+            canvas_width = self.width - 100
+            canvas_height = 250
             self.gantt_canvas.create_text(
                 canvas_width // 2, canvas_height // 2,
                 text="No execution data available", font=("Arial", 14)
             )
             return
 
-        # Count the unique processes and determine required height
-        unique_processes = sorted(set(name for name, _, _, _ in self.process_execution_history))
-        process_count = len(unique_processes)
-        
-        # Calculate needed height for all processes with spacing
-        bar_height = 25
-        bar_spacing = 10
-        y_offset = 30  # Space at top
-        required_height = y_offset + (process_count * (bar_height + bar_spacing)) + 50  # +50 for time axis at bottom
-        
-        # Set the scroll region to accommodate all processes vertically
-        self.gantt_canvas.configure(scrollregion=(0, 0, canvas_width, max(canvas_height, required_height)))
-
-        total_time = max(end for _, _, end, _ in self.process_execution_history)
-        time_scale = (canvas_width - margin - 20) / max(1, total_time)
-        
-        # If the timeline is long, make the scroll region wider to ensure all time points are visible
-        if total_time > 20:  # If we have many time points
-            extended_width = margin + (total_time * max(time_scale, 20)) + 20
-            self.gantt_canvas.configure(scrollregion=(0, 0, max(canvas_width, extended_width), max(canvas_height, required_height)))
-
-        # Time axis
-        self.gantt_canvas.create_line(margin, max(canvas_height, required_height) - 30, canvas_width - 10, max(canvas_height, required_height) - 30, width=2)
-        self.gantt_canvas.create_text(
-            canvas_width // 2, max(canvas_height, required_height) - 10,
-            text="Time (seconds)", font=("Arial", 10, "bold")
-        )
-
-        # Time labels
-        tick_interval = max(1, math.ceil(total_time / 10))  # Adjust for readability
-        for t in range(0, total_time + 1, tick_interval):
-            x = margin + t * time_scale
-            self.gantt_canvas.create_line(x, max(canvas_height, required_height) - 30, x, max(canvas_height, required_height) - 25, width=2)
-            self.gantt_canvas.create_text(x, max(canvas_height, required_height) - 15, text=str(t), font=("Arial", 8))
-
-        self.gantt_canvas.create_text(margin // 2, 10, text="Process", font=("Arial", 10, "bold"))
-
-        # Assign colors for processes
-        process_colors = [
-            "#4CAF50", "#2196F3", "#FFC107", "#9C27B0", "#F44336",
-            "#009688", "#795548", "#607D8B", "#E91E63", "#673AB7",
-            "#3F51B5", "#FF9800", "#CDDC39", "#8BC34A", "#00BCD4"  # Added more colors
-        ]
-        process_color_map = {
-            proc: process_colors[i % len(process_colors)]
-            for i, proc in enumerate(unique_processes)
-        }
-
-        # Group segments by process
-        process_timelines = {}
-        for name, start, end, status in self.process_execution_history:
-            if status == "running":  # Only show running segments
-                process_timelines.setdefault(name, []).append((start, end))
-
-        # Draw process execution bars
-        y_pos = y_offset
-        for i, name in enumerate(unique_processes):
-            color = process_color_map.get(name, "#CCCCCC")
-            y = y_pos + i * (bar_height + bar_spacing)
-
-            # Process name label
-            self.gantt_canvas.create_text(
-                margin - 5, y + bar_height / 2,
-                text=name, anchor="e", font=("Arial", 10)
-            )
-
-            # Draw execution segments
-            timeline = process_timelines.get(name, [])
-            for start, end in timeline:
-                x1 = margin + start * time_scale
-                x2 = margin + end * time_scale
-
-                self.gantt_canvas.create_rectangle(
-                    x1, y, x2, y + bar_height, fill=color, outline="black"
-                )
-
-                # Show duration in the segment if width permits
-                if (x2 - x1) > 30:
-                    duration = end - start
-                    self.gantt_canvas.create_text(
-                        (x1 + x2) / 2, y + bar_height / 2,
-                        text=f"{duration}s", font=("Arial", 9), fill="black"
-                    )
\ No newline at end of file
+        # One row per process (one lane per core on multi-core runs),
+        # colors sorted by process name so they are stable
+        unique_processes = sorted(set(entry[0] for entry in self.process_execution_history))
+        total_time = max(entry[2] for entry in self.process_execution_history)
+        self.gantt.load(self.process_execution_history, unique_processes, total_time,
+                        cores=self.cores if self.cores > 1 else None)
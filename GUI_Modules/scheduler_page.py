@@ -3,10 +3,17 @@ import tkinter as tk
 from tkinter import messagebox
 import customtkinter as ctk
 
+from GUI_Modules.theme import ThemeRegistry
+
+from Schedulers.process import Process, configure_processes
+from Schedulers.workload_generator import generate_workload
+
 class SchedulerPage(tk.Frame):
-    def __init__(self, parent, colors, width, height, navigate_home, navigate_live_scheduler):
+    def __init__(self, parent, colors, width, height, navigate_home, navigate_live_scheduler, theme=None):
         super().__init__(parent, bg=colors['background'])
         self.colors = colors
+        self.theme = theme or ThemeRegistry(colors)  # Recolors the widgets on theme changes
+        self.theme.register(self, bg='background')
         self.navigate_home = navigate_home
         self.navigate_live_scheduler = navigate_live_scheduler
 
@@ -16,24 +23,40 @@ class SchedulerPage(tk.Frame):
             "FCFS": [],
             "SJF": [],
             "Priority": [],
-            "Round Robin": []
+            "Round Robin": [],
+            "MLFQ": []
         }
         self.process_widgets = {
             "FCFS": [],
             "SJF": [],
             "Priority": [],
-            "Round Robin": []
+            "Round Robin": [],
+            "MLFQ": []
+        }
+        # Synthetic workloads are kept as Process records and shown as one summary row
+        self.generated_processes = {
+            "FCFS": [],
+            "SJF": [],
+            "Priority": [],
+            "Round Robin": [],
+            "MLFQ": []
         }
 
         self.live_scheduler_enabled = tk.BooleanVar(value=False)
         self.rr_quantum = tk.StringVar(value="2")
+        self.mlfq_quanta = tk.StringVar(value="2,4,8")
+        self.mlfq_boost = tk.StringVar(value="")
+        self.cpu_cores = tk.StringVar(value="1")
+        self.switch_cost = tk.StringVar(value="0")
 
         self.frame = ctk.CTkScrollableFrame(master=self, width=width, height=height,
                                             corner_radius=15, fg_color=colors['background'])
+        self.theme.register(self.frame, fg_color='background')
         self.frame.pack(pady=20, padx=20, fill="both", expand=True)
 
         title_label = ctk.CTkLabel(self.frame, text="CPU Scheduling Simulator",
                                    font=("Arial", 20, "bold"), text_color=colors['text'])
+        self.theme.register(title_label, text_color='text')
         title_label.pack(pady=10)
 
         self.tabview = ctk.CTkTabview(self.frame, width=500, height=50,
@@ -43,49 +66,160 @@ class SchedulerPage(tk.Frame):
                                       segmented_button_unselected_color="#0A0A0A")
         self.tabview.pack(fill="both", expand=True, padx=10, pady=10)
 
-        for tab_name in ["FCFS", "SJF", "Priority", "Round Robin"]:
+        for tab_name in ["FCFS", "SJF", "Priority", "Round Robin", "MLFQ"]:
             self.tabview.add(tab_name)
 
         self.create_fcfs_tab()
         self.create_sjf_tab()
         self.create_priority_tab()
         self.create_round_robin_tab()
+        self.create_mlfq_tab()
 
         # Live Scheduler Checkbox
-        ctk.CTkCheckBox(
+        checkbox = ctk.CTkCheckBox(
             self.frame,
             text="Live Scheduler",
             variable=self.live_scheduler_enabled,
             text_color=self.colors['text']
-        ).pack(pady=5)
+        )
+        self.theme.register(checkbox, text_color='text')
+        checkbox.pack(pady=5)
+
+        # CPU cores sharing one ready queue
+        cores_frame = ctk.CTkFrame(self.frame, fg_color=colors['background'])
+        self.theme.register(cores_frame, fg_color='background')
+        cores_frame.pack(pady=5)
+        label = ctk.CTkLabel(cores_frame, text="CPU Cores:", text_color=self.colors['text'])
+        self.theme.register(label, text_color='text')
+        label.pack(side="left", padx=(10, 5))
+        cores_entry = ctk.CTkEntry(cores_frame, width=80, textvariable=self.cpu_cores,
+                                   fg_color=colors['background'], text_color=colors['text'])
+        self.theme.register(cores_entry, fg_color='background', text_color='text')
+        cores_entry.pack(side="left", padx=5)
+        cores_entry.bind("<FocusOut>", lambda e: self.validate_cores(e, cores_entry))
+
+        # CPU time every context switch costs
+        label = ctk.CTkLabel(cores_frame, text="Switch Cost:", text_color=self.colors['text'])
+        self.theme.register(label, text_color='text')
+        label.pack(side="left", padx=(10, 5))
+        switch_entry = ctk.CTkEntry(cores_frame, width=80, textvariable=self.switch_cost,
+                                    fg_color=colors['background'], text_color=colors['text'])
+        self.theme.register(switch_entry, fg_color='background', text_color='text')
+        switch_entry.pack(side="left", padx=5)
+        switch_entry.bind("<FocusOut>", lambda e: self.validate_switch_cost(e, switch_entry))
 
         button_frame1 = ctk.CTkFrame(self.frame, fg_color=colors['background'])
+        self.theme.register(button_frame1, fg_color='background')
         button_frame1.pack(pady=5)
 
-        ctk.CTkButton(button_frame1, text="Show Scheduler", fg_color=colors['button_bg'],
-                      hover_color=colors['toggle_bg'], text_color=colors['button_fg'],
-                      font=("Arial", 14, "bold"), corner_radius=10,
-                      command=lambda: self.on_run_live_scheduler(self.process_list)).pack(side="left", pady=5, padx=10)
+        button = ctk.CTkButton(button_frame1, text="Show Scheduler", fg_color=colors['button_bg'],
+                               hover_color=colors['toggle_bg'], text_color=colors['button_fg'],
+                               font=("Arial", 14, "bold"), corner_radius=10,
+                               command=lambda: self.on_run_live_scheduler(self.process_list))
+        self.theme.register(button, fg_color='button_bg', hover_color='toggle_bg', text_color='button_fg')
+        button.pack(side="left", pady=5, padx=10)
+
+        button = ctk.CTkButton(button_frame1, text="Add Process", fg_color=colors['button_bg'],
+                               hover_color=colors['toggle_bg'], text_color=colors['button_fg'],
+                               font=("Arial", 14, "bold"), corner_radius=10,
+                               command=self.add_process_by_selected_tab)
+        self.theme.register(button, fg_color='button_bg', hover_color='toggle_bg', text_color='button_fg')
+        button.pack(side="left", pady=10, padx=10)
+
+        button = ctk.CTkButton(button_frame1, text="Clear All Process", fg_color=colors['sign_out_bg'],
+                               hover_color=colors['toggle_bg'], text_color=colors['sign_out_fg'],
+                               font=("Arial", 14, "bold"), corner_radius=10,
+                               command=self.clear_process_by_selected_tab)
+        self.theme.register(button, fg_color='sign_out_bg', hover_color='toggle_bg', text_color='sign_out_fg')
+        button.pack(side="left", pady=10, padx=10)
+
+        self.create_generator_controls()
+
+        label = ctk.CTkLabel(self.frame, text="If you enter more than one process type, the scheduler will only run the last type entered.",
+                             font=("Arial", 10, "bold"), text_color=self.colors['text'])
+        self.theme.register(label, text_color='text')
+        label.pack(pady=10)
 
-        ctk.CTkButton(button_frame1, text="Add Process", fg_color=colors['button_bg'],
-                      hover_color=colors['toggle_bg'], text_color=colors['button_fg'],
-                      font=("Arial", 14, "bold"), corner_radius=10,
-                      command=self.add_process_by_selected_tab).pack(side="left", pady=10, padx=10)
+        self.process_display = ctk.CTkFrame(self.frame, fg_color=colors['background'])
+        self.theme.register(self.process_display, fg_color='background')
+        self.process_display.pack(pady=10, fill="both", expand=True)
 
-        ctk.CTkButton(button_frame1, text="Clear All Process", fg_color=colors['sign_out_bg'],
-                      hover_color=colors['toggle_bg'], text_color=colors['sign_out_fg'],
-                      font=("Arial", 14, "bold"), corner_radius=10,
-                      command=self.clear_process_by_selected_tab).pack(side="left", pady=10, padx=10)
+    def create_generator_controls(self):
+        generator_frame = ctk.CTkFrame(self.frame, fg_color=self.colors['background'])
+        self.theme.register(generator_frame, fg_color='background')
+        generator_frame.pack(pady=5)
+
+        self.generate_count = ctk.CTkEntry(generator_frame, width=110, height=32, corner_radius=10,
+                                           placeholder_text="Process Count",
+                                           fg_color=self.colors['background'],
+                                           text_color=self.colors['text'],
+                                           placeholder_text_color=self.colors['text_secondary'])
+        self.theme.register(self.generate_count, fg_color='background', text_color='text',
+                            placeholder_text_color='text_secondary')
+        self.generate_count.pack(side="left", padx=5)
+        self.generate_seed = ctk.CTkEntry(generator_frame, width=90, height=32, corner_radius=10,
+                                          placeholder_text="Seed",
+                                          fg_color=self.colors['background'],
+                                          text_color=self.colors['text'],
+                                          placeholder_text_color=self.colors['text_secondary'])
+        self.theme.register(self.generate_seed, fg_color='background', text_color='text',
+                            placeholder_text_color='text_secondary')
+        self.generate_seed.pack(side="left", padx=5)
+
+        self.arrivals_var = ctk.StringVar(value="poisson")
+        self.bursts_var = ctk.StringVar(value="exponential")
+        self.priorities_var = ctk.StringVar(value="uniform")
+        for variable, values in [(self.arrivals_var, ["poisson", "bursty"]),
+                                 (self.bursts_var, ["exponential", "pareto", "bimodal"]),
+                                 (self.priorities_var, ["uniform", "skewed"])]:
+            menu = ctk.CTkOptionMenu(generator_frame, variable=variable, values=values, width=120,
+                                     fg_color=self.colors['button_bg'], text_color=self.colors['button_fg'],
+                                     button_color=self.colors['button_bg'],
+                                     button_hover_color=self.colors['toggle_bg'])
+            self.theme.register(menu, fg_color='button_bg', text_color='button_fg', button_color='button_bg',
+                                button_hover_color='toggle_bg')
+            menu.pack(side="left", padx=5)
+
+        button = ctk.CTkButton(generator_frame, text="Generate", fg_color=self.colors['button_bg'],
+                               hover_color=self.colors['toggle_bg'], text_color=self.colors['button_fg'],
+                               font=("Arial", 14, "bold"), corner_radius=10,
+                               command=self.generate_processes_for_selected_tab)
+        self.theme.register(button, fg_color='button_bg', hover_color='toggle_bg', text_color='button_fg')
+        button.pack(side="left", padx=10)
+
+    def generate_processes_for_selected_tab(self):
+        tab = self.tabview.get()
+        count = self.generate_count.get().strip()
+        seed = self.generate_seed.get().strip()
+        if not count.isdigit() or int(count) == 0:
+            messagebox.showerror("Error", "Process count must be a positive integer.")
+            return
+        if seed and not seed.isdigit():
+            messagebox.showerror("Error", "Seed must be an integer.")
+            return
 
-        ctk.CTkLabel(self.frame, text="If you enter more than one process type, the scheduler will only run the last type entered.",
-                     font=("Arial", 10, "bold"), text_color=self.colors['text']).pack(pady=10)
+        quantum = self.rr_quantum.get()
+        processes = generate_workload(int(count), tab, prefix="G",
+                                      seed=int(seed) if seed else None,
+                                      arrivals=self.arrivals_var.get(),
+                                      bursts=self.bursts_var.get(),
+                                      priorities=self.priorities_var.get(),
+                                      quanta=int(quantum) if quantum.isdigit() and int(quantum) > 0 else 2)
+        self.generated_processes[tab].extend(processes)
 
-        self.process_display = ctk.CTkFrame(self.frame, fg_color=colors['background'])
-        self.process_display.pack(pady=10, fill="both", expand=True)
+        summary = {
+            "Type": tab,
+            "Generated": f"{len(processes)} processes (G1-G{len(processes)})",
+            "Arrivals": self.arrivals_var.get(),
+            "Bursts": self.bursts_var.get(),
+            "Seed": seed or "random"
+        }
+        self.display_process(tab, summary, processes)
 
     def clear_process_by_selected_tab(self):
         tab = self.tabview.get()
         self.process_list[tab].clear()
+        self.generated_processes[tab].clear()
         for widget in self.process_widgets[tab]:
             widget.destroy()
         self.process_widgets[tab].clear()
@@ -132,7 +266,7 @@ class SchedulerPage(tk.Frame):
         self.process_list[tab].append(data)
         self.display_process(tab, data)
 
-    def display_process(self, tab, data):
+    def display_process(self, tab, data, generated=None):
         process_text = ', '.join([f"{k}: {v}" for k, v in data.items()])
         container = ctk.CTkFrame(self.process_display, fg_color="#0A0A0A",
                                  border_color="#CDA457", border_width=1, corner_radius=8)
@@ -140,17 +274,24 @@ class SchedulerPage(tk.Frame):
 
         label = ctk.CTkLabel(container, text=process_text, anchor="w", justify="left",
                              text_color=self.colors['text'])
+        self.theme.register(label, text_color='text')
         label.pack(side="left", padx=5, fill="x", expand=True)
 
         remove_btn = ctk.CTkButton(container, text="Remove", fg_color=self.colors['sign_out_bg'],
                                    text_color=self.colors['sign_out_fg'], width=80,
-                                   command=lambda: self.remove_process(tab, data, container))
+                                   command=lambda: self.remove_process(tab, data, container, generated))
+        self.theme.register(remove_btn, fg_color='sign_out_bg', text_color='sign_out_fg')
         remove_btn.pack(side="right", padx=5)
 
         self.process_widgets[tab].append(container)
 
-    def remove_process(self, tab, data, widget):
-        if data in self.process_list[tab]:
+    def remove_process(self, tab, data, widget, generated=None):
+        if generated is not None:
+            removed = {id(process) for process in generated}
+            self.generated_processes[tab] = [
+                process for process in self.generated_processes[tab] if id(process) not in removed
+            ]
+        elif data in self.process_list[tab]:
             self.process_list[tab].remove(data)
         widget.destroy()
         if widget in self.process_widgets[tab]:
@@ -169,6 +310,20 @@ class SchedulerPage(tk.Frame):
             entry_widget.delete(0, tk.END)
             entry_widget.insert(0, "2")
 
+    def validate_cores(self, event, entry_widget):
+        value = entry_widget.get()
+        if not value.isdigit() or int(value) <= 0:
+            messagebox.showerror("Error", "CPU cores must be a positive integer.")
+            entry_widget.delete(0, tk.END)
+            entry_widget.insert(0, "1")
+
+    def validate_switch_cost(self, event, entry_widget):
+        value = entry_widget.get()
+        if not value.isdigit():
+            messagebox.showerror("Error", "Switch cost must be a non-negative integer.")
+            entry_widget.delete(0, tk.END)
+            entry_widget.insert(0, "0")
+
     def get_formatted_processes(self):
         formatted = []
         tab = self.tabview.get()
@@ -177,22 +332,27 @@ class SchedulerPage(tk.Frame):
             arrival = int(process["Arrival Time"])
             burst = int(process["Burst Time"])
 
-            if tab == "FCFS":
-                formatted.append([name, burst, arrival])
+            if tab in ["FCFS", "MLFQ"]:
+                formatted.append(Process(name, burst, arrival))
             elif tab == "SJF":
                 preemptive = process.get("Scheduling Type", "Non-Preemptive") == "Preemptive"
-                formatted.append([name, burst, arrival, preemptive])
+                formatted.append(Process(name, burst, arrival, preemptive=preemptive))
             elif tab == "Priority":
                 priority = int(process["Priority"])
                 preemptive = process.get("Scheduling Type", "Non-Preemptive") == "Preemptive"
-                formatted.append([name, burst, arrival, priority, preemptive])
+                formatted.append(Process(name, burst, arrival, priority=priority, preemptive=preemptive))
             elif tab == "Round Robin":
                 quantum = int(process["Quantum"])
-                formatted.append([name, burst, arrival, quantum])
+                formatted.append(Process(name, burst, arrival, time_quantum=quantum))
+
+        if self.generated_processes[tab]:
+            mode = self.priority_var[tab].get() if tab in ["SJF", "Priority"] else None
+            formatted.extend(configure_processes(self.generated_processes[tab], tab, mode))
         return formatted
 
     def on_run_live_scheduler(self, process_list):
-        if all(len(v) == 0 for v in self.process_list.values()):
+        if all(len(v) == 0 for v in self.process_list.values()) and \
+                all(len(v) == 0 for v in self.generated_processes.values()):
             messagebox.showerror("Error", "Please enter processes.")
             return
 
@@ -200,7 +360,32 @@ class SchedulerPage(tk.Frame):
             current_tab = self.tabview.get()
             formatted_processes = self.get_formatted_processes()
             flag = self.live_scheduler_enabled.get()
-            self.navigate_live_scheduler(formatted_processes, current_tab, flag)
+            cores = self.cpu_cores.get().strip()
+            cores = int(cores) if cores.isdigit() and int(cores) > 0 else 1
+            switch_cost = self.switch_cost.get().strip()
+            switch_cost = int(switch_cost) if switch_cost.isdigit() else 0
+            scheduler_options = None
+            if current_tab == "MLFQ":
+                if cores > 1:
+                    messagebox.showerror("Error", "MLFQ runs on a single CPU core.")
+                    return
+                scheduler_options = self.get_mlfq_options()
+                if scheduler_options is None:
+                    return
+            self.navigate_live_scheduler(formatted_processes, current_tab, flag, cores=cores,
+                                         scheduler_options=scheduler_options, switch_cost=switch_cost)
+
+    def get_mlfq_options(self):
+        """Read the MLFQ level quanta and boost interval, or None after showing an error."""
+        quanta = [value.strip() for value in self.mlfq_quanta.get().split(",")]
+        if not quanta or not all(value.isdigit() and int(value) > 0 for value in quanta):
+            messagebox.showerror("Error", "Quanta must be positive integers separated by commas, e.g. 2,4,8.")
+            return None
+        boost = self.mlfq_boost.get().strip()
+        if boost and (not boost.isdigit() or int(boost) == 0):
+            messagebox.showerror("Error", "Boost interval must be a positive integer or empty.")
+            return None
+        return {'quanta': [int(value) for value in quanta], 'boost_interval': int(boost) if boost else None}
 
     def on_back_button_click(self):
         if self.navigate_home:
@@ -214,6 +399,8 @@ class SchedulerPage(tk.Frame):
                                  fg_color=self.colors['background'],
                                  text_color=self.colors['text'],
                                  placeholder_text_color=self.colors['text_secondary'])
+            self.theme.register(entry, fg_color='background', text_color='text',
+                                placeholder_text_color='text_secondary')
             entry.pack(pady=5)
             self.entries["FCFS"][field] = entry
             if field != "Process Name":
@@ -227,6 +414,8 @@ class SchedulerPage(tk.Frame):
                                  fg_color=self.colors['background'],
                                  text_color=self.colors['text'],
                                  placeholder_text_color=self.colors['text_secondary'])
+            self.theme.register(entry, fg_color='background', text_color='text',
+                                placeholder_text_color='text_secondary')
             entry.pack(pady=5)
             self.entries["SJF"][field] = entry
             if field != "Process Name":
@@ -234,11 +423,16 @@ class SchedulerPage(tk.Frame):
 
         self.priority_var["SJF"] = ctk.StringVar(value="Non-Preemptive")
         radio_frame = ctk.CTkFrame(self.tabview.tab("SJF"), fg_color=self.colors['background'])
+        self.theme.register(radio_frame, fg_color='background')
         radio_frame.pack(pady=5)
-        ctk.CTkRadioButton(radio_frame, text="Non-Preemptive", variable=self.priority_var["SJF"],
-                           value="Non-Preemptive", text_color=self.colors['text']).pack(side="left", padx=5)
-        ctk.CTkRadioButton(radio_frame, text="Preemptive", variable=self.priority_var["SJF"],
-                           value="Preemptive", text_color=self.colors['text']).pack(side="left", padx=20)
+        radio = ctk.CTkRadioButton(radio_frame, text="Non-Preemptive", variable=self.priority_var["SJF"],
+                                   value="Non-Preemptive", text_color=self.colors['text'])
+        self.theme.register(radio, text_color='text')
+        radio.pack(side="left", padx=5)
+        radio = ctk.CTkRadioButton(radio_frame, text="Preemptive", variable=self.priority_var["SJF"],
+                                   value="Preemptive", text_color=self.colors['text'])
+        self.theme.register(radio, text_color='text')
+        radio.pack(side="left", padx=20)
 
     def create_priority_tab(self):
         self.entries["Priority"] = {}
@@ -248,6 +442,8 @@ class SchedulerPage(tk.Frame):
                                  fg_color=self.colors['background'],
                                  text_color=self.colors['text'],
                                  placeholder_text_color=self.colors['text_secondary'])
+            self.theme.register(entry, fg_color='background', text_color='text',
+                                placeholder_text_color='text_secondary')
             entry.pack(pady=5)
             self.entries["Priority"][field] = entry
             if field != "Process Name":
@@ -255,24 +451,33 @@ class SchedulerPage(tk.Frame):
 
         self.priority_var["Priority"] = ctk.StringVar(value="Non-Preemptive")
         radio_frame = ctk.CTkFrame(self.tabview.tab("Priority"), fg_color=self.colors['background'])
+        self.theme.register(radio_frame, fg_color='background')
         radio_frame.pack(pady=5)
-        ctk.CTkRadioButton(radio_frame, text="Non-Preemptive", variable=self.priority_var["Priority"],
-                           value="Non-Preemptive", text_color=self.colors['text']).pack(side="left", padx=5)
-        ctk.CTkRadioButton(radio_frame, text="Preemptive", variable=self.priority_var["Priority"],
-                           value="Preemptive", text_color=self.colors['text']).pack(side="left", padx=20)
+        radio = ctk.CTkRadioButton(radio_frame, text="Non-Preemptive", variable=self.priority_var["Priority"],
+                                   value="Non-Preemptive", text_color=self.colors['text'])
+        self.theme.register(radio, text_color='text')
+        radio.pack(side="left", padx=5)
+        radio = ctk.CTkRadioButton(radio_frame, text="Preemptive", variable=self.priority_var["Priority"],
+                                   value="Preemptive", text_color=self.colors['text'])
+        self.theme.register(radio, text_color='text')
+        radio.pack(side="left", padx=20)
 
     def create_round_robin_tab(self):
         self.entries["Round Robin"] = {}
         quantum_settings_frame = ctk.CTkFrame(self.tabview.tab("Round Robin"), fg_color=self.colors['background'])
+        self.theme.register(quantum_settings_frame, fg_color='background')
         quantum_settings_frame.pack(pady=(10, 20), fill="x")
 
-        ctk.CTkLabel(quantum_settings_frame, text="Time Quantum (for all processes):",
-                     text_color=self.colors['text']).pack(side="left", padx=(10, 5))
+        label = ctk.CTkLabel(quantum_settings_frame, text="Time Quantum (for all processes):",
+                             text_color=self.colors['text'])
+        self.theme.register(label, text_color='text')
+        label.pack(side="left", padx=(10, 5))
 
         quantum_entry = ctk.CTkEntry(quantum_settings_frame, width=80,
                                      textvariable=self.rr_quantum,
                                      fg_color=self.colors['background'],
                                      text_color=self.colors['text'])
+        self.theme.register(quantum_entry, fg_color='background', text_color='text')
         quantum_entry.pack(side="left", padx=5)
         quantum_entry.bind("<FocusOut>", lambda e: self.validate_quantum(e, quantum_entry))
 
@@ -280,6 +485,7 @@ class SchedulerPage(tk.Frame):
                                        text="Process Details",
                                        font=("Arial", 12, "bold"),
                                        text_color=self.colors['text'])
+        self.theme.register(separator_label, text_color='text')
         separator_label.pack(pady=(0, 10))
 
         for field in ["Process Name", "Arrival Time", "Burst Time"]:
@@ -288,7 +494,55 @@ class SchedulerPage(tk.Frame):
                                  fg_color=self.colors['background'],
                                  text_color=self.colors['text'],
                                  placeholder_text_color=self.colors['text_secondary'])
+            self.theme.register(entry, fg_color='background', text_color='text',
+                                placeholder_text_color='text_secondary')
             entry.pack(pady=5)
             self.entries["Round Robin"][field] = entry
             if field != "Process Name":
                 entry.bind("<FocusOut>", lambda e, ent=entry: self.validate_integer_input(e, ent))
+
+    def create_mlfq_tab(self):
+        self.entries["MLFQ"] = {}
+        settings_frame = ctk.CTkFrame(self.tabview.tab("MLFQ"), fg_color=self.colors['background'])
+        self.theme.register(settings_frame, fg_color='background')
+        settings_frame.pack(pady=(10, 20), fill="x")
+
+        label = ctk.CTkLabel(settings_frame, text="Quanta per level:",
+                             text_color=self.colors['text'])
+        self.theme.register(label, text_color='text')
+        label.pack(side="left", padx=(10, 5))
+        entry = ctk.CTkEntry(settings_frame, width=100, textvariable=self.mlfq_quanta,
+                             fg_color=self.colors['background'],
+                             text_color=self.colors['text'])
+        self.theme.register(entry, fg_color='background', text_color='text')
+        entry.pack(side="left", padx=5)
+
+        label = ctk.CTkLabel(settings_frame, text="Boost every (blank = never):",
+                             text_color=self.colors['text'])
+        self.theme.register(label, text_color='text')
+        label.pack(side="left", padx=(20, 5))
+        entry = ctk.CTkEntry(settings_frame, width=80, textvariable=self.mlfq_boost,
+                             fg_color=self.colors['background'],
+                             text_color=self.colors['text'])
+        self.theme.register(entry, fg_color='background', text_color='text')
+        entry.pack(side="left", padx=5)
+
+        separator_label = ctk.CTkLabel(self.tabview.tab("MLFQ"),
+                                       text="Process Details",
+                                       font=("Arial", 12, "bold"),
+                                       text_color=self.colors['text'])
+        self.theme.register(separator_label, text_color='text')
+        separator_label.pack(pady=(0, 10))
+
+        for field in ["Process Name", "Arrival Time", "Burst Time"]:
+            entry = ctk.CTkEntry(self.tabview.tab("MLFQ"), width=400, height=40,
+                                 corner_radius=10, placeholder_text=field,
+                                 fg_color=self.colors['background'],
+                                 text_color=self.colors['text'],
+                                 placeholder_text_color=self.colors['text_secondary'])
+            self.theme.register(entry, fg_color='background', text_color='text',
+                                placeholder_text_color='text_secondary')
+            entry.pack(pady=5)
+            self.entries["MLFQ"][field] = entry
+            if field != "Process Name":
+                entry.bind("<FocusOut>", lambda e, ent=entry: self.validate_integer_input(e, ent))
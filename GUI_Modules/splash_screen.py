@@ -1,14 +1,17 @@
 import tkinter as tk
-from PIL import Image, ImageTk
-import time
 import ctypes
 
-from GUI_Modules.output import OutputPage
-from GUI_Modules.scheduler_page import SchedulerPage
-from GUI_Modules.home_screen import HomeScreen
-from GUI_Modules.live_scheduler_page import LiveSchedulerPage
+from GUI_Modules.asset_cache import fit_width, load_scaled_image
+from GUI_Modules.theme import ThemeRegistry
+from GUI_Modules.transitions import Transition
+
+# The pages (customtkinter, the Schedulers package and NumPy) are imported on
+# first navigation, so the splash screen is drawn before any of them loads
 
 class SplashScreenApp:
+    FADE_MS = 900   # Time budget of the splash fade (hold, then wipe)
+    SLIDE_MS = 250  # Time budget of a page slide
+
     def __init__(self, root):
         self.root = root
         self.root.title("TimeSlice")
@@ -20,6 +23,7 @@ class SplashScreenApp:
         self.logo_blue = "#3D8BAE"  # Blue from the clock
         self.logo_dark = "#1A1A1A"  # Dark color for text
         self.colors = self.get_theme_colors()
+        self.theme = ThemeRegistry(self.colors)  # Widgets recolored by toggle_theme
 
         # Set the title bar color to gold on Windows
         try:
@@ -40,11 +44,7 @@ class SplashScreenApp:
 
         # Add logo as the app icon
         try:
-            logo_icon = Image.open('logo.png')
-            # Resize for icon use
-            icon_size = (32, 32)
-            logo_icon = logo_icon.resize(icon_size, Image.LANCZOS)
-            self.icon_photo = ImageTk.PhotoImage(logo_icon)
+            self.icon_photo = load_scaled_image('logo.png', (32, 32), master=self.root)
             self.root.iconphoto(True, self.icon_photo)
         except Exception as e:
             print(f"Could not load app icon: {e}")
@@ -71,6 +71,7 @@ class SplashScreenApp:
         self.screens = []
         self.page_screens = {}  # Dictionary to track actual application pages
         self.home_screen = None  # Reference to home screen
+        self.transition = None  # Running screen animation, finished early by the next navigation
 
         # Create the logo screen
         self.create_logo_screen()
@@ -95,6 +96,7 @@ class SplashScreenApp:
 
             # Only resize screens, but don't trigger the transition logic
             if abs(old_width - self.window_width) > 10 or abs(old_height - self.window_height) > 10:
+                self.finish_transition()
                 for i, screen in enumerate(self.screens):
                     screen.place(x=0, y=0, width=self.window_width, height=self.window_height)
 
@@ -119,7 +121,9 @@ class SplashScreenApp:
                 'sign_out_bg': '#A03333',         # Darker red
                 'sign_out_fg': self.light_cream,  # Light text on red
                 'toggle_bg': '#8A7439',           # Darker gold
-                'toggle_fg': self.light_cream     # Light text
+                'toggle_fg': self.light_cream,    # Light text
+                'chart_bg': '#FFFFFF',            # Gantt chart canvas
+                'chart_fg': '#000000'             # Gantt chart labels and axis
             }
         else:
             # Light theme (though you might want to make dark the default)
@@ -132,13 +136,17 @@ class SplashScreenApp:
                 'sign_out_bg': '#A03333',         # Dark red
                 'sign_out_fg': self.light_cream,  # Light text
                 'toggle_bg': '#8A7439',           # Darker gold
-                'toggle_fg': self.light_cream     # Light text
+                'toggle_fg': self.light_cream,    # Light text
+                'chart_bg': '#FFFFFF',            # Gantt chart canvas
+                'chart_fg': '#000000'             # Gantt chart labels and axis
             }
 
     def show_home_screen(self):
         """Show the Home Screen"""
         if self.home_screen is None:
-            self.home_screen = HomeScreen(self.root, self.colors, self.show_scheduler_page, self.toggle_theme)
+            from GUI_Modules.home_screen import HomeScreen
+            self.home_screen = HomeScreen(self.root, self.colors, self.show_scheduler_page, self.toggle_theme,
+                                          theme=self.theme)
             self.screens.append(self.home_screen)
             self.page_screens['home'] = self.home_screen
 
@@ -167,8 +175,9 @@ class SplashScreenApp:
             # Create new scheduler page and store reference.
             # Note: Pass self.show_home_screen as navigate_home and
             # self.show_live_scheduler_page as navigate_live_scheduler.
+            from GUI_Modules.scheduler_page import SchedulerPage
             scheduler_page = SchedulerPage(self.root, self.colors, self.window_width, self.window_height,
-                                           self.show_home_screen, self.show_live_scheduler_page)
+                                           self.show_home_screen, self.show_live_scheduler_page, theme=self.theme)
             self.screens.append(scheduler_page)
             self.page_screens['scheduler'] = scheduler_page
 
@@ -178,8 +187,10 @@ class SplashScreenApp:
         self.slide_transition(self.screens[self.current_screen], scheduler_page, direction=direction)
         self.current_screen = self.screens.index(scheduler_page)
 
-    def show_live_scheduler_page(self, process_list, scheduler_type="FCFS", flag_live_scheduler=0, back_direction=None):
+    def show_live_scheduler_page(self, process_list, scheduler_type="FCFS", flag_live_scheduler=0, back_direction=None,
+                                 cores=1, scheduler_options=None, switch_cost=0):
         """Show the Live Scheduler Page"""
+        from GUI_Modules.live_scheduler_page import LiveSchedulerPage
         live_scheduler_page = None
 
         if 'live_scheduler' in self.page_screens:
@@ -188,8 +199,13 @@ class SplashScreenApp:
                 self.root, self.colors, self.window_width, self.window_height,
                 self.show_home_screen, process_list, scheduler_type, flag_live_scheduler,
                 navigate_to_output=self.show_output_page,
-                navigate_to_scheduler=self.show_scheduler_page
+                navigate_to_scheduler=self.show_scheduler_page,
+                cores=cores,
+                scheduler_options=scheduler_options,
+                switch_cost=switch_cost,
+                theme=self.theme
             )
+            self.theme.forget(self.page_screens['live_scheduler'])
             self.screens[self.screens.index(self.page_screens['live_scheduler'])] = live_scheduler_page
             self.page_screens['live_scheduler'] = live_scheduler_page
         else:
@@ -197,7 +213,11 @@ class SplashScreenApp:
                 self.root, self.colors, self.window_width, self.window_height,
                 self.show_home_screen, process_list, scheduler_type, flag_live_scheduler,
                 navigate_to_output=self.show_output_page,
-                navigate_to_scheduler=self.show_scheduler_page
+                navigate_to_scheduler=self.show_scheduler_page,
+                cores=cores,
+                scheduler_options=scheduler_options,
+                switch_cost=switch_cost,
+                theme=self.theme
             )
             self.screens.append(live_scheduler_page)
             self.page_screens['live_scheduler'] = live_scheduler_page
@@ -210,8 +230,10 @@ class SplashScreenApp:
         # Change title bar to black for live scheduler page
         self.set_title_bar_color("#000000")
 
-    def show_output_page(self, completed_processes=None, process_execution_history=None, process_list=None, scheduler_type=None):
+    def show_output_page(self, completed_processes=None, process_execution_history=None, process_list=None, scheduler_type=None,
+                         cores=1, scheduler_options=None, switch_cost=0):
         """Show the Output Page with scheduling results"""
+        from GUI_Modules.output import OutputPage
         output_page = None
 
         # Get the scheduler type from the current live scheduler page if not provided
@@ -227,7 +249,10 @@ class SplashScreenApp:
         back_to_scheduler_func = lambda back_direction=None: self.show_live_scheduler_page(
             current_process_list, 
             scheduler_type, 
-            back_direction=back_direction
+            back_direction=back_direction,
+            cores=cores,
+            scheduler_options=scheduler_options,
+            switch_cost=switch_cost
         )
 
         if 'output_page' in self.page_screens:
@@ -236,8 +261,11 @@ class SplashScreenApp:
                 self.root, self.colors, self.window_width, self.window_height,
                 self.show_home_screen,
                 back_to_scheduler_func,
-                completed_processes, process_execution_history, scheduler_type
+                completed_processes, process_execution_history, scheduler_type,
+                cores=cores,
+                theme=self.theme
             )
+            self.theme.forget(self.page_screens['output_page'])
             self.screens[self.screens.index(self.page_screens['output_page'])] = output_page
             self.page_screens['output_page'] = output_page
         else:
@@ -245,7 +273,9 @@ class SplashScreenApp:
                 self.root, self.colors, self.window_width, self.window_height,
                 self.show_home_screen,
                 back_to_scheduler_func,
-                completed_processes, process_execution_history, scheduler_type
+                completed_processes, process_execution_history, scheduler_type,
+                cores=cores,
+                theme=self.theme
             )
             self.screens.append(output_page)
             self.page_screens['output_page'] = output_page
@@ -264,30 +294,9 @@ class SplashScreenApp:
 
     def update_screen_colors(self):
         """Update colors of all existing screens"""
-        for screen in self.screens:
-            screen.configure(bg=self.colors['background'])
-            if hasattr(screen, 'update_colors'):
-                screen.update_colors(self.colors)
-            else:
-                self.update_widget_colors(screen)
-
-    def update_widget_colors(self, parent):
-        """Recursively update colors of all widgets"""
-        for widget in parent.winfo_children():
-            if isinstance(widget, tk.Label):
-                widget.configure(bg=self.colors['background'], fg=self.colors['text'])
-                if widget.cget('text').startswith("Activity item"):
-                    widget.configure(fg=self.colors['text_secondary'])
-            elif isinstance(widget, tk.Button):
-                if widget.cget('text') == "Toggle Theme":
-                    widget.configure(bg=self.colors['toggle_bg'], fg=self.colors['toggle_fg'])
-                elif widget.cget('text') == "Sign Out":
-                    widget.configure(bg=self.colors['sign_out_bg'], fg=self.colors['sign_out_fg'])
-                else:
-                    widget.configure(bg=self.colors['button_bg'], fg=self.colors['button_fg'])
-            elif isinstance(widget, tk.Frame):
-                widget.configure(bg=self.colors['background'])
-                self.update_widget_colors(widget)
+        # Only the widgets registered with the theme at creation are touched,
+        # in one configure call each, instead of walking every screen's widget tree
+        self.theme.apply(self.colors)
 
     def create_logo_screen(self):
         """Create the first screen with company logo"""
@@ -297,17 +306,9 @@ class SplashScreenApp:
         logo_container.place(relx=0.5, rely=0.5, anchor='center')
         
         try:
-            # Load the logo image without cropping
-            logo_img = Image.open('logo.png')  # Make sure this is the correct path to your logo
-            
-            # Calculate the proper size while maintaining aspect ratio
-            logo_width = min(self.window_width * 0.7, logo_img.width)
-            ratio = logo_width / logo_img.width
-            logo_height = logo_img.height * ratio
-            
-            # Resize while maintaining aspect ratio
-            logo_img = logo_img.resize((int(logo_width), int(logo_height)), Image.LANCZOS)
-            logo_photo = ImageTk.PhotoImage(logo_img)
+            # Load the logo image without cropping, scaled down to fit while maintaining aspect ratio
+            logo_size = fit_width('logo.png', self.window_width * 0.7)
+            logo_photo = load_scaled_image('logo.png', logo_size, master=self.root)
             
             logo_label = tk.Label(logo_container, image=logo_photo, bg="#000000")
             logo_label.image = logo_photo
@@ -327,65 +328,74 @@ class SplashScreenApp:
     def create_app_name_screen(self):
         """Create the second screen with app name"""
         name_frame = tk.Frame(self.root, bg=self.colors['background'])
+        self.theme.register(name_frame, bg='background')
         name_frame.place(x=0, y=0, width=self.window_width, height=self.window_height)
         name_frame.lower()
         app_name = tk.Label(name_frame, text="TIMESLICE", font=("Arial", 64, "bold"), bg=self.colors['background'],
                             fg=self.colors['text'])
+        self.theme.register(app_name, bg='background', fg='text')
         app_name.place(relx=0.5, rely=0.5, anchor='center')
         tagline = tk.Label(name_frame, text="EVERY SECOND COUNTS, EVERY PROCESS OPTIMIZED", font=("Arial", 10),
                            bg=self.colors['background'], fg=self.colors['text_secondary'])
+        self.theme.register(tagline, bg='background', fg='text_secondary')
         tagline.place(relx=0.5, rely=0.6, anchor='center')
         instruction = tk.Label(name_frame, text="Click anywhere or press any key to continue", font=("Arial", 12),
                                bg=self.colors['background'], fg=self.colors['text_secondary'])
+        self.theme.register(instruction, bg='background', fg='text_secondary')
         instruction.place(relx=0.5, rely=0.9, anchor='center')
         self.screens.append(name_frame)
 
+    def finish_transition(self):
+        """Jump a running screen animation to its end, so the next one starts from settled screens."""
+        if self.transition is not None:
+            self.transition.cancel()
+            self.transition = None
+
+    def start_transition(self, duration_ms, on_frame, on_done):
+        """Run a screen animation on the event loop; navigation returns immediately."""
+        self.transition = Transition(self.root, duration_ms, on_frame, on_done).start()
+
     def fade_transition(self, current_frame, next_frame):
         """Animate fade-out fade-in transition between screens"""
+        self.finish_transition()
         next_frame.place(x=0, y=0, width=self.window_width, height=self.window_height)
         next_frame.lift()
         overlay = tk.Frame(next_frame, bg=self.colors['background'])
         overlay.place(x=0, y=0, relwidth=1, relheight=1)
-        steps = 15
-        for i in range(steps):
-            alpha = 1 - (i / steps)
-            current_frame.update()
-            time.sleep(0.03)
-        for i in range(steps + 1):
-            alpha = i / steps
-            overlay.place_configure(relwidth=1 - alpha)
-            next_frame.update()
-            time.sleep(0.03)
-        overlay.destroy()
-        current_frame.place_forget()
+
+        def on_frame(progress):
+            # Hold the first half, then wipe the overlay away
+            overlay.place_configure(relwidth=1 - max(0.0, progress * 2 - 1))
+
+        def on_done():
+            overlay.destroy()
+            current_frame.place_forget()
+
+        self.start_transition(self.FADE_MS, on_frame, on_done)
 
     def slide_transition(self, current_frame, next_frame, direction="left"):
         """Animate slide transition between screens"""
-        if direction == "left":
-            next_frame.place(x=self.window_width, y=0, width=self.window_width, height=self.window_height)
-        elif direction == "right":
-            next_frame.place(x=-self.window_width, y=0, width=self.window_width, height=self.window_height)
-        else:
+        self.finish_transition()
+        if direction not in ("left", "right"):
             next_frame.place(x=0, y=0, width=self.window_width, height=self.window_height)
             current_frame.place_forget()
             return
 
-        next_frame.lift()
-        steps = 20
-        step_size = self.window_width // steps
-        for i in range(steps + 1):
-            if direction == "left":
-                current_x = -i * step_size
-                next_x = self.window_width + current_x
-            elif direction == "right":
-                current_x = i * step_size
-                next_x = -self.window_width + current_x
+        # The new screen comes in from the right when moving left and vice versa
+        sign = -1 if direction == "left" else 1
+
+        def on_frame(progress):
+            current_x = sign * round(progress * self.window_width)
             current_frame.place(x=current_x, y=0, width=self.window_width, height=self.window_height)
-            next_frame.place(x=next_x, y=0, width=self.window_width, height=self.window_height)
-            self.root.update()
-            time.sleep(0.01)
-        current_frame.place_forget()
-        next_frame.place(x=0, y=0, width=self.window_width, height=self.window_height)
+            next_frame.place(x=current_x - sign * self.window_width, y=0,
+                             width=self.window_width, height=self.window_height)
+
+        def on_done():
+            current_frame.place_forget()
+            next_frame.place(x=0, y=0, width=self.window_width, height=self.window_height)
+
+        next_frame.lift()
+        self.start_transition(self.SLIDE_MS, on_frame, on_done)
 
     def next_screen(self, event=None):
         """Move to the next screen when user interacts"""
@@ -409,8 +419,9 @@ class SplashScreenApp:
         """Set the title bar color for Windows 10/11"""
         try:
             if ctypes.windll:
-                # Windows-specific title bar color change
-                self.root.update()
+                # Windows-specific title bar color change; only pending idle work
+                # (the window itself) is needed, not a nested event loop
+                self.root.update_idletasks()
                 DWMWA_CAPTION_COLOR = 35
                 # Convert hex to BGR format (Windows uses BGR)
                 color_bgr = int('0x' + color_hex[5:7] + color_hex[3:5] + color_hex[1:3], 16)
@@ -0,0 +1,72 @@
+import tkinter as tk
+
+
+class ThemeRegistry:
+    """
+    Widgets and canvas items that follow the color theme, grouped by style role.
+
+    A widget signs up once, when it is created, with the palette key of each
+    of its color options, e.g. register(label, bg='background', fg='text').
+    apply() then reconfigures exactly the registered widgets in one pass,
+    without walking the widget tree or reading options back. Canvas owners
+    subscribe a callback that recolors their items by tag, so a canvas costs
+    one itemconfigure per role however many items it holds.
+    """
+
+    def __init__(self, colors):
+        self.colors = colors
+        self._roles = {}      # ((option, palette key), ...) -> widgets styled that way
+        self._listeners = []  # (owner widget, callback taking the new colors)
+
+    def register(self, widget, **roles):
+        """
+        Sign a widget up for theme changes.
+
+        Args:
+            widget: Tk or CustomTkinter widget
+            **roles: Palette key per color option, e.g. bg='background'
+
+        Returns:
+            The widget, so creation and registration fit in one expression
+        """
+        role = tuple(sorted(roles.items()))
+        self._roles.setdefault(role, []).append(widget)
+        return widget
+
+    def subscribe(self, owner, callback):
+        """Call callback(colors) on every theme change, until owner is forgotten or destroyed."""
+        self._listeners.append((owner, callback))
+
+    def forget(self, parent):
+        """Drop a widget and all its descendants and their subscriptions, e.g. a page that is being replaced."""
+        path = str(parent)
+        prefix = path + "."
+
+        def kept(widget):
+            return str(widget) != path and not str(widget).startswith(prefix)
+
+        for widgets in self._roles.values():
+            widgets[:] = [widget for widget in widgets if kept(widget)]
+        self._listeners = [(owner, callback) for owner, callback in self._listeners if kept(owner)]
+
+    def apply(self, colors):
+        """Recolor every registered widget and notify the subscribers."""
+        self.colors = colors
+        for role, widgets in self._roles.items():
+            options = {option: colors[key] for option, key in role}
+            alive = []
+            for widget in widgets:
+                try:
+                    widget.configure(**options)
+                except tk.TclError:
+                    continue  # Destroyed since it registered
+                alive.append(widget)
+            widgets[:] = alive
+        alive = []
+        for owner, callback in self._listeners:
+            try:
+                callback(colors)
+            except tk.TclError:
+                continue  # Owner destroyed since it subscribed
+            alive.append((owner, callback))
+        self._listeners = alive
@@ -0,0 +1,75 @@
+import time
+
+
+class Transition:
+    """
+    Frame-scheduled screen animation driven by after(), never blocking the event loop.
+
+    Every frame calls on_frame(progress) with progress from 0 to 1 taken from
+    the elapsed wall time, so the animation ends within its time budget no
+    matter how many frames the machine manages to draw. When a frame comes
+    later than 1 / min_fps seconds after the previous one, the rest of the
+    animation is skipped and the final frame is drawn at once. cancel() does
+    the same on request, so the screens always end up in their final places.
+    """
+    FRAME_MS = 16  # ~60 frames per second
+
+    def __init__(self, widget, duration_ms, on_frame, on_done=None, min_fps=20, clock=time.perf_counter):
+        """
+        Args:
+            widget: Any widget, used to schedule the frames
+            duration_ms: Time budget of the whole animation
+            on_frame: Called with the progress (0 to 1) on every frame
+            on_done: Called once after the final frame
+            min_fps: Frame rate below which the animation is skipped
+            clock: Timer function in seconds
+        """
+        self.widget = widget
+        self.duration = duration_ms / 1000
+        self.on_frame = on_frame
+        self.on_done = on_done
+        self.max_gap = 1 / min_fps
+        self.clock = clock
+        self.skipped = False
+        self.finished = False
+        self._start = None
+        self._last_frame = None
+        self._after_id = None
+
+    def start(self):
+        """Draw the first frame now and schedule the rest; returns the transition."""
+        self._start = self._last_frame = self.clock()
+        self._frame()
+        return self
+
+    def cancel(self):
+        """Stop animating and jump to the final frame."""
+        if not self.finished:
+            self.skipped = True
+            self._finish()
+
+    def _frame(self):
+        self._after_id = None
+        now = self.clock()
+        if now - self._last_frame > self.max_gap:
+            # Too slow to animate smoothly: finish at once instead of stuttering
+            self.skipped = True
+            self._finish()
+            return
+        self._last_frame = now
+
+        progress = min(1.0, (now - self._start) / self.duration) if self.duration > 0 else 1.0
+        if progress >= 1:
+            self._finish()
+            return
+        self.on_frame(progress)
+        self._after_id = self.widget.after(self.FRAME_MS, self._frame)
+
+    def _finish(self):
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+        self.finished = True
+        self.on_frame(1.0)
+        if self.on_done is not None:
+            self.on_done()
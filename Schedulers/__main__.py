@@ -0,0 +1,227 @@
+"""
+Headless command-line runner: python -m Schedulers WORKLOAD [options]
+or, with a synthetic workload: python -m Schedulers --generate N [options]
+
+Only the scheduling engine is imported (no tkinter, customtkinter or PIL),
+so this works on machines without a display.
+"""
+import argparse
+import json
+import sys
+
+from Schedulers.instrumentation import Instrumentation
+from Schedulers.metrics import DEFAULT_PERCENTILES, ScheduleMetrics
+from Schedulers.process import configure_processes
+from Schedulers.simulation import simulate
+from Schedulers.workload_generator import ARRIVALS, BURSTS, PRIORITIES, generate_workload
+from Schedulers.workload_io import load_workload, save_workload
+
+ALGORITHM_NAMES = {
+    'fcfs': "FCFS",
+    'sjf': "SJF",
+    'priority': "Priority",
+    'rr': "Round Robin",
+    'round-robin': "Round Robin",
+    'mlfq': "MLFQ",
+}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m Schedulers",
+        description="Run a CPU scheduling simulation without the GUI."
+    )
+    parser.add_argument('workload', nargs='?',
+                        help="CSV or JSON workload file (name, burst_time, arrival_time, ...)")
+    parser.add_argument('-g', '--generate', type=int, metavar='N',
+                        help="Simulate N synthetic processes instead of a workload file")
+    parser.add_argument('--seed', type=int, help="Random seed for --generate")
+    parser.add_argument('--arrivals', default='poisson', choices=ARRIVALS,
+                        help="Arrival process for --generate (default: poisson)")
+    parser.add_argument('--bursts', default='exponential', choices=BURSTS,
+                        help="Burst time distribution for --generate (default: exponential)")
+    parser.add_argument('--priorities', default='uniform', choices=PRIORITIES,
+                        help="Priority distribution for --generate (default: uniform)")
+    parser.add_argument('--save-workload', metavar='PATH',
+                        help="Also write the generated workload to a CSV or JSON file")
+    parser.add_argument('-a', '--algorithm', default='fcfs', choices=sorted(ALGORITHM_NAMES),
+                        help="Scheduling algorithm (default: fcfs)")
+    parser.add_argument('-p', '--preemptive', action='store_true',
+                        help="Preemptive mode for SJF and Priority")
+    parser.add_argument('-q', '--quantum', type=int,
+                        help="Round Robin time quantum (default: from the workload, else 2)")
+    parser.add_argument('--mlfq-quanta', type=int, nargs='+', metavar='Q',
+                        help="MLFQ time quantum per level, top level first (default: 2 4 8)")
+    parser.add_argument('--boost-interval', type=int,
+                        help="MLFQ time between priority boosts (default: no boost)")
+    parser.add_argument('--switch-cost', type=int, default=0,
+                        help="CPU time of every context switch (default: 0)")
+    parser.add_argument('-c', '--cores', type=int, default=1,
+                        help="CPU cores sharing one ready queue (default: 1)")
+    parser.add_argument('--local-queues', action='store_true',
+                        help="Give every core its own run queue with work stealing instead of one global queue")
+    parser.add_argument('--migration-cost', type=int, default=0,
+                        help="Cache warmup time after a process moves to another core (default: 0)")
+    parser.add_argument('--balance-interval', type=int,
+                        help="Time between periodic rebalances of the local queues (default: only steal)")
+    parser.add_argument('--affinity', action='append', default=[], metavar='NAME=CORES',
+                        help="Cores a process may run on with --local-queues, e.g. P1=0,1 (repeatable)")
+    parser.add_argument('--percentiles', type=float, nargs='+', default=list(DEFAULT_PERCENTILES),
+                        help="Percentiles to report (default: 50 90 99)")
+    parser.add_argument('--processes', action='store_true', help="Print per-process statistics")
+    parser.add_argument('--gantt', action='store_true', help="Print the Gantt chart segments")
+    parser.add_argument('-o', '--output', help="Write metrics and Gantt segments to this JSON file")
+    parser.add_argument('--profile', action='store_true',
+                        help="Print scheduler counters and timings (queue updates, decisions, preemptions, ...)")
+    parser.add_argument('--trace', metavar='PATH',
+                        help="Write the profile and a per-event trace to this JSON file")
+    args = parser.parse_args(argv)
+    if (args.workload is None) == (args.generate is None):
+        parser.error("give either a workload file or --generate N")
+    if args.generate is not None and args.generate <= 0:
+        parser.error("--generate must be positive")
+    if args.quantum is not None and args.quantum <= 0:
+        parser.error("--quantum must be positive")
+    if args.cores < 1:
+        parser.error("--cores must be at least 1")
+    if args.mlfq_quanta is not None and min(args.mlfq_quanta) <= 0:
+        parser.error("--mlfq-quanta must be positive")
+    if args.boost_interval is not None and args.boost_interval <= 0:
+        parser.error("--boost-interval must be positive")
+    if args.algorithm == 'mlfq' and args.cores > 1:
+        parser.error("MLFQ runs on a single core")
+    if args.switch_cost < 0:
+        parser.error("--switch-cost cannot be negative")
+    if args.migration_cost < 0:
+        parser.error("--migration-cost cannot be negative")
+    if args.balance_interval is not None and args.balance_interval <= 0:
+        parser.error("--balance-interval must be positive")
+    if (args.balance_interval is not None or args.affinity) and not args.local_queues:
+        parser.error("--balance-interval and --affinity need --local-queues")
+    try:
+        args.affinity = parse_affinity(args.affinity, args.cores)
+    except ValueError as e:
+        parser.error(f"--affinity: {e}")
+    return args
+
+
+def parse_affinity(values, cores):
+    """Turn NAME=CORES options (cores comma separated) into a dict of name -> set of cores."""
+    affinity = {}
+    for value in values:
+        name, _, allowed = value.partition('=')
+        if not name or not allowed:
+            raise ValueError(f"expected NAME=CORES, got {value!r}")
+        allowed = {int(core) for core in allowed.split(',')}
+        if not all(0 <= core < cores for core in allowed):
+            raise ValueError(f"cores of {name} must be between 0 and {cores - 1}")
+        affinity[name] = allowed
+    return affinity
+
+
+def print_report(algorithm, mode, summary, metrics, history, show_processes, show_gantt, out=sys.stdout,
+                 core_stats=None, overhead_stats=None):
+    title = f"{algorithm} ({mode})" if mode else algorithm
+    print(f"Algorithm: {title}", file=out)
+    print(f"Processes: {summary['processes']}", file=out)
+    for key, value in summary.items():
+        if key != 'processes':
+            print(f"{key}: {value:.2f}", file=out)
+
+    if core_stats is not None:
+        print(f"migrations: {core_stats['migrations']}", file=out)
+        print(f"imbalance: {core_stats['imbalance']:.4f}", file=out)
+        for core, utilization in enumerate(core_stats['utilization']):
+            print(f"utilization_cpu{core}: {utilization:.2%}", file=out)
+
+    if overhead_stats is not None:
+        print(f"context_switches: {overhead_stats['switches']}", file=out)
+        print(f"switch_time: {overhead_stats['switch_time']}", file=out)
+        print(f"warmup_time: {overhead_stats['warmup_time']}", file=out)
+        print(f"cpu_efficiency: {overhead_stats['cpu_efficiency']:.2%}", file=out)
+        print(f"switch_overhead: {overhead_stats['switch_overhead']:.2%}", file=out)
+
+    if show_processes:
+        print(file=out)
+        print(f"{'Process':<12}{'Arrival':>10}{'Burst':>10}{'Completion':>12}{'Turnaround':>12}{'Waiting':>10}",
+              file=out)
+        for stats in metrics.process_stats().values():
+            print(f"{stats['name']:<12}{stats['arrival_time']:>10}{stats['burst_time']:>10}"
+                  f"{stats['completion_time']:>12}{stats['turnaround_time']:>12}{stats['waiting_time']:>10}",
+                  file=out)
+
+    if show_gantt:
+        print(file=out)
+        for entry in history:
+            # Multi-core entries end with the core
+            print(" ".join(map(str, entry)), file=out)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    algorithm = ALGORITHM_NAMES[args.algorithm]
+    mode = None
+    if algorithm in ["SJF", "Priority"]:
+        mode = "Preemptive" if args.preemptive else "Non-Preemptive"
+
+    if args.generate is not None:
+        processes = generate_workload(args.generate, algorithm, seed=args.seed, arrivals=args.arrivals,
+                                      bursts=args.bursts, priorities=args.priorities,
+                                      quanta=args.quantum or 2)
+        if args.save_workload:
+            save_workload(processes, args.save_workload)
+    else:
+        try:
+            processes = load_workload(args.workload)
+        except (OSError, ValueError) as e:
+            print(f"Error: cannot load {args.workload}: {e}", file=sys.stderr)
+            return 1
+
+    processes = configure_processes(processes, algorithm, mode, args.quantum)
+    instrumentation = Instrumentation(trace=bool(args.trace)) if args.profile or args.trace else None
+    scheduler_options = None
+    if algorithm == "MLFQ":
+        scheduler_options = {'boost_interval': args.boost_interval}
+        if args.mlfq_quanta:
+            scheduler_options['quanta'] = args.mlfq_quanta
+    history, completed = simulate(processes, algorithm, instrumentation=instrumentation, cores=args.cores,
+                                  local_queues=args.local_queues, migration_cost=args.migration_cost,
+                                  balance_interval=args.balance_interval, affinity=args.affinity,
+                                  scheduler_options=scheduler_options, switch_cost=args.switch_cost)
+    metrics = ScheduleMetrics(completed, history)
+    summary = metrics.summary(tuple(args.percentiles))
+    core_stats = metrics.core_stats(args.cores) if args.cores > 1 else None
+    overhead_stats = metrics.overhead_stats() if args.switch_cost or args.migration_cost else None
+
+    print_report(algorithm, mode, summary, metrics, history, args.processes, args.gantt, core_stats=core_stats,
+                 overhead_stats=overhead_stats)
+
+    if args.profile:
+        print()
+        for key, value in instrumentation.summary().items():
+            print(f"{key}: {value:.6f}" if isinstance(value, float) else f"{key}: {value}")
+    if args.trace:
+        instrumentation.export(args.trace)
+
+    if args.output:
+        result = {
+            'algorithm': algorithm,
+            'mode': mode,
+            'quantum': args.quantum,
+            'scheduler_options': scheduler_options,
+            'cores': args.cores,
+            'local_queues': args.local_queues,
+            'summary': summary,
+            'core_stats': core_stats,
+            'switch_cost': args.switch_cost,
+            'overhead_stats': overhead_stats,
+            'processes': list(metrics.process_stats().values()),
+            'gantt': [list(segment) for segment in history],
+        }
+        with open(args.output, 'w') as f:
+            json.dump(result, f)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
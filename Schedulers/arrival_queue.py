@@ -0,0 +1,91 @@
+import heapq
+import itertools
+from bisect import bisect_left
+from itertools import islice
+
+
+class ArrivalQueue:
+    def __init__(self, processes):
+        """
+        Waiting queue of processes that have not arrived yet.
+
+        Processes are sorted by arrival time once; a cursor marks the first
+        process that has not arrived, so each update only touches the
+        processes that arrive in it.
+
+        Args:
+            processes: Iterable of Process records
+        """
+        # Stable sort keeps the input order for equal arrival times
+        self._processes = sorted(processes, key=lambda x: x.arrival_time)
+        self._cursor = 0
+        # Processes inserted during a run: heap of (arrival_time, insertion order, process)
+        self._inserted = []
+        self._counter = itertools.count()
+
+    def insert(self, process):
+        """Add a process that was not in the initial list in O(log n)."""
+        heapq.heappush(self._inserted, (process.arrival_time, next(self._counter), process))
+
+    def pop_arrived(self, current_time):
+        """Remove and return, in arrival order, every process with arrival <= current_time."""
+        processes = self._processes
+        start = end = self._cursor
+        count = len(processes)
+        while end < count and processes[end].arrival_time <= current_time:
+            end += 1
+        self._cursor = end
+        arrived = processes[start:end]
+
+        inserted = self._inserted
+        if inserted and inserted[0][0] <= current_time:
+            late = []
+            while inserted and inserted[0][0] <= current_time:
+                late.append(heapq.heappop(inserted)[-1])
+            # Stable merge: on equal arrival times the initial processes come first
+            arrived = sorted(arrived + late, key=lambda x: x.arrival_time) if arrived else late
+        return arrived
+
+    def next_arrival_time(self):
+        """Arrival time of the next waiting process in O(1), or None if none are left."""
+        next_time = None
+        if self._cursor < len(self._processes):
+            next_time = self._processes[self._cursor].arrival_time
+        if self._inserted and (next_time is None or self._inserted[0][0] < next_time):
+            next_time = self._inserted[0][0]
+        return next_time
+
+    def remove(self, process):
+        """Remove a waiting process, found by bisecting on its arrival time."""
+        processes = self._processes
+        i = bisect_left(processes, process.arrival_time, self._cursor, key=lambda x: x.arrival_time)
+        while i < len(processes) and processes[i].arrival_time == process.arrival_time:
+            if processes[i].pid == process.pid:
+                del processes[i]
+                return True
+            i += 1
+
+        for i, entry in enumerate(self._inserted):
+            if entry[-1].pid == process.pid:
+                self._inserted[i] = self._inserted[-1]
+                self._inserted.pop()
+                heapq.heapify(self._inserted)
+                return True
+        return False
+
+    def clear(self):
+        self._processes = []
+        self._cursor = 0
+        self._inserted = []
+
+    def __len__(self):
+        return len(self._processes) - self._cursor + len(self._inserted)
+
+    def __bool__(self):
+        return self._cursor < len(self._processes) or bool(self._inserted)
+
+    def __iter__(self):
+        """Iterate over waiting processes in arrival order."""
+        inserted = (entry[-1] for entry in sorted(self._inserted))
+        return heapq.merge(islice(self._processes, self._cursor, None), inserted,
+                           key=lambda x: x.arrival_time)
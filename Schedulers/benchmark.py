@@ -0,0 +1,243 @@
+"""
+Benchmark every scheduler and mode on standard synthetic workloads.
+
+    python -m Schedulers.benchmark [--sizes 100 1000 ...] [-o results.json] [--compare old.json]
+
+Each run records wall time, scheduling decisions (Gantt segments) per second
+and peak traced memory. Results are saved as JSON; --compare matches them
+against an earlier file and exits with status 1 when a configuration got
+slower than the threshold, so regressions between commits can be caught
+automatically.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+
+from Schedulers.process import configure_processes
+from Schedulers.simulation import simulate
+from Schedulers.workload_generator import generate_workload
+
+STANDARD_SIZES = (100, 1_000, 10_000, 100_000, 1_000_000)
+
+# Arrival rate 0.5 with mean burst 5 overloads the CPU, so ready queues grow with
+# the workload and O(n) queue operations show up in the timings
+STANDARD_WORKLOADS = {
+    'poisson': {'arrivals': "poisson", 'bursts': "exponential"},
+    'bursty': {'arrivals': "bursty", 'bursts': "pareto"},
+}
+
+CONFIGURATIONS = (
+    ("FCFS", None),
+    ("SJF", "Non-Preemptive"),
+    ("SJF", "Preemptive"),
+    ("Priority", "Non-Preemptive"),
+    ("Priority", "Preemptive"),
+    ("Round Robin", None),
+    ("MLFQ", None),
+)
+
+# tick steps one time unit at a time, event jumps between scheduling events and
+# instant uses the closed-form solvers where one exists (FCFS, non-preemptive SJF)
+ENGINES = ("event", "tick", "instant")
+
+SEED = 2024
+KEY_FIELDS = ('workload', 'size', 'algorithm', 'mode', 'engine')
+
+
+def has_instant_solver(algorithm, mode):
+    return algorithm == "FCFS" or (algorithm == "SJF" and mode == "Non-Preemptive")
+
+
+def run_once(processes, algorithm, engine, trace_memory=False):
+    """
+    Simulate one configuration.
+
+    Returns:
+        Tuple of (wall_time, decisions, peak_memory); peak_memory is None unless traced
+    """
+    event_driven = engine != "tick"
+    instant = engine == "instant"
+    if trace_memory:
+        tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        history, _ = simulate(processes, algorithm, event_driven=event_driven, instant=instant)
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] if trace_memory else None
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+    return elapsed, len(history), peak
+
+
+def run_benchmarks(sizes=STANDARD_SIZES, workloads=('poisson',), engines=ENGINES,
+                   configurations=CONFIGURATIONS, tick_limit=10_000, repeat=1, trace_memory=True,
+                   log=None):
+    """
+    Run the benchmark grid and return one result row per configuration.
+
+    Args:
+        sizes: Process counts to benchmark
+        workloads: Names from STANDARD_WORKLOADS
+        engines: Simulation engines to time ("event", "tick", "instant")
+        configurations: (algorithm, mode) pairs
+        tick_limit: Largest size run with the tick engine, which slows down with the makespan
+        repeat: Timed runs per configuration; the fastest one is reported
+        trace_memory: Measure peak memory in a separate traced run (tracing slows the run down)
+        log: Optional file to print progress to
+
+    Returns:
+        List of dicts with the configuration, wall_time, decisions,
+        decisions_per_second and peak_memory (bytes, None when not traced)
+    """
+    results = []
+    for workload in workloads:
+        for size in sizes:
+            base = generate_workload(size, "Priority", seed=SEED, **STANDARD_WORKLOADS[workload])
+            for algorithm, mode in configurations:
+                processes = configure_processes(base, algorithm, mode)
+                for engine in engines:
+                    if engine == "tick" and size > tick_limit:
+                        continue
+                    if engine == "instant" and not has_instant_solver(algorithm, mode):
+                        continue
+
+                    runs = [run_once(processes, algorithm, engine) for _ in range(repeat)]
+                    wall_time = min(elapsed for elapsed, _, _ in runs)
+                    decisions = runs[0][1]
+                    peak = run_once(processes, algorithm, engine, trace_memory=True)[2] \
+                        if trace_memory else None
+
+                    row = {
+                        'workload': workload,
+                        'size': size,
+                        'algorithm': algorithm,
+                        'mode': mode,
+                        'engine': engine,
+                        'wall_time': wall_time,
+                        'decisions': decisions,
+                        'decisions_per_second': decisions / wall_time if wall_time > 0 else None,
+                        'peak_memory': peak,
+                    }
+                    results.append(row)
+                    if log is not None:
+                        print(format_row(row), file=log, flush=True)
+    return results
+
+
+def environment():
+    """Metadata stored with the results so runs on different machines are not mixed up."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)),
+                                timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+    }
+
+
+def row_key(row):
+    return tuple(row[field] for field in KEY_FIELDS)
+
+
+def compare_results(old_results, new_results, threshold=1.25):
+    """
+    Match two result lists by configuration and compare wall times.
+
+    Returns:
+        List of (new_row, old_wall_time, ratio, regressed) for configurations
+        present in both; ratio is new / old wall time
+    """
+    old_times = {row_key(row): row['wall_time'] for row in old_results}
+    comparison = []
+    for row in new_results:
+        old_time = old_times.get(row_key(row))
+        if old_time is None or old_time <= 0:
+            continue
+        ratio = row['wall_time'] / old_time
+        comparison.append((row, old_time, ratio, ratio > threshold))
+    return comparison
+
+
+def describe(row):
+    algorithm = f"{row['algorithm']} ({row['mode']})" if row['mode'] else row['algorithm']
+    return f"{row['workload']:<8}{row['size']:>9}  {algorithm:<26}{row['engine']:<8}"
+
+
+def format_row(row):
+    rate = row['decisions_per_second']
+    memory = f"{row['peak_memory'] / 2**20:9.1f} MiB" if row['peak_memory'] is not None else ""
+    return (f"{describe(row)}{row['wall_time']:10.4f} s{row['decisions']:>10}"
+            f"{rate if rate is not None else 0:>14,.0f}/s{memory}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m Schedulers.benchmark",
+                                     description="Benchmark the schedulers on synthetic workloads.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(STANDARD_SIZES),
+                        help="Process counts (default: 100 to 1000000)")
+    parser.add_argument('--workloads', nargs='+', default=['poisson'], choices=sorted(STANDARD_WORKLOADS),
+                        help="Standard workloads to run (default: poisson)")
+    parser.add_argument('--engines', nargs='+', default=list(ENGINES), choices=ENGINES,
+                        help="Simulation engines to time (default: all)")
+    parser.add_argument('--tick-limit', type=int, default=10_000,
+                        help="Largest size run with the tick engine (default: 10000)")
+    parser.add_argument('--repeat', type=int, default=1, help="Timed runs per configuration, fastest is kept")
+    parser.add_argument('--no-memory', action='store_true', help="Skip the traced peak-memory run")
+    parser.add_argument('-o', '--output', help="Write the results to this JSON file")
+    parser.add_argument('--compare', metavar='OLD_JSON', help="Compare against an earlier results file")
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help="Slowdown ratio reported as a regression (default: 1.25)")
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    baseline = None
+    if args.compare:
+        try:
+            with open(args.compare) as f:
+                baseline = json.load(f)['results']
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Error: cannot read {args.compare}: {e}", file=sys.stderr)
+            return 1
+
+    results = run_benchmarks(args.sizes, args.workloads, args.engines, tick_limit=args.tick_limit,
+                             repeat=args.repeat, trace_memory=not args.no_memory, log=sys.stdout)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'environment': environment(), 'results': results}, f, indent=1)
+
+    if baseline is None:
+        return 0
+    print()
+    regressions = 0
+    for row, old_time, ratio, regressed in compare_results(baseline, results, args.threshold):
+        regressions += regressed
+        print(f"{describe(row)}{old_time:10.4f} s ->{row['wall_time']:10.4f} s  x{ratio:.2f}"
+              f"{'  REGRESSION' if regressed else ''}")
+    print(f"{regressions} regression(s) above x{args.threshold}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,33 +1,34 @@
+from collections import deque
+from itertools import accumulate, chain
+from operator import add, sub
+
+from Schedulers.arrival_queue import ArrivalQueue
+
+
 class FCFSScheduler:
     def __init__(self, processes):
         """
         Initialize the FCFS Scheduler
         
         Args:
-            processes: List of process tuples (name, burst_time, arrival_time)
+            processes: List of Process records
         """
-        self.waiting_queue = list(processes)
-        self.ready_queue = []
-        # Sort initially by arrival time
-        self.waiting_queue.sort(key=lambda x: x[2])
+        # Waiting queue sorted by arrival time, consumed through a cursor
+        self.waiting_queue = ArrivalQueue(processes)
+        self.ready_queue = deque()  # O(1) at both ends
         
     def update_queues(self, current_time):
         """Move arrived processes from waiting to ready queue."""
-        newly_arrived = []
-        still_waiting = []
-        
-        for proc in self.waiting_queue:
-            if proc[2] <= current_time:  # Check arrival time
-                newly_arrived.append(proc)
-            else:
-                still_waiting.append(proc)
-                
-        self.waiting_queue = still_waiting
+        newly_arrived = self.waiting_queue.pop_arrived(current_time)
         for proc in newly_arrived:
             self.ready_queue.append(proc)
             
         return newly_arrived
     
+    def add_process(self, process):
+        """Inject a new arrival into a running schedule in O(log n); it is queued on arrival."""
+        self.waiting_queue.insert(process)
+
     def run(self, current_time):
         """
         FCFS: Select the first process that arrived.
@@ -39,11 +40,45 @@ class FCFSScheduler:
             return None, 0
             
         # FCFS just takes the first process in the ready queue
-        selected_process = self.ready_queue.pop(0)
-        remaining_time = selected_process[1]  # Burst time
+        selected_process = self.ready_queue.popleft()
+        remaining_time = selected_process.remaining_time
         
         return selected_process, remaining_time
         
+    @staticmethod
+    def solve(processes):
+        """
+        Instant FCFS: compute the whole schedule in closed form, without ticks.
+
+        With processes sorted by arrival and S the prefix sums of their bursts,
+        process i finishes at S[i] + max(0, max over k <= i of (arrival[k] - S[k-1])).
+
+        Args:
+            processes: List of Process records
+
+        Returns:
+            Tuple of (process_execution_history, completed_processes), the same
+            as SchedulerSimulation.run() produces for FCFS
+        """
+        ordered = sorted((proc.copy() for proc in processes), key=lambda x: x.arrival_time)
+        # The simulation always runs a dispatched process for at least one time unit
+        bursts = [max(1, proc.burst_time) for proc in ordered]
+        totals = list(accumulate(bursts))
+        offsets = map(sub, (proc.arrival_time for proc in ordered), chain((0,), totals))
+        latest_offsets = accumulate(offsets, max, initial=0)
+        next(latest_offsets)  # Drop the initial CPU-free time of 0
+        ends = map(add, totals, latest_offsets)
+
+        history = []
+        for proc, burst, end in zip(ordered, bursts, ends):
+            history.append((proc.name, end - burst, end, "running", proc.pid))
+            proc.remaining_time = 0
+        return history, ordered
+
+    def next_arrival_time(self):
+        """Arrival time of the next process still in the waiting queue, or None."""
+        return self.waiting_queue.next_arrival_time()
+
     def is_done(self):
         """Check if scheduler has completed all processes."""
         return len(self.waiting_queue) == 0 and len(self.ready_queue) == 0
\ No newline at end of file
@@ -0,0 +1,168 @@
+import json
+import time
+from contextlib import contextmanager
+
+TRACE_FIELDS = ('time', 'event', 'process', 'ready_queue')
+
+
+class Instrumentation:
+    def __init__(self, trace=False, clock=time.perf_counter):
+        """
+        Opt-in counters, timers and event trace for a SchedulerSimulation.
+
+        attach() wraps the methods of one simulation and its scheduler on the
+        instance, so runs without instrumentation execute exactly the
+        original code and pay nothing.
+
+        Args:
+            trace: Also record every dispatch, preemption, completion and idle gap
+            clock: Timer function in seconds
+        """
+        self.clock = clock
+        self.trace = [] if trace else None
+
+        self.decisions = 0         # _dispatch calls
+        self.dispatches = 0        # New running segments (switch and warmup segments excluded)
+        self.context_switches = 0  # Dispatches that replace a different process on a core
+        self.preemptions = 0       # Processes taken off the CPU before they finished
+        self.completions = 0
+        self.idle_ticks = 0        # Time units with nothing running on any core
+        self.update_queues_time = 0.0
+        self.decision_time = 0.0   # Time choosing the next process, update_queues excluded
+        self.ready_samples = 0
+        self.ready_total = 0
+        self.ready_max = 0
+        self.timers = {}           # Extra named timers (e.g. "render"), see timed()
+
+        self._last_names = {}      # Core -> process that held it most recently
+
+    def attach(self, simulation):
+        """Instrument one SchedulerSimulation instance; returns the simulation."""
+        scheduler = simulation.scheduler
+        update_queues = scheduler.update_queues
+        dispatch = simulation._dispatch
+        history = simulation.process_execution_history
+        clock = self.clock
+
+        def timed_update_queues(current_time):
+            start = clock()
+            update_queues(current_time)
+            self.update_queues_time += clock() - start
+
+        def instrumented_dispatch():
+            previous = simulation.running()
+            segments = len(history)
+            update_time = self.update_queues_time
+            start = clock()
+            dispatch()
+            elapsed = clock() - start
+            self.decision_time += elapsed - (self.update_queues_time - update_time)
+            self.decisions += 1
+
+            ready = simulation.ready_count()
+            self.ready_samples += 1
+            self.ready_total += ready
+            if ready > self.ready_max:
+                self.ready_max = ready
+
+            if len(history) == segments:
+                return
+            now = simulation.current_time
+            # A completed process is cleared before the next dispatch, so a replaced one was preempted
+            for before, after in zip(previous, simulation.running()):
+                if before is not None and after is not before:
+                    self.preemptions += 1
+                    self._record(now, "preempt", before.name, ready)
+            for entry in history[segments:]:
+                if entry[3] != "running":
+                    continue
+                name = entry[0]
+                core = entry[5] if len(entry) > 5 else 0
+                last_name = self._last_names.get(core)
+                if last_name is not None and last_name != name:
+                    self.context_switches += 1
+                self.dispatches += 1
+                self._last_names[core] = name
+                self._record(now, "dispatch", name, ready)
+
+        def instrumented(advance):
+            def wrapper():
+                start_time = simulation.current_time
+                completed = len(simulation.completed_processes)
+                advanced = advance()
+                if advanced:
+                    self._after_advance(simulation, start_time, completed)
+                return advanced
+            return wrapper
+
+        def instrumented_skip_idle():
+            start_time = simulation.current_time
+            skipped = skip_idle()
+            if skipped:
+                self._add_idle(start_time, simulation.current_time, simulation.ready_count())
+            return skipped
+
+        skip_idle = simulation.skip_idle
+        scheduler.update_queues = timed_update_queues
+        simulation._dispatch = instrumented_dispatch
+        simulation.step = instrumented(simulation.step)
+        simulation.step_to_next_event = instrumented(simulation.step_to_next_event)
+        simulation.skip_idle = instrumented_skip_idle
+        return simulation
+
+    @contextmanager
+    def timed(self, name):
+        """Add the time spent in the with-block to timers[name]."""
+        start = self.clock()
+        try:
+            yield
+        finally:
+            self.timers[name] = self.timers.get(name, 0.0) + self.clock() - start
+
+    def summary(self):
+        """Counters and timers as a flat dict (times in seconds)."""
+        summary = {
+            'decisions': self.decisions,
+            'dispatches': self.dispatches,
+            'context_switches': self.context_switches,
+            'preemptions': self.preemptions,
+            'completions': self.completions,
+            'idle_ticks': self.idle_ticks,
+            'update_queues_time': self.update_queues_time,
+            'decision_time': self.decision_time,
+            'avg_ready_queue': self.ready_total / self.ready_samples if self.ready_samples else 0.0,
+            'max_ready_queue': self.ready_max,
+        }
+        for name, elapsed in self.timers.items():
+            summary[f'{name}_time'] = elapsed
+        return summary
+
+    def export(self, path):
+        """Write the summary, and the trace if one was recorded, to a JSON file."""
+        result = {'summary': self.summary()}
+        if self.trace is not None:
+            result['trace_fields'] = list(TRACE_FIELDS)
+            result['trace'] = self.trace
+        with open(path, 'w') as f:
+            json.dump(result, f)
+
+    def _after_advance(self, simulation, start_time, completed):
+        """Record the completions of a step, or count its time as idle if no core was busy."""
+        finished = simulation.completed_processes[completed:]
+        ready = simulation.ready_count()
+        for proc in finished:
+            self.completions += 1
+            self._record(simulation.current_time, "complete", proc.name, ready)
+        if not finished and not any(simulation.running()):
+            self._add_idle(start_time, simulation.current_time, ready)
+
+    def _add_idle(self, start, end, ready):
+        self.idle_ticks += end - start
+        # One trace event per idle gap, not per idle tick
+        if self.trace and self.trace[-1][1] == "idle":
+            return
+        self._record(start, "idle", None, ready)
+
+    def _record(self, now, event, process, ready):
+        if self.trace is not None:
+            self.trace.append((now, event, process, ready))
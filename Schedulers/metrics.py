@@ -0,0 +1,192 @@
+from itertools import repeat
+from operator import itemgetter
+
+import numpy as np
+
+DEFAULT_PERCENTILES = (50, 90, 99)
+
+
+class ScheduleMetrics:
+    def __init__(self, completed_processes, process_execution_history):
+        """
+        Columnar view of a finished run with vectorized per-process metrics.
+
+        Process columns (ids, arrival, burst, priority, completion, ...) are
+        NumPy arrays aligned with names; segment columns hold the "running"
+        segments of the history as process index, start, end and core arrays.
+        The "switch" and "warmup" overhead segments are only summed up.
+
+        Args:
+            completed_processes: List of completed Process records
+            process_execution_history: List of (process_name, start_time, end_time, status, pid),
+                multi-core runs add the core as a sixth field
+        """
+        processes = list(completed_processes)
+        count = len(processes)
+        self.names = [proc.name for proc in processes]
+        self.ids = np.fromiter((proc.pid for proc in processes), dtype=np.int64, count=count)
+        self.arrival = np.fromiter((proc.arrival_time for proc in processes), dtype=np.int64, count=count)
+        self.burst = np.fromiter((proc.burst_time for proc in processes), dtype=np.int64, count=count)
+        self.priority = np.fromiter((proc.priority for proc in processes), dtype=np.int64, count=count)
+
+        # Segments are matched to processes by pid, so processes sharing a name stay apart
+        index = {pid: i for i, pid in enumerate(self.ids.tolist())}
+        self.segment_process, self.segment_start, self.segment_end, self.segment_core = self._segment_columns(
+            process_execution_history, index
+        )
+        self.switches, self.switch_time, self.warmup_time = self._overhead_totals(process_execution_history)
+
+        # Completion is the end of the last segment, response uses the first start
+        no_start = np.iinfo(np.int64).max
+        self.completion = np.zeros(count, dtype=np.int64)
+        first_start = np.full(count, no_start, dtype=np.int64)
+        np.maximum.at(self.completion, self.segment_process, self.segment_end)
+        np.minimum.at(first_start, self.segment_process, self.segment_start)
+        self.first_start = first_start
+
+        # Processes without any segment keep zero metrics
+        ran = first_start != no_start
+        self.turnaround = np.where(ran, self.completion - self.arrival, 0)
+        self.waiting = np.where(ran, self.turnaround - self.burst, 0)
+        self.response = np.where(ran, first_start - self.arrival, 0)
+
+    @staticmethod
+    def _segment_columns(process_execution_history, index):
+        """Convert the "running" history segments to (process index, start, end, core) arrays."""
+        if not process_execution_history:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty, empty, empty
+
+        history = process_execution_history
+        count = len(history)
+        # Each column is streamed straight into an array without Python-level loops
+        codes = np.fromiter(map(index.get, map(itemgetter(4), history), repeat(-1)), dtype=np.int64, count=count)
+        starts = np.fromiter(map(itemgetter(1), history), dtype=np.int64, count=count)
+        ends = np.fromiter(map(itemgetter(2), history), dtype=np.int64, count=count)
+        running = np.fromiter(map("running".__eq__, map(itemgetter(3), history)), dtype=bool, count=count)
+        if len(history[0]) > 5:
+            cores = np.fromiter(map(itemgetter(5), history), dtype=np.int64, count=count)
+        else:
+            cores = np.zeros(count, dtype=np.int64)
+
+        keep = running & (codes >= 0)
+        return codes[keep], starts[keep], ends[keep], cores[keep]
+
+    @staticmethod
+    def _overhead_totals(process_execution_history):
+        """Number of "switch" segments and total time of the "switch" and "warmup" segments."""
+        history = process_execution_history
+        count = len(history)
+        if not count:
+            return 0, 0, 0
+        statuses = list(map(itemgetter(3), history))
+        durations = np.fromiter(map(itemgetter(2), history), dtype=np.int64, count=count)
+        durations -= np.fromiter(map(itemgetter(1), history), dtype=np.int64, count=count)
+        switch = np.fromiter(map("switch".__eq__, statuses), dtype=bool, count=count)
+        warmup = np.fromiter(map("warmup".__eq__, statuses), dtype=bool, count=count)
+        return int(np.count_nonzero(switch)), int(durations[switch].sum()), int(durations[warmup].sum())
+
+    def __len__(self):
+        return len(self.names)
+
+    def averages(self):
+        """Average turnaround and waiting times, (0, 0) for an empty run."""
+        if not len(self):
+            return 0, 0
+        return float(self.turnaround.mean()), float(self.waiting.mean())
+
+    def summary(self, percentiles=DEFAULT_PERCENTILES):
+        """
+        Averages and percentiles of turnaround, waiting and response time.
+
+        Returns:
+            Dict with "processes", "avg_<metric>" and "p<q>_<metric>" keys
+        """
+        result = {"processes": len(self)}
+        for metric in ("turnaround", "waiting", "response"):
+            values = getattr(self, metric)
+            if len(values):
+                result[f"avg_{metric}"] = float(values.mean())
+                points = np.percentile(values, percentiles)
+            else:
+                result[f"avg_{metric}"] = 0.0
+                points = [0.0] * len(percentiles)
+            for q, value in zip(percentiles, points):
+                result[f"p{q:g}_{metric}"] = float(value)
+        return result
+
+    def core_stats(self, cores=None):
+        """
+        Per-core load of a multi-core run, derived from the history.
+
+        A migration is a process running on a different core than in its
+        previous segment. Imbalance is the busiest core's busy time over the
+        mean busy time minus one, so 0 means perfectly balanced cores.
+
+        Args:
+            cores: Number of cores, default the highest core in the history plus one
+
+        Returns:
+            Dict with "cores", "busy" and "utilization" (per-core lists),
+            "imbalance" and "migrations"
+        """
+        if cores is None:
+            cores = int(self.segment_core.max()) + 1 if len(self.segment_core) else 1
+        busy = np.bincount(self.segment_core, weights=self.segment_end - self.segment_start, minlength=cores)
+        makespan = int(self.segment_end.max()) if len(self.segment_end) else 0
+        mean_busy = busy.mean()
+
+        # Consecutive segments of the same process, in time order, on different cores
+        order = np.lexsort((self.segment_start, self.segment_process))
+        process = self.segment_process[order]
+        core = self.segment_core[order]
+        migrations = int(np.count_nonzero((process[1:] == process[:-1]) & (core[1:] != core[:-1])))
+
+        return {
+            'cores': cores,
+            'busy': busy.astype(np.int64).tolist(),
+            'utilization': (busy / makespan).tolist() if makespan else [0.0] * cores,
+            'imbalance': float(busy.max() / mean_busy - 1) if mean_busy else 0.0,
+            'migrations': migrations,
+        }
+
+    def overhead_stats(self):
+        """
+        CPU time spent on context switches and cache warmups versus useful work.
+
+        CPU efficiency is the useful (running) time over all busy time, so 1
+        means no overhead; switch overhead is the remaining fraction.
+
+        Returns:
+            Dict with "switches", "switch_time", "warmup_time", "useful_time",
+            "cpu_efficiency" and "switch_overhead"
+        """
+        useful = int((self.segment_end - self.segment_start).sum())
+        overhead = self.switch_time + self.warmup_time
+        busy = useful + overhead
+        return {
+            'switches': self.switches,
+            'switch_time': self.switch_time,
+            'warmup_time': self.warmup_time,
+            'useful_time': useful,
+            'cpu_efficiency': useful / busy if busy else 1.0,
+            'switch_overhead': overhead / busy if busy else 0.0,
+        }
+
+    def process_stats(self):
+        """Per-process statistics keyed by pid, as shown in the output table."""
+        columns = zip(
+            self.ids.tolist(), self.names, self.arrival.tolist(), self.burst.tolist(), self.completion.tolist(),
+            self.turnaround.tolist(), self.waiting.tolist()
+        )
+        return {
+            pid: {
+                'name': name,
+                'arrival_time': arrival,
+                'burst_time': burst,
+                'completion_time': completion,
+                'turnaround_time': turnaround,
+                'waiting_time': waiting
+            }
+            for pid, name, arrival, burst, completion, turnaround, waiting in columns
+        }
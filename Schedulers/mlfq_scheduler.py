@@ -0,0 +1,215 @@
+from collections import deque
+
+from Schedulers.arrival_queue import ArrivalQueue
+
+DEFAULT_QUANTA = (2, 4, 8)
+
+
+class FeedbackQueues:
+    def __init__(self, levels):
+        """
+        Ready queue of an MLFQ: one FIFO deque per level, level 0 first.
+
+        Every queued process has a (level, epoch, quantum_left) record. A
+        boost only increments the epoch and moves the level deques, as a
+        whole, to the front of level 0; records from an older epoch then read
+        as level 0 with a fresh quantum. So a boost costs O(levels) no matter
+        how many processes are queued, and push and pop stay O(1).
+
+        Args:
+            levels: Number of priority levels
+        """
+        self.levels = [deque() for _ in range(levels)]
+        self.epoch = 0
+        self._boosted = deque()  # Level deques of earlier epochs, all level 0 now, in run order
+        self._records = {}       # pid -> (level, epoch, quantum_left) of queued processes
+        self._size = 0
+
+    def push(self, process, level, quantum_left=0, front=False):
+        """
+        Queue a process at a level in O(1).
+
+        Args:
+            process: Process record
+            level: Level to queue it at
+            quantum_left: Unused part of its quantum, 0 for a full quantum
+            front: Queue it first in its level (a preempted process) instead of last
+        """
+        self._records[process.pid] = (level, self.epoch, quantum_left)
+        if level == 0 and self._boosted:
+            # Boosted processes are ahead of everything queued at level 0 since the boost
+            queue = self._boosted[0] if front else self.levels[0]
+        else:
+            queue = self.levels[level]
+        if front:
+            queue.appendleft(process)
+        else:
+            queue.append(process)
+        self._size += 1
+
+    def pop(self):
+        """
+        Remove the first process of the highest non-empty level.
+
+        Returns:
+            Tuple of (process, level, quantum_left) or (None, 0, 0) if empty
+        """
+        self._drop_empty_boosted()
+        if self._boosted:
+            process = self._boosted[0].popleft()
+        else:
+            for queue in self.levels:
+                if queue:
+                    process = queue.popleft()
+                    break
+            else:
+                return None, 0, 0
+        self._size -= 1
+        level, quantum_left = self.level_of(self._records.pop(process.pid))
+        return process, level, quantum_left
+
+    def top_level(self):
+        """Highest level with a queued process, or None when empty."""
+        self._drop_empty_boosted()
+        if self._boosted:
+            return 0
+        for level, queue in enumerate(self.levels):
+            if queue:
+                return level
+        return None
+
+    def level_of(self, record):
+        """(level, quantum_left) of a record, reset to level 0 if a boost happened since."""
+        level, epoch, quantum_left = record
+        if epoch != self.epoch:
+            return 0, 0
+        return level, quantum_left
+
+    def boost(self):
+        """Move every queued process to level 0 in O(levels)."""
+        self.epoch += 1
+        self._boosted.extend(queue for queue in self.levels if queue)
+        self.levels = [deque() for _ in self.levels]
+
+    def _drop_empty_boosted(self):
+        boosted = self._boosted
+        while boosted and not boosted[0]:
+            boosted.popleft()
+
+    def __len__(self):
+        return self._size
+
+    def __bool__(self):
+        return self._size > 0
+
+    def __iter__(self):
+        """Iterate over queued processes in run order (used for display)."""
+        for queue in self._boosted:
+            yield from queue
+        for queue in self.levels:
+            yield from queue
+
+
+class MLFQScheduler:
+    def __init__(self, processes, quanta=DEFAULT_QUANTA, boost_interval=None):
+        """
+        Initialize the Multi-Level Feedback Queue Scheduler
+
+        New processes start at level 0, the highest priority. A process that
+        uses up its quantum moves down one level; the lowest level is plain
+        Round Robin. An arrival at a higher level preempts the running process,
+        which goes back to the front of its level and keeps the rest of its
+        quantum. Every boost_interval time units all processes return to level 0.
+
+        Args:
+            processes: List of Process records
+            quanta: Time quantum per level, top level first; its length is the number of levels
+            boost_interval: Time between priority boosts, None to never boost
+        """
+        quanta = tuple(quanta)
+        if not quanta or any(quantum <= 0 for quantum in quanta):
+            raise ValueError("MLFQ needs at least one level and positive quanta")
+        if boost_interval is not None and boost_interval <= 0:
+            raise ValueError("boost_interval must be positive")
+
+        # Waiting queue sorted by arrival time, consumed through a cursor
+        self.waiting_queue = ArrivalQueue(processes)
+        self.ready_queue = FeedbackQueues(len(quanta))
+        self.quanta = quanta
+        self.boost_interval = boost_interval
+        self.next_boost = boost_interval
+
+        # Level of the running process, read through the epoch like the queued records
+        self._current_record = (0, 0, 0)
+
+    def update_queues(self, current_time):
+        """Boost when due, then move arrived processes to the top level."""
+        if self.boost_interval and current_time >= self.next_boost:
+            self.ready_queue.boost()
+            self.next_boost = (current_time // self.boost_interval + 1) * self.boost_interval
+
+        newly_arrived = self.waiting_queue.pop_arrived(current_time)
+        for proc in newly_arrived:
+            self.ready_queue.push(proc, 0)
+
+        return newly_arrived
+
+    def add_process(self, process):
+        """Inject a new arrival into a running schedule in O(log n); it is queued on arrival."""
+        self.waiting_queue.insert(process)
+
+    def current_level(self):
+        """Level of the running process (0 after a boost)."""
+        return self.ready_queue.level_of(self._current_record)[0]
+
+    def run(self, current_time, current_process=None, remaining_time=0, time_quantum_left=0):
+        """
+        MLFQ: Select the next process, demoting on quantum expiry and preempting for higher levels.
+
+        Args:
+            current_time: Current simulation time
+            current_process: Process currently running (if any)
+            remaining_time: Remaining time of current process
+            time_quantum_left: Remaining time quantum
+
+        Returns:
+            Tuple of (selected_process, remaining_time, time_quantum_left, preempted_flag)
+        """
+        if current_process and remaining_time > 0:
+            level = self.current_level()
+            current_process.remaining_time = remaining_time
+
+            if time_quantum_left <= 0:
+                # Used its whole quantum: one level down (the lowest level keeps it)
+                self.ready_queue.push(current_process, min(level + 1, len(self.quanta) - 1))
+                process, burst, quantum = self._get_next_process()
+                return process, burst, quantum, process is not current_process
+
+            top_level = self.ready_queue.top_level()
+            if top_level is not None and top_level < level:
+                # A higher level has work: resume later with the rest of this quantum
+                self.ready_queue.push(current_process, level, time_quantum_left, front=True)
+                process, burst, quantum = self._get_next_process()
+                return process, burst, quantum, True
+
+            # Continue with current process
+            return current_process, remaining_time, time_quantum_left, False
+
+        process, burst, quantum = self._get_next_process()
+        return process, burst, quantum, False
+
+    def _get_next_process(self):
+        """Get the next process from the highest non-empty level with its time quantum."""
+        process, level, quantum_left = self.ready_queue.pop()
+        if process is None:
+            return None, 0, 0
+        self._current_record = (level, self.ready_queue.epoch, 0)
+        return process, process.remaining_time, quantum_left or self.quanta[level]
+
+    def next_arrival_time(self):
+        """Arrival time of the next process still in the waiting queue, or None."""
+        return self.waiting_queue.next_arrival_time()
+
+    def is_done(self):
+        """Check if scheduler has completed all processes."""
+        return len(self.waiting_queue) == 0 and len(self.ready_queue) == 0
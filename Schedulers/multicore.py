@@ -0,0 +1,451 @@
+from collections import deque
+
+from Schedulers.ready_heap import ReadyHeap
+from Schedulers.simulation import SchedulerSimulation
+
+
+class MultiCoreSimulation(SchedulerSimulation):
+    def __init__(self, process_list, scheduler_type="FCFS", cores=2, migration_cost=0, switch_cost=0):
+        """
+        N-core simulation with one global ready queue shared by all cores.
+
+        Every core takes its next process from the scheduler's ready queue,
+        idle cores in core order. Preemptive SJF and Priority keep the
+        best processes of the ready queue and the cores running, and preempt
+        the worst running process first. Round Robin puts a process whose
+        quantum expired at the back of the queue and takes the front.
+        With one core the history is the same as SchedulerSimulation's.
+
+        History entries carry the core as a sixth field:
+        (process_name, start_time, end_time, status, pid, core). The remaining
+        time of a running process is kept in its Process record.
+
+        Every dispatch first costs the core switch_cost time units ("switch"
+        segment). A process that resumes on a different core than it last ran
+        on is a migration, and the core then spends migration_cost time units
+        warming its cache ("warmup" segment). Neither overhead is interrupted
+        or counts against a quantum, and neither changes the remaining time,
+        so the SJF order is the same as without overhead.
+
+        Args:
+            process_list: List of Process records (legacy tuples are converted)
+            scheduler_type: One of "FCFS", "SJF", "Priority" or "Round Robin"
+            cores: Number of CPU cores
+            migration_cost: Cache warmup time units a core spends after each migration
+            switch_cost: Time units of every context switch
+        """
+        if cores < 1:
+            raise ValueError("cores must be at least 1")
+        if scheduler_type == "MLFQ":
+            raise ValueError("MLFQ runs on a single core")
+        if migration_cost < 0:
+            raise ValueError("migration_cost cannot be negative")
+        super().__init__(process_list, scheduler_type, switch_cost=switch_cost)
+        self.cores = cores
+        self.running_processes = [None] * cores  # Process on each core, None when idle
+        self.quantum_left = [0] * cores          # Round Robin time left per core
+        self._core_segments = [None] * cores     # Index of each core's open segment in the history
+        self.overhead_left = [0] * cores         # Switch and warmup time left per core
+        self.migration_cost = migration_cost
+        self.migrations = 0
+        self._last_core = {}                     # pid -> core the process last ran on
+        self._assigned = set()                   # Cores given a new process in the current dispatch
+
+    def running(self):
+        return tuple(self.running_processes)
+
+    def open_segments(self):
+        return [index for index in self._core_segments if index is not None]
+
+    def step(self):
+        """Advance the simulation by one time unit on every core."""
+        if self.finished:
+            return False
+
+        self.last_completed = None
+        self._dispatch()
+
+        if any(self.running_processes):
+            self._advance(1)
+        elif self._work_left():
+            self.current_time += 1
+        else:
+            self.finished = True
+            return False
+
+        if not self._work_left() and not any(self.running_processes):
+            self.finished = True
+        return True
+
+    def step_to_next_event(self):
+        """Advance the simulation straight to the next scheduling event on any core."""
+        if self.finished:
+            return False
+
+        self.last_completed = None
+        self._dispatch()
+
+        if any(self.running_processes):
+            self._advance(self._time_to_next_event())
+        elif self._work_left():
+            # Every core is idle: jump over the gap to the next arrival
+            next_arrival = self.scheduler.next_arrival_time()
+            if next_arrival is None or next_arrival <= self.current_time:
+                self.current_time += 1
+            else:
+                self.current_time = next_arrival
+        else:
+            self.finished = True
+            return False
+
+        if not self._work_left() and not any(self.running_processes):
+            self.finished = True
+        return True
+
+    def skip_idle(self):
+        """Jump to the next arrival when every core is idle; see SchedulerSimulation.skip_idle."""
+        if any(self.running_processes):
+            return False
+        return super().skip_idle()
+
+    def progress(self):
+        """Average percentage of the bursts executed by the processes on the cores."""
+        busy = [proc for proc in self.running_processes if proc is not None and proc.burst_time > 0]
+        if not busy:
+            return 100 if self.last_completed else 0
+        return sum((proc.burst_time - proc.remaining_time) / proc.burst_time for proc in busy) / len(busy) * 100
+
+    def _work_left(self):
+        """Whether processes are still waiting to arrive or queued, running ones excluded."""
+        return not self.scheduler.is_done()
+
+    def _dispatch(self):
+        """Update the global ready queue and decide what every core runs at current_time."""
+        scheduler = self.scheduler
+        scheduler.update_queues(self.current_time)
+        running = self.running_processes
+
+        if self.scheduler_type == "Round Robin":
+            queue = scheduler.ready_queue
+            for core, proc in enumerate(running):
+                if proc is not None:
+                    if self.quantum_left[core] > 0 or self.overhead_left[core]:
+                        continue
+                    # Quantum expired: back of the queue (it comes straight back if nobody waits)
+                    queue.append(proc)
+                if queue:
+                    selected = queue.popleft()
+                    self.quantum_left[core] = selected.time_quantum or scheduler.default_quantum
+                    self._assign(core, selected)
+        elif self.preemptive:
+            heap = scheduler.ready_queue
+            key = heap.key
+            for core, proc in enumerate(running):
+                if proc is None and heap:
+                    self._assign(core, heap.pop())
+            # The running processes keep their cores on ties, so only a strictly
+            # better ready process preempts the worst one running (not one still switching)
+            while heap:
+                busy = [core for core in range(self.cores)
+                        if running[core] is not None and not self.overhead_left[core]]
+                if not busy:
+                    break
+                worst = max(busy, key=lambda core: key(running[core]))
+                if heap.peek_key() >= key(running[worst]):
+                    break
+                heap.push(running[worst])
+                self._assign(worst, heap.pop())
+        else:
+            select = scheduler.run if self.scheduler_type == "FCFS" else scheduler.run_non_preemptive
+            for core, proc in enumerate(running):
+                if proc is None:
+                    selected, _ = select(self.current_time)
+                    if selected is None:
+                        break
+                    self._assign(core, selected)
+        self._start_segments()
+
+    def _assign(self, core, process):
+        """Put process on core, closing the core's segment if the process changes."""
+        if self.running_processes[core] is process:
+            return
+        self._close_core_segment(core)
+        self.running_processes[core] = process
+        if process is not None:
+            self._assigned.add(core)
+
+    def _start_segments(self):
+        """
+        Add the history segments of the decisions of this dispatch.
+
+        A newly assigned process gets its switch and warmup segments, with
+        their final times since overhead is not interrupted. Its running
+        segment opens once the overhead is over. Doing this after all
+        decisions means a process never pays for a core it did not run on.
+        """
+        history = self.process_execution_history
+        now = self.current_time
+        for core, proc in enumerate(self.running_processes):
+            if proc is None or self._core_segments[core] is not None or self.overhead_left[core]:
+                continue
+            if core in self._assigned:
+                start = now
+                if self.switch_cost:
+                    history.append((proc.name, start, start + self.switch_cost, "switch", proc.pid, core))
+                    start += self.switch_cost
+                last_core = self._last_core.get(proc.pid, core)
+                self._last_core[proc.pid] = core
+                if last_core != core:
+                    self.migrations += 1
+                    if self.migration_cost:
+                        history.append((proc.name, start, start + self.migration_cost, "warmup", proc.pid, core))
+                        start += self.migration_cost
+                if start > now:
+                    self.overhead_left[core] = start - now
+                    continue
+            self._core_segments[core] = len(history)
+            history.append((proc.name, now, now + proc.remaining_time, "running", proc.pid, core))
+        self._assigned.clear()
+
+    def _time_to_next_event(self):
+        """Time units until the next completion, quantum expiry, end of overhead or relevant arrival."""
+        round_robin = self.scheduler_type == "Round Robin"
+        duration = None
+        idle_core = False
+        for core, proc in enumerate(self.running_processes):
+            if proc is None:
+                idle_core = True
+                continue
+            if self.overhead_left[core]:
+                time_left = self.overhead_left[core]
+            elif round_robin:
+                time_left = min(proc.remaining_time, self.quantum_left[core])
+            else:
+                time_left = proc.remaining_time
+            if duration is None or time_left < duration:
+                duration = time_left
+        # Arrivals matter when they can preempt or when a core is free to take them
+        if self.preemptive or idle_core:
+            next_arrival = self.scheduler.next_arrival_time()
+            if next_arrival is not None:
+                duration = min(duration, next_arrival - self.current_time)
+        return max(1, duration)
+
+    def _advance(self, duration):
+        """Execute every running process for the given number of time units."""
+        self.current_time += duration
+        round_robin = self.scheduler_type == "Round Robin"
+        for core, proc in enumerate(self.running_processes):
+            if proc is None:
+                continue
+            if self.overhead_left[core]:
+                # Events stop at the end of every overhead, so it never spans into running time
+                self.overhead_left[core] -= duration
+                continue
+            proc.remaining_time -= duration
+            if round_robin:
+                self.quantum_left[core] -= duration
+            if proc.remaining_time <= 0:
+                self._close_core_segment(core)
+                proc.remaining_time = 0
+                self.completed_processes.append(proc)
+                self.last_completed = proc
+                self._last_core.pop(proc.pid, None)
+                self.running_processes[core] = None
+
+    def _close_core_segment(self, core):
+        index = self._core_segments[core]
+        if index is None:
+            return
+        name, start, _, status, pid, core = self.process_execution_history[index]
+        self.process_execution_history[index] = (name, start, self.current_time, status, pid, core)
+        self._core_segments[core] = None
+
+
+class LocalQueueSimulation(MultiCoreSimulation):
+    def __init__(self, process_list, scheduler_type="FCFS", cores=2, migration_cost=0,
+                 balance_interval=None, affinity=None, steal=True, switch_cost=0):
+        """
+        N-core simulation with one run queue per core, like SMP kernels.
+
+        An arriving process is queued on the least loaded core it may run on
+        and stays there, so it keeps its cache unless the load balancer moves
+        it. Each core schedules its own queue with the algorithm's rules
+        (preemption only looks at the core's own queue). A core that runs out
+        of work steals the next process from the longest other queue, and
+        every balance_interval time units processes are moved from the most
+        to the least loaded core until their loads differ by at most one.
+
+        Args:
+            process_list: List of Process records (legacy tuples are converted)
+            scheduler_type: One of "FCFS", "SJF", "Priority" or "Round Robin"
+            cores: Number of CPU cores
+            migration_cost: Cache warmup time units a core spends after each migration
+            balance_interval: Time between periodic rebalances, None to only steal
+            affinity: Optional dict of process name -> cores the process may run on
+            steal: Whether idle cores steal work from other cores' queues
+            switch_cost: Time units of every context switch
+        """
+        super().__init__(process_list, scheduler_type, cores, migration_cost, switch_cost)
+        if balance_interval is not None and balance_interval <= 0:
+            raise ValueError("balance_interval must be positive")
+        self.affinity = {}
+        for name, allowed in (affinity or {}).items():
+            allowed = frozenset(allowed)
+            if not allowed or not allowed <= frozenset(range(cores)):
+                raise ValueError(f"affinity of {name} must be a non-empty set of cores below {cores}")
+            self.affinity[name] = allowed
+        self.balance_interval = balance_interval
+        self.steal = steal
+
+        # FCFS and Round Robin queues are FIFO, SJF and Priority keep the scheduler's heap order
+        self._fifo = scheduler_type in ("FCFS", "Round Robin")
+        if self._fifo:
+            self.run_queues = [deque() for _ in range(cores)]
+        else:
+            self.run_queues = [ReadyHeap(self.scheduler.ready_queue.key) for _ in range(cores)]
+
+    def skip_idle(self):
+        """Jump to the next arrival when every core is idle and every run queue empty."""
+        if any(self.run_queues):
+            return False
+        return super().skip_idle()
+
+    def ready_count(self):
+        """Processes queued on any core, plus arrivals not placed on a core yet."""
+        return len(self.scheduler.ready_queue) + sum(map(len, self.run_queues))
+
+    def _work_left(self):
+        return not self.scheduler.is_done() or any(self.run_queues)
+
+    def _allowed(self, proc, core):
+        allowed = self.affinity.get(proc.name)
+        return allowed is None or core in allowed
+
+    def _load(self, core):
+        return len(self.run_queues[core]) + (self.running_processes[core] is not None)
+
+    def _put(self, core, proc):
+        queue = self.run_queues[core]
+        if self._fifo:
+            queue.append(proc)
+        else:
+            queue.push(proc)
+
+    def _take(self, core):
+        """Next process of the core's own queue, or None."""
+        queue = self.run_queues[core]
+        if not queue:
+            return None
+        return queue.popleft() if self._fifo else queue.pop()
+
+    def _take_for(self, victim, core):
+        """Remove the first process of victim's queue that may run on core, or None."""
+        queue = self.run_queues[victim]
+        if not self.affinity:
+            return self._take(victim)
+        if self._fifo:
+            for i, proc in enumerate(queue):
+                if self._allowed(proc, core):
+                    del queue[i]
+                    return proc
+            return None
+        candidates = [proc for proc in queue if self._allowed(proc, core)]
+        if not candidates:
+            return None
+        proc = min(candidates, key=queue.key)
+        queue.remove(proc)
+        return proc
+
+    def _place_arrivals(self):
+        """Move the processes the scheduler just made ready to the least loaded allowed core."""
+        ready = self.scheduler.ready_queue
+        if not ready:
+            return
+        if self._fifo:
+            arrived = list(ready)
+            ready.clear()
+        else:
+            arrived = [ready.pop() for _ in range(len(ready))]
+        cores = range(self.cores)
+        for proc in arrived:
+            allowed = self.affinity.get(proc.name, cores)
+            self._put(min(allowed, key=lambda core: (self._load(core), core)), proc)
+
+    def _rebalance(self):
+        """Move queued processes from the most to the least loaded core until loads differ by one at most."""
+        cores = range(self.cores)
+        while True:
+            busiest = max(cores, key=lambda core: (self._load(core), -core))
+            idlest = min(cores, key=lambda core: (self._load(core), core))
+            if self._load(busiest) - self._load(idlest) <= 1:
+                return
+            proc = self._take_for(busiest, idlest)
+            if proc is None:
+                return
+            self._put(idlest, proc)
+
+    def _steal_for(self, core):
+        """Take work for an idle core from the longest other queue that has a process it may run."""
+        victims = sorted((victim for victim in range(self.cores) if victim != core and self.run_queues[victim]),
+                         key=lambda victim: (-len(self.run_queues[victim]), victim))
+        for victim in victims:
+            proc = self._take_for(victim, core)
+            if proc is not None:
+                return proc
+        return None
+
+    def _dispatch(self):
+        """Queue new arrivals, rebalance when due and let every core schedule its own queue."""
+        self.scheduler.update_queues(self.current_time)
+        self._place_arrivals()
+
+        # Rebalance at multiples of the interval, which the event engine always stops at while work is queued
+        if self.balance_interval and self.current_time % self.balance_interval == 0:
+            self._rebalance()
+
+        running = self.running_processes
+        for core in range(self.cores):
+            proc = running[core]
+            if self.overhead_left[core]:
+                continue
+            if self.scheduler_type == "Round Robin":
+                if proc is not None:
+                    if self.quantum_left[core] > 0:
+                        continue
+                    self._put(core, proc)
+                selected = self._take(core)
+                if selected is not None:
+                    self.quantum_left[core] = selected.time_quantum or self.scheduler.default_quantum
+                    self._assign(core, selected)
+            elif proc is None:
+                selected = self._take(core)
+                if selected is not None:
+                    self._assign(core, selected)
+            elif self.preemptive:
+                queue = self.run_queues[core]
+                best_key = queue.peek_key()
+                if best_key is not None and best_key < queue.key(proc):
+                    queue.push(proc)
+                    self._assign(core, queue.pop())
+
+        # Stealing comes last so that processes preempted above can be picked up
+        if self.steal:
+            for core in range(self.cores):
+                if running[core] is None:
+                    selected = self._steal_for(core)
+                    if selected is not None:
+                        if self.scheduler_type == "Round Robin":
+                            self.quantum_left[core] = selected.time_quantum or self.scheduler.default_quantum
+                        self._assign(core, selected)
+        self._start_segments()
+
+    def _time_to_next_event(self):
+        """Like MultiCoreSimulation, but every arrival is placed on a core when it happens."""
+        duration = super()._time_to_next_event()
+        next_arrival = self.scheduler.next_arrival_time()
+        if next_arrival is not None:
+            duration = min(duration, next_arrival - self.current_time)
+        if self.balance_interval and any(self.run_queues):
+            duration = min(duration, self.balance_interval - self.current_time % self.balance_interval)
+        return max(1, duration)
@@ -0,0 +1,86 @@
+import itertools
+
+_pid_counter = itertools.count(1)
+
+
+class Process:
+    """
+    Compact record for one process, shared by every scheduler and page.
+
+    burst_time is the original burst and never changes; schedulers track the
+    work left in remaining_time. pid is a stable integer id, so queues can
+    find a process without searching by name.
+    """
+    __slots__ = ('pid', 'name', 'burst_time', 'arrival_time', 'priority',
+                 'time_quantum', 'preemptive', 'remaining_time')
+
+    def __init__(self, name, burst_time, arrival_time=0, priority=0,
+                 time_quantum=None, preemptive=False, pid=None):
+        """
+        Args:
+            name: Display name of the process
+            burst_time: Total CPU time the process needs
+            arrival_time: Time at which the process enters the ready queue
+            priority: Priority Scheduling only, lower number means higher priority
+            time_quantum: Round Robin only, None means the scheduler default
+            preemptive: SJF and Priority only, whether the run is preemptive
+            pid: Stable integer id, assigned automatically when omitted
+        """
+        self.pid = next(_pid_counter) if pid is None else pid
+        self.name = name
+        self.burst_time = burst_time
+        self.arrival_time = arrival_time
+        self.priority = priority
+        self.time_quantum = time_quantum
+        self.preemptive = preemptive
+        self.remaining_time = burst_time
+
+    @classmethod
+    def from_tuple(cls, process, scheduler_type="FCFS"):
+        """
+        Build a record from the positional tuple formats used per tab.
+
+        FCFS: (name, burst_time, arrival_time)
+        SJF: (name, burst_time, arrival_time, is_preemptive)
+        Priority: (name, burst_time, arrival_time, priority, is_preemptive)
+        Round Robin: (name, burst_time, arrival_time, time_quantum)
+        """
+        name, burst_time, arrival_time = process[0], process[1], process[2]
+        if scheduler_type == "SJF" and len(process) > 3:
+            return cls(name, burst_time, arrival_time, preemptive=bool(process[3]))
+        if scheduler_type == "Priority" and len(process) > 4:
+            return cls(name, burst_time, arrival_time, priority=process[3], preemptive=bool(process[4]))
+        if scheduler_type == "Round Robin" and len(process) > 3:
+            return cls(name, burst_time, arrival_time, time_quantum=process[3])
+        return cls(name, burst_time, arrival_time)
+
+    def copy(self):
+        """Fresh copy with the same pid and the full burst remaining."""
+        return Process(self.name, self.burst_time, self.arrival_time, self.priority,
+                       self.time_quantum, self.preemptive, self.pid)
+
+    def __repr__(self):
+        return (f"Process(pid={self.pid}, name={self.name!r}, burst_time={self.burst_time}, "
+                f"arrival_time={self.arrival_time}, remaining_time={self.remaining_time})")
+
+
+def as_process(process, scheduler_type="FCFS"):
+    """Return process as a Process record, converting legacy tuples."""
+    if isinstance(process, Process):
+        return process
+    return Process.from_tuple(process, scheduler_type)
+
+
+def configure_processes(processes, algorithm, mode=None, quantum=None):
+    """
+    Copy a workload with the preemptive flag and time quantum of one configuration.
+
+    A quantum of None keeps each process's own Round Robin quantum.
+    """
+    preemptive = mode == "Preemptive"
+    return [
+        Process(proc.name, proc.burst_time, proc.arrival_time, proc.priority,
+                quantum if algorithm == "Round Robin" and quantum is not None else proc.time_quantum,
+                preemptive, proc.pid)
+        for proc in processes
+    ]
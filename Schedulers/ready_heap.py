@@ -0,0 +1,88 @@
+import heapq
+import itertools
+
+_REMOVED = None  # Placeholder for a lazily deleted entry
+
+
+class ReadyHeap:
+    def __init__(self, key):
+        """
+        Priority queue of ready processes with lazy deletion.
+
+        Entries are ordered by key(process) and then by insertion order, which
+        matches the tie-breaking of the stable sorts this replaces.
+
+        Args:
+            key: Function mapping a Process record to its sort key (smaller runs first)
+        """
+        self.key = key
+        self._heap = []
+        self._entries = {}  # pid -> live heap entry
+        self._counter = itertools.count()
+        self._size = 0
+
+    def push(self, process):
+        """Add a process to the ready queue in O(log n)."""
+        entry = [self.key(process), next(self._counter), process]
+        self._entries[process.pid] = entry
+        heapq.heappush(self._heap, entry)
+        self._size += 1
+
+    def pop(self):
+        """Remove and return the process that should run next, or None if empty."""
+        self._discard_removed()
+        if not self._heap:
+            return None
+        entry = heapq.heappop(self._heap)
+        process = entry[-1]
+        if self._entries.get(process.pid) is entry:
+            del self._entries[process.pid]
+        self._size -= 1
+        return process
+
+    def peek(self):
+        """Return the process that should run next without removing it, or None."""
+        self._discard_removed()
+        return self._heap[0][-1] if self._heap else None
+
+    def peek_key(self):
+        """Sort key of the process that should run next, or None if empty."""
+        self._discard_removed()
+        return self._heap[0][0] if self._heap else None
+
+    def remove(self, process):
+        """Mark the queued entry of a process as removed in O(1)."""
+        entry = self._entries.pop(process.pid, None)
+        if entry is None:
+            return False
+        entry[-1] = _REMOVED
+        self._size -= 1
+        return True
+
+    def update(self, process):
+        """Replace the queued entry for a process (e.g. new remaining time) in O(log n)."""
+        self.remove(process)
+        self.push(process)
+
+    def clear(self):
+        self._heap.clear()
+        self._entries.clear()
+        self._size = 0
+
+    def _discard_removed(self):
+        """Drop lazily deleted entries from the top of the heap."""
+        heap = self._heap
+        while heap and heap[0][-1] is _REMOVED:
+            heapq.heappop(heap)
+
+    def __len__(self):
+        return self._size
+
+    def __bool__(self):
+        return self._size > 0
+
+    def __iter__(self):
+        """Iterate over queued processes in heap order (used for display)."""
+        for entry in self._heap:
+            if entry[-1] is not _REMOVED:
+                yield entry[-1]
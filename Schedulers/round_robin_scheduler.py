@@ -1,35 +1,34 @@
+from collections import deque
+
+from Schedulers.arrival_queue import ArrivalQueue
+
+
 class RoundRobinScheduler:
     def __init__(self, processes, default_quantum=2):
         """
         Initialize the Round Robin Scheduler
         
         Args:
-            processes: List of process tuples (name, burst_time, arrival_time, time_quantum)
+            processes: List of Process records
             default_quantum: Default time quantum if not specified in process
         """
-        self.waiting_queue = list(processes)
-        self.ready_queue = []
+        # Waiting queue sorted by arrival time, consumed through a cursor
+        self.waiting_queue = ArrivalQueue(processes)
+        self.ready_queue = deque()  # O(1) at both ends
         self.default_quantum = default_quantum
-        # Sort initially by arrival time
-        self.waiting_queue.sort(key=lambda x: x[2])
         
     def update_queues(self, current_time):
         """Move arrived processes from waiting to ready queue."""
-        newly_arrived = []
-        still_waiting = []
-        
-        for proc in self.waiting_queue:
-            if proc[2] <= current_time:  # Check arrival time
-                newly_arrived.append(proc)
-            else:
-                still_waiting.append(proc)
-                
-        self.waiting_queue = still_waiting
+        newly_arrived = self.waiting_queue.pop_arrived(current_time)
         for proc in newly_arrived:
             self.ready_queue.append(proc)
             
         return newly_arrived
     
+    def add_process(self, process):
+        """Inject a new arrival into a running schedule in O(log n); it is queued on arrival."""
+        self.waiting_queue.insert(process)
+
     def run(self, current_time, current_process=None, remaining_time=0, time_quantum_left=0):
         """
         Round Robin: Select next process or continue current process within time quantum.
@@ -45,10 +44,9 @@ class RoundRobinScheduler:
         """
         # If time quantum expired and there are more processes, perform context switch
         if current_process and time_quantum_left == 0 and remaining_time > 0:
-            # Current process needs to go back to ready queue
-            updated_process = list(current_process)
-            updated_process[1] = remaining_time
-            self.ready_queue.append(tuple(updated_process))
+            # Current process needs to go back to ready queue with its remaining time
+            current_process.remaining_time = remaining_time
+            self.ready_queue.append(current_process)
             
             # Process completed its time quantum, need a new process
             process, burst, quantum = self._get_next_process()
@@ -67,17 +65,18 @@ class RoundRobinScheduler:
         if not self.ready_queue:
             return None, 0, 0
             
-        selected_process = self.ready_queue.pop(0)
-        remaining_time = selected_process[1]  # Burst time
-        
+        selected_process = self.ready_queue.popleft()
+        remaining_time = selected_process.remaining_time
+
         # Determine time quantum
-        if len(selected_process) > 3:
-            time_quantum = selected_process[3]
-        else:
-            time_quantum = self.default_quantum
-            
+        time_quantum = selected_process.time_quantum or self.default_quantum
+
         return selected_process, remaining_time, time_quantum
         
+    def next_arrival_time(self):
+        """Arrival time of the next process still in the waiting queue, or None."""
+        return self.waiting_queue.next_arrival_time()
+
     def is_done(self):
         """Check if scheduler has completed all processes."""
         return len(self.waiting_queue) == 0 and len(self.ready_queue) == 0
\ No newline at end of file
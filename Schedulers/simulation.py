@@ -0,0 +1,401 @@
+from Schedulers.fcfs_scheduler import FCFSScheduler
+from Schedulers.mlfq_scheduler import MLFQScheduler
+from Schedulers.process import Process, as_process
+from Schedulers.priority_scheduler import PriorityScheduler
+from Schedulers.round_robin_scheduler import RoundRobinScheduler
+from Schedulers.sjf_scheduler import SJFScheduler
+
+DEFAULT_QUANTUM = 2
+
+
+def create_scheduler(process_list, scheduler_type="FCFS", scheduler_options=None):
+    """
+    Build the scheduler object for the given algorithm name.
+
+    Args:
+        process_list: List of Process records
+        scheduler_type: One of "FCFS", "SJF", "Priority", "Round Robin" or "MLFQ"
+        scheduler_options: Optional keyword arguments for the scheduler class
+            (MLFQ: quanta, boost_interval)
+    """
+    processes = list(process_list)
+    if scheduler_type == "MLFQ":
+        return MLFQScheduler(processes, **(scheduler_options or {}))
+    if scheduler_type == "SJF":
+        return SJFScheduler(processes)
+    if scheduler_type == "Priority":
+        return PriorityScheduler(processes)
+    if scheduler_type == "Round Robin":
+        return RoundRobinScheduler(processes, get_round_robin_quantum(processes))
+    return FCFSScheduler(processes)
+
+
+def get_round_robin_quantum(process_list):
+    """Read the shared RR quantum from the first process, falling back to the default."""
+    if process_list:
+        try:
+            quantum = int(process_list[0].time_quantum)
+            if quantum > 0:
+                return quantum
+        except (ValueError, TypeError):
+            pass  # Use default if error
+    return DEFAULT_QUANTUM
+
+
+def is_preemptive(process_list, scheduler_type):
+    """SJF and Priority store the preemptive flag on every process; the first one decides."""
+    if not process_list or scheduler_type not in ["SJF", "Priority"]:
+        return False
+    return bool(process_list[0].preemptive)
+
+
+class SchedulerSimulation:
+    def __init__(self, process_list, scheduler_type="FCFS", scheduler_options=None, switch_cost=0):
+        """
+        Headless simulation of one scheduling run, independent of any GUI.
+
+        With a switch_cost, every dispatch of a different process first spends
+        that many time units in a "switch" history segment. A switch is not
+        interrupted and does not count against the quantum; the scheduler is
+        consulted again once it is done.
+
+        Args:
+            process_list: List of Process records (legacy tuples are converted)
+            scheduler_type: One of "FCFS", "SJF", "Priority", "Round Robin" or "MLFQ"
+            scheduler_options: Optional keyword arguments for the scheduler class
+            switch_cost: Time units of every context switch
+        """
+        if switch_cost < 0:
+            raise ValueError("switch_cost cannot be negative")
+        # Schedulers update remaining_time in place, so each run works on fresh copies
+        self.process_list = [
+            proc.copy() if isinstance(proc, Process) else Process.from_tuple(proc, scheduler_type)
+            for proc in process_list
+        ]
+        self.scheduler_type = scheduler_type
+        self.scheduler = create_scheduler(self.process_list, scheduler_type, scheduler_options)
+        self.preemptive = is_preemptive(self.process_list, scheduler_type)
+
+        self.current_time = 0
+        self.current_process = None  # Process record currently running
+        self.remaining_time = 0      # Remaining time for current_process
+        self.time_quantum_left = 0   # For Round Robin and MLFQ
+        self.switch_cost = switch_cost
+        self.switch_left = 0         # Time left in the context switch to current_process
+        self.last_completed = None   # Process that finished during the last step
+        self.finished = False
+        # (process_name, start_time, end_time, status, pid), status "running" or "switch";
+        # the pid tells apart processes that share a name
+        self.process_execution_history = []
+        self.completed_processes = []
+
+        self._last_pid = None           # Track changes for history update
+        self._open_segment = None       # Index of the running segment in the history
+
+    def add_processes(self, processes):
+        """
+        Inject new arrivals into the running simulation, O(log n) per process.
+
+        A process can not arrive in the past, so earlier arrival times are
+        moved to current_time. A finished simulation continues with the new work.
+
+        Args:
+            processes: Iterable of Process records (legacy tuples are converted)
+
+        Returns:
+            The injected copies
+        """
+        added = []
+        for proc in processes:
+            proc = proc.copy() if isinstance(proc, Process) else Process.from_tuple(proc, self.scheduler_type)
+            proc.arrival_time = max(proc.arrival_time, self.current_time)
+            self.scheduler.add_process(proc)
+            self.process_list.append(proc)
+            added.append(proc)
+        if added:
+            self.finished = False
+        return added
+
+    def step(self):
+        """
+        Advance the simulation by one time unit.
+
+        Returns:
+            True if a time unit was simulated, False if the run was already finished
+        """
+        if self.finished:
+            return False
+
+        self.last_completed = None
+        self._dispatch()
+
+        if self.current_process:
+            self._advance(1)
+        elif not self.scheduler.is_done():
+            # No process running => idle tick
+            self.current_time += 1
+        else:
+            self.finished = True
+            return False
+
+        # Need to check is_done() AND if a process is still running its last tick
+        if self.scheduler.is_done() and not self.current_process:
+            self.finished = True
+        return True
+
+    def step_to_next_event(self):
+        """
+        Advance the simulation straight to the next scheduling event.
+
+        Events are arrivals (preemptive modes, MLFQ and idle CPU), completions,
+        ends of context switches and Round Robin / MLFQ quantum expiries. Nothing can change the schedule between
+        two events, so the history is identical to calling step() repeatedly.
+
+        Returns:
+            True if time was advanced, False if the run was already finished
+        """
+        if self.finished:
+            return False
+
+        self.last_completed = None
+        self._dispatch()
+
+        if self.current_process:
+            self._advance(self._time_to_next_event())
+        elif not self.scheduler.is_done():
+            # Idle CPU: jump over the gap to the next arrival
+            next_arrival = self.scheduler.next_arrival_time()
+            if next_arrival is None or next_arrival <= self.current_time:
+                self.current_time += 1
+            else:
+                self.current_time = next_arrival
+        else:
+            self.finished = True
+            return False
+
+        if self.scheduler.is_done() and not self.current_process:
+            self.finished = True
+        return True
+
+    def skip_idle(self):
+        """
+        Jump over an idle gap: if no process can run at current_time, move
+        straight to the next arrival. Idle time adds nothing to the history,
+        so the result is the same as stepping through the gap.
+
+        Returns:
+            True if time was advanced
+        """
+        if self.finished or self.current_process:
+            return False
+        scheduler = self.scheduler
+        scheduler.update_queues(self.current_time)
+        if scheduler.ready_queue:
+            return False
+        next_arrival = scheduler.next_arrival_time()
+        if next_arrival is None or next_arrival <= self.current_time:
+            return False
+        self.current_time = next_arrival
+        return True
+
+    def run(self, event_driven=False):
+        """
+        Run the simulation to completion as fast as possible.
+
+        Args:
+            event_driven: Jump between scheduling events instead of stepping
+                one time unit at a time. Both produce the same history.
+
+        Returns:
+            Tuple of (process_execution_history, completed_processes)
+        """
+        advance = self.step_to_next_event if event_driven else self.step
+        while advance():
+            pass
+        return self.process_execution_history, self.completed_processes
+
+    def running(self):
+        """Processes on the CPU, one entry per core (None when idle)."""
+        return (self.current_process,)
+
+    def open_segments(self):
+        """History indices of the running segments, the only entries whose end time can still change."""
+        return [] if self._open_segment is None else [self._open_segment]
+
+    def ready_count(self):
+        """Number of processes ready to run but not on a CPU."""
+        return len(self.scheduler.ready_queue)
+
+    def progress(self):
+        """Percentage of the current process' burst that has been executed."""
+        if not self.current_process:
+            return 100 if self.last_completed else 0
+        burst_time = self.current_process.burst_time
+        if burst_time <= 0:
+            return 0
+        return (burst_time - self.remaining_time) / burst_time * 100
+
+    def _dispatch(self):
+        """Update the queues and decide which process should run at current_time."""
+        if self.switch_left:
+            # Nothing is decided during a context switch
+            return
+        scheduler = self.scheduler
+        scheduler.update_queues(self.current_time)
+
+        process_to_run = None
+        time_for_process = 0  # This is the REMAINING time for the selected process
+
+        if self.preemptive:
+            process_to_run, time_for_process, _ = scheduler.run_preemptive(
+                self.current_time, self.current_process, self.remaining_time
+            )
+        elif self.scheduler_type in ("Round Robin", "MLFQ"):
+            process_to_run, time_for_process, self.time_quantum_left, _ = scheduler.run(
+                self.current_time, self.current_process, self.remaining_time, self.time_quantum_left
+            )
+        elif not self.current_process:  # Non-preemptive: only select new if CPU is idle
+            if self.scheduler_type in ["SJF", "Priority"]:
+                process_to_run, time_for_process = scheduler.run_non_preemptive(self.current_time)
+            else:
+                process_to_run, time_for_process = scheduler.run(self.current_time)
+        else:
+            # Non-preemptive: current process continues until done
+            process_to_run = self.current_process
+            time_for_process = self.remaining_time
+
+        current_pid = process_to_run.pid if process_to_run else None
+
+        # If the running process changed (or started/stopped)
+        if current_pid != self._last_pid:
+            # If a process was running previously, close its history segment
+            self._close_segment()
+
+            if process_to_run:
+                self.current_process = process_to_run
+                self.remaining_time = time_for_process
+                if self.switch_cost:
+                    # The running segment opens once the switch is done
+                    self.switch_left = self.switch_cost
+                    self.process_execution_history.append(
+                        (process_to_run.name, self.current_time, self.current_time + self.switch_cost, "switch",
+                         process_to_run.pid)
+                    )
+                else:
+                    self._open_running_segment()
+            else:
+                # No process is running now (idle or finished)
+                self.current_process = None
+                self.remaining_time = 0
+
+            self._last_pid = current_pid
+        elif process_to_run and self._open_segment is None:
+            # The context switch to this process just ended
+            self.remaining_time = time_for_process
+            self._open_running_segment()
+
+    def _open_running_segment(self):
+        """Start the history segment of current_process at current_time."""
+        # Estimate end time for now, will be updated if preempted or finished
+        self._open_segment = len(self.process_execution_history)
+        proc = self.current_process
+        self.process_execution_history.append(
+            (proc.name, self.current_time, self.current_time + self.remaining_time, "running", proc.pid)
+        )
+
+    def _time_to_next_event(self):
+        """Time units the current process runs before the next scheduling decision."""
+        if self.switch_left:
+            return self.switch_left
+        duration = self.remaining_time
+        if self.scheduler_type in ("Round Robin", "MLFQ"):
+            duration = min(duration, self.time_quantum_left)
+        if self.preemptive or self.scheduler_type == "MLFQ":
+            # A new arrival may preempt the current process
+            next_arrival = self.scheduler.next_arrival_time()
+            if next_arrival is not None:
+                duration = min(duration, next_arrival - self.current_time)
+        return max(1, duration)
+
+    def _advance(self, duration):
+        """Execute the current process for the given number of time units."""
+        self.current_time += duration
+        if self.switch_left:
+            # Events stop at the end of every switch, so it never spans into running time
+            self.switch_left -= duration
+            return
+        self.remaining_time -= duration
+        if self.scheduler_type in ("Round Robin", "MLFQ"):
+            self.time_quantum_left -= duration
+
+        if self.remaining_time <= 0:
+            self._close_segment()
+            completed = self.current_process
+            completed.remaining_time = 0
+            self.completed_processes.append(completed)
+            self.last_completed = completed
+
+            self.current_process = None
+            self.remaining_time = 0
+            self._last_pid = None
+
+    def _close_segment(self):
+        """Set the end time of the open running segment to current_time."""
+        if self._open_segment is None:
+            return
+        name, start, _, status, pid = self.process_execution_history[self._open_segment]
+        self.process_execution_history[self._open_segment] = (name, start, self.current_time, status, pid)
+        self._open_segment = None
+
+
+def simulate(process_list, scheduler_type="FCFS", event_driven=True, instant=True, instrumentation=None,
+             cores=1, local_queues=False, migration_cost=0, balance_interval=None, affinity=None,
+             scheduler_options=None, switch_cost=0):
+    """
+    Run a complete scheduling simulation without any GUI.
+
+    Args:
+        process_list: List of Process records (legacy tuples are converted)
+        scheduler_type: One of "FCFS", "SJF", "Priority", "Round Robin" or "MLFQ"
+        event_driven: Advance between scheduling events (default) instead of per time unit
+        instant: Use the closed-form solvers for FCFS and non-preemptive SJF
+        instrumentation: Optional Instrumentation to attach to the run; the
+            closed-form solvers make no per-step decisions, so they are not used
+        cores: Number of CPU cores; with more than one the history entries
+            get the core as a sixth field
+        local_queues: Give every core its own run queue with work stealing
+            instead of sharing one global ready queue
+        migration_cost: Cache warmup time after a process moves to another core
+        balance_interval: Local queues only, time between periodic rebalances
+        affinity: Local queues only, optional dict of process name -> allowed cores
+        scheduler_options: Optional keyword arguments for the scheduler class
+            (MLFQ: quanta, boost_interval)
+        switch_cost: Time units of every context switch, recorded as "switch"
+            segments; the closed-form solvers model no overhead, so they are not used
+
+    Returns:
+        Tuple of (process_execution_history, completed_processes)
+    """
+    if cores > 1:
+        # Imported here because the multi-core engines build on this module
+        from Schedulers.multicore import LocalQueueSimulation, MultiCoreSimulation
+        if local_queues:
+            simulation = LocalQueueSimulation(process_list, scheduler_type, cores, migration_cost,
+                                              balance_interval, affinity, switch_cost=switch_cost)
+        else:
+            simulation = MultiCoreSimulation(process_list, scheduler_type, cores, migration_cost, switch_cost)
+        if instrumentation is not None:
+            instrumentation.attach(simulation)
+        return simulation.run(event_driven)
+
+    if instant and instrumentation is None and not switch_cost:
+        processes = [as_process(proc, scheduler_type) for proc in process_list]
+        if scheduler_type == "FCFS":
+            return FCFSScheduler.solve(processes)
+        if scheduler_type == "SJF" and not is_preemptive(processes, scheduler_type):
+            return SJFScheduler.solve(processes)
+        process_list = processes
+    simulation = SchedulerSimulation(process_list, scheduler_type, scheduler_options, switch_cost)
+    if instrumentation is not None:
+        instrumentation.attach(simulation)
+    return simulation.run(event_driven)
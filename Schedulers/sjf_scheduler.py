@@ -1,31 +1,34 @@
+import heapq
+
+from Schedulers.arrival_queue import ArrivalQueue
+from Schedulers.ready_heap import ReadyHeap
+
+
 class SJFScheduler:
     def __init__(self, processes):
         """
         Initialize the SJF Scheduler
         
         Args:
-            processes: List of process tuples (name, burst_time, arrival_time, is_preemptive)
+            processes: List of Process records
         """
-        self.waiting_queue = list(processes)
-        self.ready_queue = []
-        # Sort initially by arrival time
-        self.waiting_queue.sort(key=lambda x: x[2])
+        # Waiting queue sorted by arrival time, consumed through a cursor
+        self.waiting_queue = ArrivalQueue(processes)
+        # Ready queue ordered by burst (remaining) time, then arrival time
+        self.ready_queue = ReadyHeap(key=lambda x: (x.remaining_time, x.arrival_time))
         
     def update_queues(self, current_time):
         """Move arrived processes from waiting to ready queue."""
-        newly_arrived = []
-        still_waiting = []
-        
-        for proc in self.waiting_queue:
-            if proc[2] <= current_time:  # Check arrival time
-                newly_arrived.append(proc)
-                self.ready_queue.append(proc)
-            else:
-                still_waiting.append(proc)
-                
-        self.waiting_queue = still_waiting
+        newly_arrived = self.waiting_queue.pop_arrived(current_time)
+        for proc in newly_arrived:
+            self.ready_queue.push(proc)
+            
         return newly_arrived
     
+    def add_process(self, process):
+        """Inject a new arrival into a running schedule in O(log n); it is queued on arrival."""
+        self.waiting_queue.insert(process)
+
     def run_non_preemptive(self, current_time):
         """
         Non-preemptive SJF: Decide which process to run based on arrival and burst time.
@@ -33,13 +36,11 @@ class SJFScheduler:
         Returns:
             Tuple of (selected_process, remaining_time) or (None, 0) if no process is selected
         """
-        if not self.ready_queue:
+        selected_process = self.ready_queue.pop()
+        if selected_process is None:
             return None, 0
             
-        # Sort ready queue by burst time for SJF
-        self.ready_queue.sort(key=lambda x: x[1])
-        selected_process = self.ready_queue.pop(0)
-        remaining_time = selected_process[1]  # Burst time
+        remaining_time = selected_process.remaining_time
         
         return selected_process, remaining_time
     
@@ -50,7 +51,7 @@ class SJFScheduler:
 
         Args:
             current_time: Current simulation time.
-            current_process: Currently running process tuple (if any).
+            current_process: Currently running Process record (if any).
             remaining_time: Remaining burst time of current_process.
 
         Returns:
@@ -60,98 +61,75 @@ class SJFScheduler:
         # Ensure the ready queue is up-to-date with newly arrived processes
         self.update_queues(current_time)
 
-        potential_candidates = []
-
-        # Add the currently running process (if any) to candidates
-        if current_process and remaining_time > 0:
-            potential_candidates.append({
-                'process': current_process, 
-                'time_left': remaining_time,
-                'arrival': current_process[2]
-            })
-
-        # Add processes from the ready queue to candidates
-        for proc in self.ready_queue:
-            # Safety check: ensure the process tuple has enough elements
-            if len(proc) >= 3:
-                potential_candidates.append({
-                    'process': proc,
-                    'time_left': proc[1],  # Burst time
-                    'arrival': proc[2]    # Arrival time
-                })
-
-        # If no candidates (neither running nor ready), CPU is idle
-        if not potential_candidates:
-            return None, 0, False
-
-        # Sort candidates: 1st by shortest time_left, 2nd by earliest arrival time
-        potential_candidates.sort(key=lambda x: (x['time_left'], x['arrival']))
-
-        # Select the best candidate
-        shortest_candidate = potential_candidates[0]
-        selected_process = shortest_candidate['process']
-        selected_process_time_left = shortest_candidate['time_left']
-
-        was_preempted = False
-
-        # Determine if preemption occurred
-        if current_process:
-            if selected_process != current_process:
-                # Preemption occurred
-                was_preempted = True
-                
-                # Add the preempted process back to the ready queue
-                # Update its tuple with its remaining time before adding
-                if remaining_time > 0:  # Only add back if there's time left
-                    preempted_process_updated = list(current_process)
-                    preempted_process_updated[1] = remaining_time # Store remaining time
-                    self.ready_queue.append(tuple(preempted_process_updated))
-
-                # Remove the selected process from ready queue 
-                try:
-                    if selected_process in self.ready_queue:
-                        self.ready_queue.remove(selected_process)
-                except ValueError:
-                    # Process might have been modified, search by name
-                    process_name = selected_process[0]
-                    for i, proc in enumerate(self.ready_queue):
-                        if proc[0] == process_name:
-                            self.ready_queue.pop(i)
-                            break
-
-        else: # No current process was running, starting a new one
-            if selected_process:
-                # Remove the selected process from ready queue as it's now running
-                try:
-                    if selected_process in self.ready_queue:
-                        self.ready_queue.remove(selected_process)
-                except ValueError:
-                    # Process might have been modified, search by name
-                    process_name = selected_process[0]
-                    for i, proc in enumerate(self.ready_queue):
-                        if proc[0] == process_name:
-                            self.ready_queue.pop(i)
-                            break
-        
-        # Return the selected process, its remaining time, and preemption status
-        return selected_process, selected_process_time_left, was_preempted
+        # No current process was running (or it just finished), start the shortest one
+        if not current_process or remaining_time <= 0:
+            selected_process, selected_process_time_left = self.run_non_preemptive(current_time)
+            return selected_process, selected_process_time_left, False
+
+        # The running process keeps the CPU on ties, so only a strictly
+        # shorter (time_left, arrival) at the top of the heap preempts it
+        best_key = self.ready_queue.peek_key()
+        if best_key is None or best_key >= (remaining_time, current_process.arrival_time):
+            return current_process, remaining_time, False
+
+        # Preemption occurred: put the current process back with its remaining time
+        current_process.remaining_time = remaining_time
+        self.ready_queue.push(current_process)
+
+        selected_process = self.ready_queue.pop()
+        return selected_process, selected_process.remaining_time, True
         
-    def remove_completed_process(self, process_tuple):
+    @staticmethod
+    def solve(processes):
+        """
+        Instant non-preemptive SJF: one sweep over arrivals with a heap, without ticks.
+
+        Args:
+            processes: List of Process records
+
+        Returns:
+            Tuple of (process_execution_history, completed_processes), the same
+            as SchedulerSimulation.run() produces for non-preemptive SJF
+        """
+        ordered = sorted((proc.copy() for proc in processes), key=lambda x: x.arrival_time)
+        count = len(ordered)
+        ready = []  # (burst, arrival, arrival order) like the simulation's ReadyHeap
+        history = []
+        completed = []
+        current_time = 0
+        i = 0
+
+        while i < count or ready:
+            while i < count and ordered[i].arrival_time <= current_time:
+                proc = ordered[i]
+                heapq.heappush(ready, (proc.burst_time, proc.arrival_time, i))
+                i += 1
+            if not ready:
+                # Idle CPU: jump to the next arrival
+                current_time = ordered[i].arrival_time
+                continue
+
+            proc = ordered[heapq.heappop(ready)[2]]
+            # The simulation always runs a dispatched process for at least one time unit
+            end = current_time + max(1, proc.burst_time)
+            history.append((proc.name, current_time, end, "running", proc.pid))
+            proc.remaining_time = 0
+            completed.append(proc)
+            current_time = end
+
+        return history, completed
+
+    def remove_completed_process(self, process):
         """Remove a completed process from internal queues."""
-        # Attempt to remove from ready queue (might be there if preempted just before finishing)
-        try:
-            # Need to find by name as the tuple might have different remaining time
-            proc_to_remove = next(p for p in self.ready_queue if p[0] == process_tuple[0])
-            self.ready_queue.remove(proc_to_remove)
-        except (StopIteration, ValueError):
-            pass # Not found in ready queue, which is normal if it ran to completion
+        # Lazily drop it from the ready queue (might be there if preempted just before finishing)
+        self.ready_queue.remove(process)
 
         # Also check waiting queue just in case (shouldn't normally happen)
-        try:
-            proc_to_remove = next(p for p in self.waiting_queue if p[0] == process_tuple[0])
-            self.waiting_queue.remove(proc_to_remove)
-        except (StopIteration, ValueError):
-            pass
+        self.waiting_queue.remove(process)
+
+    def next_arrival_time(self):
+        """Arrival time of the next process still in the waiting queue, or None."""
+        return self.waiting_queue.next_arrival_time()
 
     def is_done(self):
         """Check if scheduler has completed all processes."""
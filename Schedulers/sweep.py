@@ -0,0 +1,95 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from Schedulers.metrics import DEFAULT_PERCENTILES, ScheduleMetrics
+from Schedulers.process import configure_processes
+from Schedulers.simulation import simulate
+
+ALGORITHMS = ("FCFS", "SJF", "Priority", "Round Robin", "MLFQ")
+MODES = ("Non-Preemptive", "Preemptive")
+
+# Set in each worker by _init_worker so workloads are pickled once per worker, not per task
+_workloads = {}
+_percentiles = DEFAULT_PERCENTILES
+
+
+def build_grid(workloads, algorithms=ALGORITHMS, modes=MODES, quanta=(2,)):
+    """
+    Expand a parameter grid into (algorithm, mode, quantum, workload) configs.
+
+    Modes only apply to SJF and Priority and quanta only to Round Robin,
+    the other fields are None so no configuration is simulated twice.
+
+    Args:
+        workloads: Iterable of workload names
+        algorithms: Scheduler types to compare
+        modes: "Non-Preemptive" and/or "Preemptive"
+        quanta: Round Robin time quanta to compare
+    """
+    grid = []
+    for workload in workloads:
+        for algorithm in algorithms:
+            if algorithm in ["SJF", "Priority"]:
+                grid.extend((algorithm, mode, None, workload) for mode in modes)
+            elif algorithm == "Round Robin":
+                grid.extend((algorithm, None, quantum, workload) for quantum in quanta)
+            else:
+                grid.append((algorithm, None, None, workload))
+    return grid
+
+
+def _init_worker(workloads, percentiles):
+    global _workloads, _percentiles
+    _workloads = workloads
+    _percentiles = percentiles
+
+
+def _run_config(config):
+    """Simulate one configuration and return its row of the results table."""
+    algorithm, mode, quantum, workload = config
+    processes = configure_processes(_workloads[workload], algorithm, mode, quantum)
+
+    start = time.perf_counter()
+    history, completed = simulate(processes, algorithm)
+    elapsed = time.perf_counter() - start
+
+    row = {
+        'workload': workload,
+        'algorithm': algorithm,
+        'mode': mode,
+        'quantum': quantum,
+        'makespan': max((entry[2] for entry in history), default=0),
+        'segments': len(history),
+        'wall_time': elapsed,
+    }
+    row.update(ScheduleMetrics(completed, history).summary(_percentiles))
+    return row
+
+
+def run_sweep(workloads, grid=None, max_workers=None, percentiles=DEFAULT_PERCENTILES):
+    """
+    Run every configuration of a sweep across a pool of worker processes.
+
+    Call this from under `if __name__ == "__main__":` on platforms that
+    spawn workers (Windows, macOS).
+
+    Args:
+        workloads: Dict of workload name -> list of Process records
+        grid: List of (algorithm, mode, quantum, workload) configs, all algorithms by default
+        max_workers: Pool size (None = one per CPU); 1 runs everything in-process
+        percentiles: Percentiles reported for turnaround, waiting and response time
+
+    Returns:
+        List of result rows (dicts) in grid order: configuration, makespan,
+        segment count, wall time, averages and percentiles
+    """
+    if grid is None:
+        grid = build_grid(workloads)
+
+    if max_workers == 1:
+        _init_worker(workloads, percentiles)
+        return [_run_config(config) for config in grid]
+
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                             initargs=(workloads, percentiles)) as executor:
+        return list(executor.map(_run_config, grid))
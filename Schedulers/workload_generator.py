@@ -0,0 +1,168 @@
+import gc
+
+import numpy as np
+
+from Schedulers.process import Process
+
+ARRIVALS = ("poisson", "bursty")
+BURSTS = ("exponential", "pareto", "bimodal")
+PRIORITIES = ("uniform", "skewed")
+
+
+def _arrival_times(rng, count, arrivals, arrival_rate, batch_size):
+    """Integer arrival times starting at 0, non-decreasing."""
+    if arrivals == "poisson":
+        times = np.cumsum(rng.exponential(1.0 / arrival_rate, count))
+    else:
+        # Batches arrive as a Poisson process; each batch lands at a single instant
+        batches = int(count / batch_size) + 1
+        sizes = rng.geometric(1.0 / batch_size, batches)
+        while sizes.sum() < count:
+            sizes = np.concatenate((sizes, rng.geometric(1.0 / batch_size, batches)))
+        starts = np.cumsum(rng.exponential(batch_size / arrival_rate, len(sizes)))
+        times = np.repeat(starts, sizes)[:count]
+    return np.floor(times - times[0]).astype(np.int64) if count else np.zeros(0, dtype=np.int64)
+
+
+def _burst_times(rng, count, bursts, mean_burst, pareto_shape, short_burst, long_burst,
+                 long_fraction, max_burst):
+    """Integer burst times of at least 1."""
+    if bursts == "exponential":
+        values = rng.exponential(mean_burst, count)
+    elif bursts == "pareto":
+        # Classic Pareto with its minimum chosen so the mean is mean_burst
+        minimum = mean_burst * (pareto_shape - 1) / pareto_shape
+        values = (rng.pareto(pareto_shape, count) + 1) * minimum
+    else:
+        means = np.where(rng.random(count) < long_fraction, long_burst, short_burst)
+        values = rng.exponential(1.0, count) * means
+    if max_burst is not None:
+        values = np.minimum(values, max_burst)
+    return np.maximum(np.ceil(values), 1).astype(np.int64)
+
+
+def _priorities(rng, count, priorities, priority_levels):
+    """Priorities in 1..priority_levels, lower number means higher priority."""
+    if priorities == "uniform":
+        return rng.integers(1, priority_levels + 1, count)
+    if priorities == "skewed":
+        # Most processes get the lowest priority, each level up is half as common
+        urgency = np.minimum(rng.geometric(0.5, count), priority_levels)
+        return (priority_levels + 1 - urgency).astype(np.int64)
+    weights = np.asarray(priorities, dtype=float)
+    return rng.choice(np.arange(1, len(weights) + 1), count, p=weights / weights.sum())
+
+
+def generate_columns(count, seed=None, arrivals="poisson", arrival_rate=0.5, batch_size=8,
+                     bursts="exponential", mean_burst=5, pareto_shape=1.5, short_burst=2,
+                     long_burst=20, long_fraction=0.2, max_burst=None,
+                     priorities="uniform", priority_levels=5, quanta=2):
+    """
+    Draw a synthetic workload as NumPy columns.
+
+    Every column is produced by one vectorized draw, so millions of processes
+    take a fraction of a second. The same seed always gives the same workload.
+
+    Args:
+        count: Number of processes
+        seed: Seed for numpy.random.default_rng, None for a fresh workload each call
+        arrivals: "poisson" (exponential gaps) or "bursty" (Poisson batches of
+            geometric size that arrive at the same instant)
+        arrival_rate: Mean arrivals per time unit
+        batch_size: Mean batch size for bursty arrivals
+        bursts: "exponential", "pareto" (heavy tail) or "bimodal" (a mix of
+            short and long exponential bursts)
+        mean_burst: Mean burst time for exponential and Pareto bursts
+        pareto_shape: Pareto tail index, must be above 1 (smaller = heavier tail)
+        short_burst: Mean of the short mode of bimodal bursts
+        long_burst: Mean of the long mode of bimodal bursts
+        long_fraction: Share of long bursts in bimodal bursts
+        max_burst: Optional cap on burst times
+        priorities: "uniform", "skewed" (mostly low priority, few urgent
+            processes) or a sequence of weights, one per priority level
+        priority_levels: Number of priority levels for "uniform" and "skewed"
+        quanta: Round Robin time quantum, or a sequence of quanta to pick from
+
+    Returns:
+        Dict of int64 arrays: arrival_time (sorted), burst_time, priority, time_quantum
+
+    Raises:
+        ValueError: If a distribution name or parameter is invalid
+    """
+    if count < 0:
+        raise ValueError("count cannot be negative")
+    if arrivals not in ARRIVALS:
+        raise ValueError(f"arrivals must be one of {', '.join(ARRIVALS)}")
+    if bursts not in BURSTS:
+        raise ValueError(f"bursts must be one of {', '.join(BURSTS)}")
+    if isinstance(priorities, str) and priorities not in PRIORITIES:
+        raise ValueError(f"priorities must be one of {', '.join(PRIORITIES)} or a list of weights")
+    if arrival_rate <= 0 or batch_size < 1:
+        raise ValueError("arrival_rate must be positive and batch_size at least 1")
+    if bursts == "pareto" and pareto_shape <= 1:
+        raise ValueError("pareto_shape must be greater than 1")
+    if priority_levels < 1:
+        raise ValueError("priority_levels must be at least 1")
+
+    rng = np.random.default_rng(seed)
+    arrival = _arrival_times(rng, count, arrivals, arrival_rate, batch_size)
+    burst = _burst_times(rng, count, bursts, mean_burst, pareto_shape, short_burst, long_burst,
+                         long_fraction, max_burst)
+    priority = _priorities(rng, count, priorities, priority_levels)
+
+    if np.ndim(quanta) == 0:
+        quantum = np.full(count, quanta, dtype=np.int64)
+    else:
+        quantum = rng.choice(np.asarray(quanta, dtype=np.int64), count)
+    if count and quantum.min() <= 0:
+        raise ValueError("time quanta must be positive")
+
+    return {
+        'arrival_time': arrival,
+        'burst_time': burst,
+        'priority': priority.astype(np.int64, copy=False),
+        'time_quantum': quantum,
+    }
+
+
+def generate_workload(count, scheduler_type="FCFS", preemptive=False, prefix="P", **options):
+    """
+    Generate a synthetic workload as Process records, like get_formatted_processes.
+
+    Processes are named prefix1, prefix2, ... in arrival order. Priority and
+    time quantum are only filled in for the tabs that use them, and the
+    preemptive flag only for SJF and Priority.
+
+    Args:
+        count: Number of processes
+        scheduler_type: "FCFS", "SJF", "Priority" or "Round Robin"
+        preemptive: SJF and Priority only, whether the run is preemptive
+        prefix: Process name prefix
+        **options: Distribution settings passed to generate_columns (seed, arrivals, bursts, ...)
+
+    Returns:
+        List of Process records sorted by arrival time
+    """
+    columns = generate_columns(count, **options)
+    names = map(prefix.__add__, map(str, range(1, count + 1)))
+    bursts = columns['burst_time'].tolist()
+    arrivals = columns['arrival_time'].tolist()
+
+    if scheduler_type == "Priority":
+        fields = (columns['priority'].tolist(), [None] * count, [preemptive] * count)
+    elif scheduler_type == "SJF":
+        fields = ([0] * count, [None] * count, [preemptive] * count)
+    elif scheduler_type == "Round Robin":
+        fields = ([0] * count, columns['time_quantum'].tolist())
+    else:
+        fields = ()
+
+    # Records hold no reference cycles, so pause the cyclic GC instead of letting
+    # millions of allocations trigger repeated full collections
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return list(map(Process, names, bursts, arrivals, *fields))
+    finally:
+        if gc_enabled:
+            gc.enable()
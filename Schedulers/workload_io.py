@@ -0,0 +1,78 @@
+import csv
+import json
+import os
+
+from Schedulers.process import Process
+
+FIELDS = ('name', 'burst_time', 'arrival_time', 'priority', 'time_quantum')
+
+
+def _to_process(row, line):
+    """Build a Process from a dict row; only name and burst_time are required."""
+    if not isinstance(row, dict):
+        raise ValueError(f"Process {line}: row is not an object")
+    try:
+        name = str(row['name'])
+        burst_time = int(row['burst_time'])
+        arrival_time = int(row.get('arrival_time') or 0)
+        priority = int(row.get('priority') or 0)
+        quantum = row.get('time_quantum')
+        time_quantum = int(quantum) if quantum not in (None, '') else None
+    except KeyError as e:
+        raise ValueError(f"Process {line}: missing field {e.args[0]!r}") from None
+    except (TypeError, ValueError):
+        raise ValueError(f"Process {line}: numeric fields must be integers") from None
+    if burst_time <= 0:
+        raise ValueError(f"Process {line}: burst_time must be positive")
+    if arrival_time < 0:
+        raise ValueError(f"Process {line}: arrival_time cannot be negative")
+    return Process(name, burst_time, arrival_time, priority, time_quantum)
+
+
+def load_workload(path):
+    """
+    Read a workload file into a list of Process records.
+
+    CSV files need a header row with name and burst_time columns and may
+    add arrival_time, priority and time_quantum. JSON files hold a list of
+    objects with the same keys.
+
+    Raises:
+        ValueError: If a process is missing a field, has an invalid value or
+            repeats the name of an earlier process
+    """
+    if os.path.splitext(path)[1].lower() == '.json':
+        with open(path) as f:
+            rows = json.load(f)
+        if not isinstance(rows, list):
+            raise ValueError("JSON workload must be a list of processes")
+    else:
+        with open(path, newline='') as f:
+            rows = list(csv.DictReader(f, skipinitialspace=True))
+
+    processes = []
+    names = set()
+    for i, row in enumerate(rows, start=1):
+        proc = _to_process(row, i)
+        if proc.name in names:
+            raise ValueError(f"Process {i}: duplicate name {proc.name!r}")
+        names.add(proc.name)
+        processes.append(proc)
+    return processes
+
+
+def save_workload(processes, path):
+    """Write Process records to a CSV or JSON workload file (chosen by extension)."""
+    rows = [
+        {field: getattr(proc, field) for field in FIELDS}
+        for proc in processes
+    ]
+    if os.path.splitext(path)[1].lower() == '.json':
+        with open(path, 'w') as f:
+            json.dump(rows, f)
+        return
+
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
@@ -0,0 +1,48 @@
+import json
+
+import pytest
+
+from Schedulers.process import Process
+from Schedulers.workload_io import load_workload, save_workload
+
+
+def write(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text)
+    return str(path)
+
+
+def test_round_trip(tmp_path):
+    processes = [Process("A", 5, 0, priority=2), Process("B", 3, 1, time_quantum=4)]
+    for name in ("w.csv", "w.json"):
+        path = str(tmp_path / name)
+        save_workload(processes, path)
+        loaded = load_workload(path)
+        assert [(p.name, p.burst_time, p.arrival_time, p.priority, p.time_quantum) for p in loaded] == \
+            [("A", 5, 0, 2, None), ("B", 3, 1, 0, 4)]
+
+
+def test_duplicate_name_csv(tmp_path):
+    path = write(tmp_path, "w.csv", "name,burst_time,arrival_time\nA,5,0\nB,3,1\nC,1,2\nA,2,3\n")
+    with pytest.raises(ValueError, match="Process 4: duplicate name 'A'"):
+        load_workload(path)
+
+
+def test_duplicate_name_json(tmp_path):
+    rows = [{"name": "A", "burst_time": 5}, {"name": "A", "burst_time": 2}]
+    path = write(tmp_path, "w.json", json.dumps(rows))
+    with pytest.raises(ValueError, match="Process 2: duplicate name 'A'"):
+        load_workload(path)
+
+
+@pytest.mark.parametrize("row", [[1, 2], 5, "A"])
+def test_row_not_an_object(tmp_path, row):
+    path = write(tmp_path, "w.json", json.dumps([{"name": "A", "burst_time": 5}, row]))
+    with pytest.raises(ValueError, match="Process 2: row is not an object"):
+        load_workload(path)
+
+
+def test_missing_field(tmp_path):
+    path = write(tmp_path, "w.csv", "name,arrival_time\nA,0\n")
+    with pytest.raises(ValueError, match="Process 1: missing field 'burst_time'"):
+        load_workload(path)